@@ -17,19 +17,28 @@ from __future__ import annotations
 
 __docformat__ = 'reStructuredText'
 
+import concurrent.futures
+import contextlib
 import locale
 import pprint
 import os
+import pickle
 import sys
+import time
+import tracemalloc
 import warnings
 from typing import TYPE_CHECKING
 
-from docutils import (__version__, __version_details__, SettingsSpec,
-                      io, utils, readers, parsers, writers)
+from docutils import (__version__, __version_details__, ApplicationError,
+                      SettingsSpec, io, utils, readers, parsers, writers)
 from docutils.frontend import OptionParser
 from docutils.readers import doctree
+from docutils.utils import doctree_cache
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from docutils import nodes
     from docutils.nodes import StrPath
 
 
@@ -91,6 +100,28 @@ class Publisher:
         """An object containing Docutils settings as instance attributes.
         Set by `self.process_command_line()` or `self.get_settings()`."""
 
+        self.timings = {}
+        """Time and memory used by the processing phases.
+
+        Filled in by `self.publish()` if the "timing_report" setting
+        is True or `self.timing_hook` is set.  Maps the phase names
+        ("read", "parse", "transforms", "write") to dictionaries with
+        wall time ("wall") and CPU time ("cpu") in seconds and the peak
+        size of traced memory blocks in bytes ("memory_peak",
+        cf. `tracemalloc.get_traced_memory()`).
+
+        Provisional.
+        """
+
+        self.timing_hook = None
+        """Callable, called with the phase name and its `self.timings`
+        record after every processing phase.  Enables timing.
+
+        Provisional.
+        """
+
+        self._timing = False
+        self._stop_tracemalloc = False
         self._stderr = io.ErrorOutput()
 
     def set_reader(self, reader, parser=None, parser_name=None) -> None:
@@ -247,7 +278,8 @@ class Publisher:
         """
         Process command line options and arguments (if `self.settings` not
         already set), run `self.reader` and then `self.writer`.  Return
-        `self.writer`'s output.
+        `self.writer`'s output (None if `self.writer` wrote the output
+        in parts, see the "stream_output" setting).
         """
         exit_ = None
         try:
@@ -257,11 +289,37 @@ class Publisher:
                     **(settings_overrides or {}))
             self.set_io()
             self.prompt()
-            self.document = self.reader.read(self.source, self.parser,
-                                             self.settings)
-            self.apply_transforms()
-            output = self.writer.write(self.document, self.destination)
-            self.writer.assemble_parts()
+            self.start_timing()
+            try:
+                if (getattr(self.settings, 'doctree_cache', None)
+                    and not isinstance(self.reader, readers.ReReader)):
+                    self.document = self.read_cached_doctree()
+                    self.document.transformer.populate_from_components(
+                        (self.writer, self.destination))
+                    with self.timed('transforms'):
+                        self.document.transformer.apply_transforms()
+                else:
+                    source = self.source
+                    if (self._timing
+                        and not isinstance(self.reader, readers.ReReader)):
+                        # separate reading/decoding from parsing
+                        with self.timed('read'):
+                            source = io.StringInput(self.source.read(),
+                                                    self.source.source_path)
+                    with self.timed('parse'):
+                        self.document = self.reader.read(
+                                            source, self.parser, self.settings)
+                    with self.timed('transforms'):
+                        self.apply_transforms()
+                with self.timed('write'):
+                    output = self.writer.write(self.document, self.destination)
+                    if not self.writer.streamed:
+                        self.writer.assemble_parts()
+            finally:
+                self.stop_timing()
+            if getattr(self.settings, 'profile_transforms', None):
+                print(self.document.transformer.profile_report(),
+                      file=self._stderr)
         except SystemExit as error:
             exit_ = True
             exit_status = error.code
@@ -283,6 +341,135 @@ class Publisher:
             sys.exit(exit_status)
         return output
 
+    def read_cached_doctree(self) -> nodes.document:
+        """
+        Return the document tree from the "doctree_cache" or the source.
+
+        Look up a document tree for the source text and the
+        current settings in the cache.  If there is none (or a
+        dependency changed), parse the source, apply the transforms of
+        source, reader, and parser, and store the result in the cache.
+
+        The document tree is refurbished by a `readers.doctree.Reader`
+        (new settings, reporter, and transformer) and system messages
+        reported while parsing are repeated.
+        The writer's transforms are not applied.
+
+        Provisional.
+        """
+        cache = doctree_cache.DoctreeCache(
+                    self.settings.doctree_cache,
+                    self.settings.doctree_cache_size * 2**20)
+        with self.timed('read'):
+            text = self.source.read()
+        with self.timed('parse'):
+            return self._read_cached_doctree(cache, text)
+
+    def _read_cached_doctree(self, cache, text) -> nodes.document:
+        key = cache.key(text, self.settings,
+                        ignore=doctree_cache.setting_names(self.writer))
+        entry = cache.load(key)
+        if entry is None:
+            # parse and transform (with private dependency list and
+            # warning stream to store them in the cache entry)
+            dependencies = self.settings.record_dependencies
+            warning_stream = self.settings.warning_stream
+            messages = _MessageCollector()
+            self.settings.record_dependencies = utils.DependencyList()
+            self.settings.warning_stream = messages
+            try:
+                source = io.StringInput(text, self.source.source_path)
+                document = self.reader.read(source, self.parser,
+                                            self.settings)
+                document.transformer.populate_from_components(
+                    (source, self.reader, self.reader.parser))
+                document.transformer.apply_transforms()
+                entry = {'document': document,
+                         'dependencies':
+                             self.settings.record_dependencies.list,
+                         'messages': messages.messages,
+                         'max_level': document.reporter.max_level}
+            finally:
+                self.settings.record_dependencies = dependencies
+                self.settings.warning_stream = warning_stream
+            cache.store(key, **entry)
+        self.settings.record_dependencies.add(*entry['dependencies'])
+        document = doctree.Reader().read(io.DocTreeInput(entry['document']),
+                                         None, self.settings)
+        reporter = document.reporter
+        for message in entry['messages']:
+            reporter.stream.write(message + '\n')
+        reporter.max_level = entry['max_level']
+        return document
+
+    def start_timing(self) -> None:
+        """Start recording `self.timings` if enabled.
+
+        Timing is enabled by the "timing_report" setting or
+        `self.timing_hook`.  Start `tracemalloc` if required.
+
+        Provisional.
+        """
+        self.timings = {}
+        self._timing = bool(self.timing_hook
+                            or getattr(self.settings, 'timing_report', None))
+        if self._timing and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._stop_tracemalloc = True
+
+    def stop_timing(self) -> None:
+        """Stop recording `self.timings`.
+
+        Write a summary to stderr if the "timing_report" setting is True.
+
+        Provisional.
+        """
+        if not self._timing:
+            return
+        self._timing = False
+        if self._stop_tracemalloc:
+            tracemalloc.stop()
+            self._stop_tracemalloc = False
+        if getattr(self.settings, 'timing_report', None):
+            print(self.timing_report(), file=self._stderr)
+
+    @contextlib.contextmanager
+    def timed(self, phase: str) -> Iterator[None]:
+        """Context manager recording the time and memory used by `phase`.
+
+        Does nothing unless timing is enabled (cf. `self.start_timing()`).
+
+        Provisional.
+        """
+        if not self._timing:
+            yield
+            return
+        tracemalloc.reset_peak()
+        wall, cpu = time.perf_counter(), time.process_time()
+        yield
+        record = {'wall': time.perf_counter() - wall,
+                  'cpu': time.process_time() - cpu,
+                  'memory_peak': tracemalloc.get_traced_memory()[1]}
+        self.timings[phase] = record
+        if self.timing_hook is not None:
+            self.timing_hook(phase, record)
+
+    def timing_report(self) -> str:
+        """Return a summary of `self.timings` as table.
+
+        Provisional.
+        """
+        lines = ['\n::: Timing report:',
+                 'phase         wall [s]     CPU [s]  memory peak [KiB]']
+        for phase, record in self.timings.items():
+            lines.append(f'{phase:<10} {record["wall"]:11.4f} '
+                         f'{record["cpu"]:11.4f} '
+                         f'{record["memory_peak"]/1024:18.0f}')
+        lines.append(f'{"total":<10} '
+                     f'{sum(r["wall"] for r in self.timings.values()):11.4f} '
+                     f'{sum(r["cpu"] for r in self.timings.values()):11.4f}')
+        return '\n'.join(lines)
+
     def debugging_dumps(self) -> None:
         if not self.document:
             return
@@ -414,6 +601,8 @@ def publish_cmdline(reader=None, reader_name=None,
     output file paths taken automatically from the command line).
     Also return the output as `str` or `bytes` (for binary output document
     formats).
+    With the "stream_output" setting, the output is written in parts and
+    None is returned.
 
     Parameters: see `publish_programmatically()` for the remainder.
 
@@ -447,6 +636,8 @@ def publish_file(source=None, source_path=None,
     Set up & run a `Publisher` for programmatic use with file-like I/O.
     Also return the output as `str` or `bytes` (for binary output document
     formats).
+    With the "stream_output" setting, the output is written in parts and
+    None is returned.
 
     Parameters: see `publish_programmatically()`.
     """
@@ -616,6 +807,200 @@ def publish_from_doctree(document, destination_path=None,
     return publisher.publish(enable_exit_status=enable_exit_status)
 
 
+def publish_multi(source, writers, source_path=None,
+                  source_class=io.StringInput, destination_paths=None,
+                  reader=None, parser=None,
+                  settings_spec=None, settings_overrides=None,
+                  config_section=None, enable_exit_status=False):
+    """
+    Render the `source` with several writers from a single parse.
+
+    The source is read, parsed, and transformed (reader and parser
+    transforms) once (cf. `publish_doctree()`).  Then, every writer
+    renders a copy of the document tree (cf. `publish_from_doctree()`),
+    applying its own transforms.
+
+    Parameters:
+
+    * `writers`: A sequence of writer names, aliases, or instances.
+
+    * `destination_paths`: None or a sequence of destination paths (one
+      per writer).  Used for relative links in the output, the output is
+      not written to a file (cf. `publish_string()`).
+
+    Other parameters: see `publish_programmatically()`.
+    The settings of the parsing stage are set up without a writer
+    component: writer settings overriding parser settings (e.g.
+    "footnote_references" in the HTML and LaTeX writers) are ignored
+    when parsing.
+
+    Return a list with the output documents (`bytes` or `str`) in the
+    order of `writers`.
+
+    Provisional.
+    """
+    writers = list(writers)
+    if destination_paths is None:
+        destination_paths = [None] * len(writers)
+    elif len(destination_paths) != len(writers):
+        raise ValueError('publish_multi(): "destination_paths" and '
+                         '"writers" must have the same length.')
+    document = publish_doctree(
+        source, source_path=source_path, source_class=source_class,
+        reader=reader, parser=parser, settings_spec=settings_spec,
+        settings_overrides=settings_overrides, config_section=config_section,
+        enable_exit_status=enable_exit_status)
+    outputs = []
+    for i, (writer, destination_path) in enumerate(zip(writers,
+                                                       destination_paths)):
+        if i < len(writers) - 1:
+            # writer transforms modify the document tree
+            copy = _copy_doctree(document)
+        else:
+            copy = document
+        outputs.append(publish_from_doctree(
+            copy, destination_path=destination_path, writer=writer,
+            settings_spec=settings_spec, settings_overrides=settings_overrides,
+            config_section=config_section,
+            enable_exit_status=enable_exit_status))
+    return outputs
+
+
+def _copy_doctree(document):
+    # Return a copy of `document` without settings, reporter,
+    # and transformer (replaced by `readers.doctree.Reader`).
+    # Unlike `document.deepcopy()`, this also copies the internal
+    # attributes (ids, nameids, substitution definitions, ...).
+    settings, document.settings = document.settings, None
+    try:
+        return pickle.loads(pickle.dumps(document,
+                                         protocol=pickle.HIGHEST_PROTOCOL))
+    finally:
+        document.settings = settings
+
+
+def publish_many(jobs, reader=None, parser=None, writer=None,
+                 settings_spec=None, settings_overrides=None,
+                 config_section=None, max_workers=None):
+    """
+    Set up & run `Publisher` objects for a batch of files in parallel.
+
+    The jobs are distributed over a pool of worker processes
+    (`concurrent.futures.ProcessPoolExecutor`).  Every worker instantiates
+    the reader, parser, and writer components and the base settings once
+    and re-uses them for all jobs it processes.
+
+    Parameters:
+
+    * `jobs`: An iterable of ``(source_path, destination_path)`` or
+      ``(source_path, destination_path, settings_overrides)`` tuples.
+      If `destination_path` is None, the output is not written to a file
+      but only returned (cf. `publish_string()`).
+      The job-specific `settings_overrides` dictionary is merged into
+      the common `settings_overrides` (the settings of this job are set up
+      like the settings of `publish_file()`).
+
+    * `reader`, `parser`, `writer`: Component name, alias, or instance
+      (instances must be picklable).  Defaults: "standalone",
+      "restructuredtext", "pseudoxml".
+
+    * `max_workers`: Maximal number of worker processes.
+      Default: number of processors.
+
+    Other parameters: see `publish_programmatically()`.
+    They are used to set up the base settings of every worker.
+
+    Return a list of ``(output, messages)`` tuples in the order of `jobs`.
+    `output` is None for jobs writing to a file with the "stream_output"
+    setting.
+    `messages` is a list of the system messages reported for this job
+    (cf. the "report_level" setting) as strings.
+    Exceptions raised while processing a job are propagated after all
+    jobs are processed (exceptions that cannot be pickled are replaced
+    by an `ApplicationError`).
+
+    Provisional.
+    """
+    reader = reader or 'standalone'
+    parser = parser or 'restructuredtext'
+    writer = writer or 'pseudoxml'
+    with concurrent.futures.ProcessPoolExecutor(
+             max_workers=max_workers,
+             initializer=_publish_many_init,
+             initargs=(reader, parser, writer, settings_spec,
+                       settings_overrides, config_section)) as executor:
+        futures = [executor.submit(_publish_many_job, *job) for job in jobs]
+        return [future.result() for future in futures]
+
+
+# Publisher components of a `publish_many()` worker process
+# and the arguments for the settings set-up
+# (set up once per process by `_publish_many_init()`).
+_worker_publisher = None
+_worker_settings_args = None
+
+
+def _publish_many_init(reader, parser, writer, settings_spec,
+                       settings_overrides, config_section) -> None:
+    # Initialize a worker process of the `publish_many()` process pool.
+    global _worker_publisher, _worker_settings_args
+    _worker_publisher = Publisher(reader, parser, writer)
+    _worker_settings_args = (settings_spec, settings_overrides or {},
+                             config_section)
+    _worker_publisher.process_programmatic_settings(
+        settings_spec, settings_overrides, config_section)
+
+
+def _publish_many_job(source_path, destination_path, settings_overrides=None):
+    # Process one `publish_many()` job in a worker process.
+    template = _worker_publisher
+    if destination_path is None:
+        destination_class = io.StringOutput
+    else:
+        destination_class = io.FileOutput
+    publisher = Publisher(template.reader, template.parser, template.writer,
+                          source_class=io.FileInput,
+                          destination_class=destination_class)
+    if settings_overrides:
+        # Set up the settings like the `publish_*()` functions do.
+        spec, common_overrides, section = _worker_settings_args
+        publisher.process_programmatic_settings(
+            spec, {**common_overrides, **settings_overrides}, section)
+    else:
+        publisher.settings = template.settings.copy()
+    warnings_ = _MessageCollector()
+    publisher.settings.warning_stream = warnings_
+    publisher.set_source(None, source_path)
+    publisher.set_destination(None, destination_path)
+    try:
+        output = publisher.publish()
+    except Exception as error:
+        # The exception is pickled for the calling process.  An exception
+        # that cannot be unpickled there breaks the process pool (and all
+        # other jobs).
+        try:
+            pickle.loads(pickle.dumps(error))
+        except Exception:
+            raise ApplicationError(
+                f'{source_path}: {error.__class__.__name__}: {error}'
+                ) from None
+        raise
+    return output, warnings_.messages
+
+
+class _MessageCollector:
+    # Stand-in for the "warning_stream" storing system messages in a list.
+
+    def __init__(self) -> None:
+        self.messages = []
+
+    def write(self, message) -> None:
+        self.messages.append(message.rstrip('\n'))
+
+    def flush(self) -> None:
+        pass
+
+
 def publish_cmdline_to_binary(reader=None, reader_name='standalone',
                               parser=None, parser_name='restructuredtext',
                               writer=None, writer_name='pseudoxml',
@@ -633,6 +1018,8 @@ def publish_cmdline_to_binary(reader=None, reader_name='standalone',
     Set up & run a `Publisher` for command-line-based file I/O (input and
     output file paths taken automatically from the command line).
     Also return the output as `bytes`.
+    With the "stream_output" setting, the output is written in parts and
+    None is returned.
 
     This is just like publish_cmdline, except that it uses
     io.BinaryFileOutput instead of io.FileOutput.
@@ -682,6 +1069,8 @@ def publish_programmatically(source_class, source, source_path,
 
     Return the output (as `str` or `bytes`, depending on `destination_class`,
     writer, and the "output_encoding" setting) and the Publisher object.
+    The output is None, if it was written in parts to a file
+    (see the "stream_output" setting).
 
     Internal:
     Applications should not call this function directly.  If it does
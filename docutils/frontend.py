@@ -797,6 +797,23 @@ class OptionParser(optparse.OptionParser, docutils.SettingsSpec):
                             'validator': validate_boolean}),
          ('Disable Python tracebacks.  (default)',
           ['--no-traceback'], {'dest': 'traceback', 'action': 'store_false'}),
+         ('Report time and memory used by the processing phases '
+          '(read, parse, transforms, write) to stderr.',
+          ['--timing-report'], {'action': 'store_true',
+                                'validator': validate_boolean}),
+         ('Report time and created and removed nodes of the individual '
+          'transforms to stderr.',
+          ['--profile-transforms'], {'action': 'store_true',
+                                     'validator': validate_boolean}),
+         ('Index the elements of the document tree by class to speed up '
+          'the transforms.',
+          ['--node-index'], {'action': 'store_true',
+                             'validator': validate_boolean}),
+         ('Write the output file piecewise while it is generated '
+          '(supported by the "pseudoxml", "xml", "html4css1", and '
+          '"html5" writers).',
+          ['--stream-output'], {'action': 'store_true',
+                                'validator': validate_boolean}),
          ('Specify the encoding and optionally the '
           'error handler of input text.  Default: utf-8.',
           ['--input-encoding'],
@@ -835,6 +852,14 @@ class OptionParser(optparse.OptionParser, docutils.SettingsSpec):
           ['--record-dependencies'],
           {'metavar': '<file>', 'validator': validate_dependency_file,
            'default': None}),           # default set in Values class
+         ('Cache document trees in <directory> and re-use them '
+          'if source, dependencies, and settings are unchanged.  '
+          'Default: None (no caching).',
+          ['--doctree-cache'], {'metavar': '<directory>'}),
+         ('Maximal size of the doctree cache in MiB.  Default: 256.',
+          ['--doctree-cache-size'],
+          {'metavar': '<MiB>', 'type': 'int', 'default': 256,
+           'validator': validate_nonnegative_int}),
          ('Read configuration settings from <file>, if it exists.',
           ['--config'], {'metavar': '<file>', 'type': 'string',
                          'action': 'callback', 'callback': read_config_file}),
@@ -899,7 +924,8 @@ class OptionParser(optparse.OptionParser, docutils.SettingsSpec):
         self.config_files: list[str] = []
         """List of paths of applied configuration files."""
 
-        self.relative_path_settings = ('warning_stream',)  # will be modified
+        self.relative_path_settings = ('warning_stream',  # will be modified
+                                       'doctree_cache')
 
         warnings.warn('The frontend.OptionParser class will be replaced '
                       'by a subclass of argparse.ArgumentParser '
@@ -22,6 +22,7 @@ from typing import TYPE_CHECKING
 from docutils import TransformSpec
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from typing import Any, BinaryIO, ClassVar, Final, Literal, TextIO
 
     from docutils import nodes
@@ -595,6 +596,48 @@ class FileOutput(Output):
                 self.close()
         return data
 
+    def write_parts(self, parts: Iterable[str | bytes]) -> None:
+        """Write the `str` or `bytes` instances from the iterable `parts`.
+
+        Like `write()` but for output generated piecewise
+        (cf. `docutils.writers.Writer.translate_parts()`).
+        If `str` instances must be encoded (see `write()`), they are
+        encoded one at a time with an incremental encoder, so that a
+        byte order mark is written only once.
+
+        Provisional.
+        """
+        if not self.opened:
+            self.open()
+        encoder = None
+        if check_encoding(self.destination, self.encoding) is False:
+            encoder = codecs.getincrementalencoder(self.encoding)(
+                          self.error_handler)
+        autoclose, self.autoclose = self.autoclose, False
+        try:
+            for data in parts:
+                if isinstance(data, str) and encoder is not None:
+                    if os.linesep != '\n':
+                        data = data.replace('\n', os.linesep)  # fix endings
+                    data = self._encode_part(encoder, data)
+                self.write(data)
+            if encoder is not None:
+                data = self._encode_part(encoder, '', final=True)
+                if data:
+                    self.write(data)
+        finally:
+            self.autoclose = autoclose
+            if self.autoclose:
+                self.close()
+
+    def _encode_part(self, encoder, data: str, final: bool = False) -> bytes:
+        try:
+            return encoder.encode(data, final)
+        except UnicodeError as err:
+            raise UnicodeError(
+                'Unable to encode output data. output-encoding is: '
+                f'{self.encoding}.\n({error_string(err)})')
+
     def close(self) -> None:
         if self.destination not in (sys.stdout, sys.stderr):
             self.destination.close()
@@ -30,6 +30,7 @@ import sys
 import unicodedata
 import warnings
 from collections import Counter
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, overload
 # import xml.dom.minidom as dom # -> conditional import in Node.asdom()
 #                                    and document.asdom()
@@ -37,8 +38,7 @@ from typing import TYPE_CHECKING, overload
 # import docutils.transforms # -> delayed import in document.__init__()
 
 if TYPE_CHECKING:
-    from collections.abc import (Callable, Iterable, Iterator,
-                                 Mapping, Sequence)
+    from collections.abc import Callable, Iterable, Iterator, Sequence
     from types import ModuleType
     from typing import Any, ClassVar, Final, Literal, Self, SupportsIndex
     if sys.version_info[:2] >= (3, 12):
@@ -91,14 +91,25 @@ class Node:
 
     _document: document | None = None
 
+    _position: int = 0
+    """Index of this Node in `parent.children` when last looked up (a hint,
+    see `Element._child_position()`)."""
+
     @property
     def document(self) -> document | None:
         """Return the `document` root node of the tree containing this Node.
+
+        `setup_child()` passes the document on to the child and its
+        descendants, so that the lookup usually takes constant time.
         """
-        try:
-            return self._document or self.parent.document
-        except AttributeError:
-            return None
+        if self._document is not None:
+            return self._document
+        node = self.parent
+        while node is not None:
+            if node._document is not None:
+                return node._document
+            node = node.parent
+        return None
 
     @document.setter
     def document(self, value: document) -> None:
@@ -155,12 +166,30 @@ class Node:
 
     def setup_child(self, child: Node) -> None:
         child.parent = self
-        if self.document:
-            child.document = self.document
+        document = self.document
+        if document:
+            if document.node_index is not None:
+                document.index_nodes(child)
+            elif child._document is not document:
+                child._set_document(document)
             if child.source is None:
-                child.source = self.document.current_source
+                child.source = document.current_source
             if child.line is None:
-                child.line = self.document.current_line
+                child.line = document.current_line
+
+    def _set_document(self, document: document) -> None:
+        """Let `self` and its descendants refer to `document`.
+
+        Skip the descendants of nodes already referring to `document`
+        (set when they were attached).
+        """
+        self._document = document
+        stack = list(self.children)
+        while stack:
+            node = stack.pop()
+            if node._document is not document:
+                node._document = document
+                stack.extend(node.children)
 
     def walk(self, visitor: NodeVisitor) -> bool:
         """
@@ -185,28 +214,7 @@ class Node:
 
         Return true if we should stop the traversal.
         """
-        stop = False
-        visitor.document.reporter.debug(
-            'docutils.nodes.Node.walk calling dispatch_visit for %s'
-            % self.__class__.__name__)
-        try:
-            try:
-                visitor.dispatch_visit(self)
-            except (SkipChildren, SkipNode):
-                return stop
-            except SkipDeparture:           # not applicable; ignore
-                pass
-            children = self.children
-            try:
-                for child in children[:]:
-                    if child.walk(visitor):
-                        stop = True
-                        break
-            except SkipSiblings:
-                pass
-        except StopTraversal:
-            stop = True
-        return stop
+        return self._walk(visitor, depart=False)
 
     def walkabout(self, visitor: NodeVisitor) -> bool:
         """
@@ -220,43 +228,88 @@ class Node:
 
         Return true if we should stop the traversal.
         """
-        call_depart = True
-        stop = False
-        visitor.document.reporter.debug(
-            'docutils.nodes.Node.walkabout calling dispatch_visit for %s'
-            % self.__class__.__name__)
-        try:
-            try:
-                visitor.dispatch_visit(self)
-            except SkipNode:
-                return stop
-            except SkipDeparture:
-                call_depart = False
-            children = self.children
-            try:
-                for child in children[:]:
-                    if child.walkabout(visitor):
-                        stop = True
-                        break
-            except SkipSiblings:
-                pass
-        except SkipChildren:
-            pass
-        except StopTraversal:
-            stop = True
-        if call_depart:
-            visitor.document.reporter.debug(
-                'docutils.nodes.Node.walkabout calling dispatch_departure '
-                'for %s' % self.__class__.__name__)
-            visitor.dispatch_departure(self)
-        return stop
+        return self._walk(visitor, depart=True)
+
+    def _walk(self, visitor: NodeVisitor, depart: bool) -> bool:
+        """Traverse the tree for `walk()` and `walkabout()`.
+
+        Use an explicit stack instead of recursion, so that the depth
+        of the tree is not limited by the Python recursion limit.
+        """
+        reporter = visitor.document.reporter
+        dispatch_visit = visitor.dispatch_visit
+        dispatch_departure = visitor.dispatch_departure
+        method = 'walkabout' if depart else 'walk'
+        # Nodes whose children are traversed, starting with a pseudo-parent
+        # of `self`: [node, iterator over children, call departure?, stop?]
+        root = [None, iter((self,)), False, False]
+        stack = [root]
+        while stack:
+            frame = stack[-1]
+            for node in frame[1]:
+                if reporter.debug_flag:
+                    reporter.debug(f'docutils.nodes.Node.{method} calling '
+                                   'dispatch_visit for '
+                                   f'{node.__class__.__name__}')
+                try:
+                    dispatch_visit(node)
+                except SkipNode:
+                    continue
+                except SkipSiblings:
+                    if frame is root:
+                        raise
+                    frame[1] = iter(())
+                    break
+                except SkipChildren:
+                    stack.append([node, iter(()), depart, False])
+                except StopTraversal:
+                    stack.append([node, iter(()), depart, True])
+                except SkipDeparture:
+                    stack.append([node, iter(node.children[:]), False, False])
+                else:
+                    if not (node.children or depart):
+                        continue  # leaf node, nothing left to do
+                    stack.append([node, iter(node.children[:]), depart, False])
+                break
+            else:
+                # All children of `frame[0]` are done.
+                stack.pop()
+                if frame is root:
+                    break
+                parent = stack[-1]
+                if frame[3]:  # stop the traversal
+                    parent[1] = iter(())
+                    parent[3] = True
+                if frame[2]:
+                    if reporter.debug_flag:
+                        reporter.debug('docutils.nodes.Node.walkabout calling '
+                                       'dispatch_departure for '
+                                       f'{frame[0].__class__.__name__}')
+                    try:
+                        dispatch_departure(frame[0])
+                    except (SkipChildren, SkipSiblings, StopTraversal) as err:
+                        if parent is root:
+                            raise
+                        parent[1] = iter(())
+                        parent[3] = isinstance(err, StopTraversal)
+        return root[3]
 
     def _fast_findall(self, cls: type) -> Iterator[Node]:
         """Return iterator that only supports instance checks."""
         if isinstance(self, cls):
             yield self
-        for child in self.children:
-            yield from child._fast_findall(cls)
+        # Iterators over the (live) lists of children of the ancestors
+        # of the current node.  Yields in constant time at any depth.
+        stack = [iter(self.children)]
+        while stack:
+            for child in stack[-1]:
+                if isinstance(child, cls):
+                    yield child
+                if child.children:
+                    stack.append(iter(child.children))
+                    break
+            else:
+                stack.pop()
 
     def _superfast_findall(self) -> Iterator[Node]:
         """Return iterator that doesn't check for a condition."""
@@ -264,8 +317,15 @@ class Node:
         # __getitem__() and __len__() in the Element subclass,
         # which yields only the direct children.
         yield self
-        for child in self.children:
-            yield from child._superfast_findall()
+        stack = [iter(self.children)]
+        while stack:
+            for child in stack[-1]:
+                yield child
+                if child.children:
+                    stack.append(iter(child.children))
+                    break
+            else:
+                stack.pop()
 
     def findall(self,
                 condition: Callable[[Node], bool] | type | None = None,
@@ -334,22 +394,24 @@ class Node:
         if include_self and (condition is None or condition(self)):
             yield self
         if descend and len(self.children):
-            for child in self:
-                yield from child.findall(condition=condition,
-                                         include_self=True, descend=True,
-                                         siblings=False, ascend=False)
+            descendants = self._superfast_findall()
+            next(descendants)  # skip `self`
+            for node in descendants:
+                if condition is None or condition(node):
+                    yield node
         if siblings or ascend:
             node = self
             while node.parent:
-                index = node.parent.index(node)
-                # extra check since Text nodes have value-equality
-                while node.parent[index] is not node:
-                    index = node.parent.index(node, index + 1)
-                for sibling in node.parent[index+1:]:
-                    yield from sibling.findall(
-                        condition=condition,
-                        include_self=True, descend=descend,
-                        siblings=False, ascend=False)
+                index = node.parent._child_position(node)
+                # iterate over a copy: the siblings may change meanwhile
+                for sibling in node.parent.children[index+1:]:
+                    if descend:
+                        subtree = sibling._superfast_findall()
+                    else:
+                        subtree = (sibling,)
+                    for descendant in subtree:
+                        if condition is None or condition(descendant):
+                            yield descendant
                 if not ascend:
                     break
                 else:
@@ -605,18 +667,20 @@ class Element(Node):
 
         self.extend(children)           # maintain parent info
 
-        self.attributes: dict[str, Any] = {}
-        """Dictionary of attribute {name: value}."""
+        self.attributes: dict[str, Any] = _ElementAttributes(
+                                              self.list_attributes)
+        """Dictionary of attribute {name: value}.
 
-        # Initialize list attributes.
-        for att in self.list_attributes:
-            self.attributes[att] = []
+        List attributes are initialized to empty lists on first access
+        (cf. `_ElementAttributes`).
+        """
 
         for att, value in attributes.items():
             att = att.lower()  # normalize attribute name
             if att in self.list_attributes:
-                # lists are mutable; make a copy for this node
-                self.attributes[att] = value[:]
+                if value:
+                    # lists are mutable; make a copy for this node
+                    self.attributes[att] = value[:]
             else:
                 self.attributes[att] = value
 
@@ -693,7 +757,9 @@ class Element(Node):
     def __contains__(self, key: str | Node) -> bool:
         # Test for both, children and attributes with operator ``in``.
         if isinstance(key, str):
-            return key in self.attributes
+            # cf. _ElementAttributes.__contains__()
+            return (key in self.list_attributes
+                    or dict.__contains__(self.attributes, key))
         return key in self.children
 
     @overload
@@ -776,8 +842,26 @@ class Element(Node):
         return self
 
     def astext(self) -> str:
-        return self.child_text_separator.join(
-                   [child.astext() for child in self.children])
+        # Elements using this method are handled iteratively,
+        # overriding methods are called for their subtree.
+        element_astext = Element.astext
+        parts = []
+        stack = [(self, iter(self.children))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if type(child).astext is element_astext:
+                    stack.append((child, iter(child.children)))
+                    break
+                parts.append(child.astext())
+                parts.append(node.child_text_separator)
+            else:
+                stack.pop()
+                if node.children:
+                    parts.pop()  # no separator after the last child
+                if stack:
+                    parts.append(stack[-1][0].child_text_separator)
+        return ''.join(parts)
 
     def non_default_attributes(self) -> dict[str, Any]:
         atts = {key: value for key, value in self.attributes.items()
@@ -788,7 +872,10 @@ class Element(Node):
         return sorted(self.non_default_attributes().items())
 
     def get(self, key: str, failobj: Any | None = None) -> Any:
-        return self.attributes.get(key, failobj)
+        # cf. _ElementAttributes.get()
+        if key in self.list_attributes:
+            return self.attributes[key]
+        return dict.get(self.attributes, key, failobj)
 
     def hasattr(self, attr: str) -> bool:
         return attr in self.attributes
@@ -819,6 +906,7 @@ class Element(Node):
 
     def append(self, item: Node) -> None:
         self.setup_child(item)
+        item._position = len(self.children)
         self.children.append(item)
 
     def extend(self, item: Iterable[Node]) -> None:
@@ -839,19 +927,45 @@ class Element(Node):
         return self.children.pop(i)
 
     def remove(self, item: Node) -> None:
-        self.children.remove(item)
+        if isinstance(item, Element):
+            del self.children[self._child_position(item)]
+        else:
+            self.children.remove(item)
 
     def index(self,
               item: Node,
               start: int = 0,
               stop: int = sys.maxsize,
               ) -> int:
+        if isinstance(item, Element) and start == 0 and stop == sys.maxsize:
+            # elements compare by identity
+            return self._child_position(item)
         return self.children.index(item, start, stop)
 
+    def _child_position(self, child: Node) -> int:
+        """Return the index of `child` (by identity) in `self.children`.
+
+        Use the position stored in `child._position` if it is up to date.
+        Otherwise, update the positions of all children.  Sibling
+        navigation takes constant time unless the children changed.
+
+        Raise ValueError if `child` is not a child of `self`.
+        """
+        children = self.children
+        position = child._position
+        if position < len(children) and children[position] is child:
+            return position
+        for position, node in enumerate(children):
+            node._position = position
+        position = child._position
+        if position < len(children) and children[position] is child:
+            return position
+        raise ValueError(f'{child!r} is not in list')
+
     def previous_sibling(self) -> Node | None:
         """Return preceding sibling node or ``None``."""
         try:
-            i = self.parent.index(self)
+            i = self.parent._child_position(self)
         except (AttributeError):
             return None
         return self.parent[i-1] if i > 0 else None
@@ -1198,9 +1312,21 @@ class Element(Node):
         return None
 
     def pformat(self, indent: str = '    ', level: int = 0) -> str:
-        tagline = '%s%s\n' % (indent*level, self.starttag())
-        childreps = (c.pformat(indent, level+1) for c in self.children)
-        return ''.join((tagline, *childreps))
+        # Elements using this method are handled iteratively,
+        # overriding methods are called for their subtree.
+        parts = ['%s%s\n' % (indent*level, self.starttag())]
+        stack = [iter(self.children)]
+        while stack:
+            for child in stack[-1]:
+                if child.__class__.pformat is Element.pformat:
+                    parts.append('%s%s\n' % (indent*(level+len(stack)),
+                                             child.starttag()))
+                    stack.append(iter(child.children))
+                    break
+                parts.append(child.pformat(indent, level+len(stack)))
+            else:
+                stack.pop()
+        return ''.join(parts)
 
     def copy(self) -> Self:
         obj = self.__class__(rawsource=self.rawsource, **self.attributes)
@@ -1210,9 +1336,23 @@ class Element(Node):
         return obj
 
     def deepcopy(self) -> Self:
-        copy = self.copy()
-        copy.extend([child.deepcopy() for child in self.children])
-        return copy
+        # Elements using this method are handled iteratively,
+        # overriding methods are called for their subtree.
+        # Children are added to a copy when its subtree is complete.
+        stack = [(self.copy(), iter(self.children), [])]
+        while True:
+            copy, children, child_copies = stack[-1]
+            for child in children:
+                if child.__class__.deepcopy is Element.deepcopy:
+                    stack.append((child.copy(), iter(child.children), []))
+                    break
+                child_copies.append(child.deepcopy())
+            else:
+                copy.extend(child_copies)
+                stack.pop()
+                if not stack:
+                    return copy
+                stack[-1][2].append(copy)
 
     def note_referenced_by(self,
                            name: str | None = None,
@@ -1374,6 +1514,83 @@ class Element(Node):
                 child.validate(recursive=recursive)
 
 
+class _ElementAttributes(dict):
+    """
+    Dictionary of `Element` attributes with lazy list attributes.
+
+    The `list_attributes` of an element are empty lists by default.
+    To save memory, they are only stored on first access:
+    ``attributes['ids']``, ``attributes.get('ids')``, and
+    ``attributes.setdefault('ids')`` return a list that is stored
+    in the dictionary, ``'ids' in attributes`` is always True.
+
+    Iterating over the dictionary (keys, values, items) skips list
+    attributes that were not accessed.  Comparisons treat missing list
+    attributes as empty lists.  Deleting a list attribute that was not
+    accessed does nothing.
+
+    Provisional.
+    """
+
+    __slots__ = ('list_attributes',)
+
+    def __init__(self, list_attributes: Sequence[str] = (),
+                 *args: Any, **kwargs: Any) -> None:
+        dict.__init__(self, *args, **kwargs)
+        self.list_attributes = list_attributes
+
+    def __missing__(self, key: str) -> list[Any]:
+        if key in self.list_attributes:
+            value = self[key] = []
+            return value
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return dict.__contains__(self, key) or key in self.list_attributes
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return self._normalized(self) == self._normalized(other)
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def _normalized(self, mapping: Mapping[str, Any]) -> dict[str, Any]:
+        # Return `mapping` without empty list attributes.
+        return {key: value for key, value in mapping.items()
+                if value != [] or key not in self.list_attributes}
+
+    def __delitem__(self, key: str) -> None:
+        # deleting a list attribute that was not accessed is a no-op
+        if dict.__contains__(self, key) or key not in self.list_attributes:
+            dict.__delitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.list_attributes:
+            return self[key]
+        return dict.get(self, key, default)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in self.list_attributes and not dict.__contains__(self, key):
+            return []
+        return dict.pop(self, key, *default)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key in self.list_attributes:
+            return self[key]
+        return dict.setdefault(self, key, default)
+
+    def copy(self) -> _ElementAttributes:
+        return self.__class__(self.list_attributes, self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (self.__class__, (self.list_attributes, dict(self)))
+
+
 # ====================
 #  Element Categories
 # ====================
@@ -1725,6 +1942,8 @@ class document(Root, Element):
     # Additional restrictions for `subtitle` and `transition` are tested
     # with the respective `validate_position()` methods.
 
+    node_index = None  # default for documents pickled by older versions
+
     def __init__(self,
                  settings: Values,
                  reporter: Reporter,
@@ -1819,6 +2038,13 @@ class document(Root, Element):
         self.decoration: decoration | None = None
         """Document's `decoration` node."""
 
+        self.node_index: dict[type[Element], dict[int, Element]] | None = None
+        """Mapping of element classes to the elements of this class
+        (by object id), `None` if the index is disabled.
+
+        See `enable_node_index()`.  Provisional.
+        """
+
         self._document: document = self
 
     def __getstate__(self) -> dict[str, Any]:
@@ -1828,8 +2054,124 @@ class document(Root, Element):
         state = self.__dict__.copy()
         state['reporter'] = None
         state['transformer'] = None
+        state['node_index'] = None
         return state
 
+    def enable_node_index(self) -> None:
+        """Index all elements in the document by class.
+
+        With the index enabled, ``document.findall(cls)`` does not traverse
+        the document tree.  Elements added with `Element.append()`,
+        `Element.insert()`, `Element.replace()`, and related methods are
+        added to the index together with their descendants.  Removed
+        elements are dropped from the index when found by `findall()`.
+
+        Children added by modifying `Element.children` directly
+        are not indexed.  Provisional.
+        """
+        self.node_index = {}
+        for child in self.children:
+            self.index_nodes(child)
+
+    def disable_node_index(self) -> None:
+        """Stop maintaining the index of elements (see `enable_node_index()`).
+        """
+        self.node_index = None
+
+    def index_nodes(self, node: Node) -> None:
+        """Add `node` and its descendant elements to `self.node_index`.
+
+        Also let `node` and its descendants refer to this document,
+        so that elements added to them are indexed as well.
+        """
+        index = self.node_index
+        for descendant in node._superfast_findall():
+            descendant._document = self
+            if isinstance(descendant, Element):
+                try:
+                    index[descendant.__class__][id(descendant)] = descendant
+                except KeyError:
+                    index[descendant.__class__] = {id(descendant): descendant}
+
+    def findall(self,
+                condition: Callable[[Node], bool] | type | None = None,
+                include_self: bool = True,
+                descend: bool = True,
+                siblings: bool = False,
+                ascend: bool = False,
+                ) -> Iterator[Node]:
+        """
+        Return an iterator yielding nodes following `self`.
+
+        See `Node.findall()`.  If the `node_index` is enabled and
+        `condition` is an `Element` subclass, look up the matching
+        elements in the index instead of traversing the document tree.
+        """
+        if (self.node_index is not None
+            and include_self and descend and not (siblings or ascend)
+            and isinstance(condition, type)
+            and not issubclass(Text, condition)):
+            return self._findall_indexed(condition)
+        return Element.findall(self, condition, include_self,
+                               descend, siblings, ascend)
+
+    def _findall_indexed(self, cls: type) -> Iterator[Node]:
+        """Yield the document and indexed elements that are `cls` instances.
+
+        Sort the elements in document order, dropping elements that are
+        no longer part of the document.
+        """
+        matches = []
+        for element_class, elements in self.node_index.items():
+            if issubclass(element_class, cls):
+                matches.extend(elements.values())
+        keys = {id(self): ()}  # id(node) -> position in the document
+        positions = {}  # id(element) -> {id(child): index}
+        found = []
+        for element in matches:
+            key = self._position_key(element, keys, positions)
+            if key is None:
+                del self.node_index[element.__class__][id(element)]
+            else:
+                found.append((key, element))
+        found.sort(key=lambda item: item[0])
+        if isinstance(self, cls):
+            yield self
+        for key, element in found:
+            yield element
+
+    @staticmethod
+    def _position_key(node: Node,
+                      keys: dict[int, tuple[int, ...] | None],
+                      positions: dict[int, dict[int, int]],
+                      ) -> tuple[int, ...] | None:
+        """Return the child indices leading from the document to `node`.
+
+        Return None if `node` is not part of the document.  `keys` and
+        `positions` cache results for ancestors and their children.
+        """
+        path = []
+        while id(node) not in keys:
+            parent = node.parent
+            if parent is None:
+                break
+            try:
+                children = positions[id(parent)]
+            except KeyError:
+                children = positions[id(parent)] = {
+                    id(child): i for i, child in enumerate(parent.children)}
+            index = children.get(id(node))
+            if index is None:  # removed from `parent`
+                break
+            path.append((node, index))
+            node = parent
+        key = keys.setdefault(id(node), None)
+        for node, index in reversed(path):
+            if key is not None:
+                key += (index,)
+            keys[id(node)] = key
+        return key
+
     def asdom(self, dom: ModuleType | None = None) -> minidom.Document:
         """Return a DOM representation of this document."""
         if dom is None:
@@ -2681,7 +3023,8 @@ class NodeVisitor:
     the `dispatch_departure()` method before exiting a node.
 
     The dispatch methods call "``visit_`` + node class name" or
-    "``depart_`` + node class name", resp.
+    "``depart_`` + node class name", resp.  The methods are looked up
+    once per node class and visitor instance.
 
     This is a base class for visitors whose ``visit_...`` & ``depart_...``
     methods must be implemented for *all* compulsory node types encountered
@@ -2709,6 +3052,8 @@ class NodeVisitor:
 
     def __init__(self, document: document, /) -> None:
         self.document: document = document
+        self._visit_methods: dict[type[Node], Callable[[Node], Any]] = {}
+        self._depart_methods: dict[type[Node], Callable[[Node], Any]] = {}
 
     def dispatch_visit(self, node: Node) -> None:
         """
@@ -2716,11 +3061,18 @@ class NodeVisitor:
         parameter.  If the ``visit_...`` method does not exist, call
         self.unknown_visit.
         """
-        node_name = node.__class__.__name__
-        method = getattr(self, 'visit_' + node_name, self.unknown_visit)
-        self.document.reporter.debug(
-            'docutils.nodes.NodeVisitor.dispatch_visit calling %s for %s'
-            % (method.__name__, node_name))
+        try:
+            method = self._visit_methods[node.__class__]
+        except KeyError:
+            method = self._visit_methods[node.__class__] = getattr(
+                self, 'visit_' + node.__class__.__name__, self.unknown_visit)
+        except AttributeError:  # NodeVisitor.__init__() not called
+            self._visit_methods, self._depart_methods = {}, {}
+            return self.dispatch_visit(node)
+        if self.document.reporter.debug_flag:
+            self.document.reporter.debug(
+                'docutils.nodes.NodeVisitor.dispatch_visit calling %s for %s'
+                % (method.__name__, node.__class__.__name__))
         return method(node)
 
     def dispatch_departure(self, node: Node) -> None:
@@ -2729,11 +3081,19 @@ class NodeVisitor:
         parameter.  If the ``depart_...`` method does not exist, call
         self.unknown_departure.
         """
-        node_name = node.__class__.__name__
-        method = getattr(self, 'depart_' + node_name, self.unknown_departure)
-        self.document.reporter.debug(
-            'docutils.nodes.NodeVisitor.dispatch_departure calling %s for %s'
-            % (method.__name__, node_name))
+        try:
+            method = self._depart_methods[node.__class__]
+        except KeyError:
+            method = self._depart_methods[node.__class__] = getattr(
+                self, 'depart_' + node.__class__.__name__,
+                self.unknown_departure)
+        except AttributeError:  # NodeVisitor.__init__() not called
+            self._visit_methods, self._depart_methods = {}, {}
+            return self.dispatch_departure(node)
+        if self.document.reporter.debug_flag:
+            self.document.reporter.debug(
+                'docutils.nodes.NodeVisitor.dispatch_departure calling %s '
+                'for %s' % (method.__name__, node.__class__.__name__))
         return method(node)
 
     def unknown_visit(self, node: Node) -> None:
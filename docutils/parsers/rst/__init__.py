@@ -144,6 +144,11 @@ class Parser(docutils.parsers.Parser):
           ['--character-level-inline-markup'],
           {'action': 'store_true', 'default': False,
            'dest': 'character_level_inline_markup'}),
+         ('Parse the sections of long documents in <n> worker processes '
+          '(default 0: parse serially). Provisional.',
+          ['--parallel-sections'],
+          {'metavar': '<n>', 'type': 'int', 'default': 0,
+           'validator': frontend.validate_nonnegative_int}),
          )
         )
 
@@ -181,12 +186,27 @@ class Parser(docutils.parsers.Parser):
                 self.document.append(error)
                 break
         else:
-            self.statemachine.run(inputlines, document, inliner=self.inliner)
+            self.parse_lines(inputlines, document)
         # restore the "default" default role after parsing a document
         if '' in roles._roles:
             del roles._roles['']
         self.finish_parse()
 
+    def parse_lines(self, inputlines, document) -> None:
+        """
+        Run the state machine on the list of `inputlines`.
+
+        Parse the sections of long documents in parallel if the
+        "parallel_sections" setting is non-zero.
+        """
+        workers = document.settings.setdefault('parallel_sections', 0)
+        if workers:
+            # import on demand (loads the multiprocessing modules)
+            from docutils.parsers.rst import parallel
+            if parallel.parse(self, inputlines, document, workers):
+                return
+        self.statemachine.run(inputlines, document, inliner=self.inliner)
+
 
 class DirectiveError(Exception):
 
@@ -10,21 +10,13 @@ __docformat__ = 'reStructuredText'
 
 from urllib.request import url2pathname
 
-try:  # check for the Python Imaging Library
-    import PIL.Image
-except ImportError:
-    try:  # sometimes PIL modules are put in PYTHONPATH's root
-        import Image
-        class PIL: pass  # noqa:E701  dummy wrapper
-        PIL.Image = Image
-    except ImportError:
-        PIL = None
-
 from docutils import nodes
 from docutils.nodes import fully_normalize_name, whitespace_normalize_name
 from docutils.parsers.rst import Directive
 from docutils.parsers.rst import directives, states
 from docutils.parsers.rst.roles import normalize_options
+from docutils.utils import image_info
+from docutils.utils.image_info import PIL  # noqa: F401  backwards compat.
 
 
 class Image(Directive):
@@ -135,14 +127,14 @@ class Figure(Image):
         (figure_node.source, figure_node.line
          ) = self.state_machine.get_source_and_line(self.lineno)
         if figwidth == 'image':
-            if PIL and self.state.document.settings.file_insertion_enabled:
+            if self.state.document.settings.file_insertion_enabled:
                 imagepath = url2pathname(image_node['uri'])
                 try:
-                    with PIL.Image.open(imagepath) as img:
-                        figure_node['width'] = '%dpx' % img.size[0]
-                except (OSError, UnicodeEncodeError):
-                    pass  # TODO: warn/info?
-                else:
+                    size = image_info.cache.size(imagepath)
+                except (ValueError, OSError, UnicodeEncodeError):
+                    size = None  # TODO: warn/info?
+                if size:
+                    figure_node['width'] = '%dpx' % size[0]
                     self.state.document.settings.record_dependencies.add(
                         imagepath.replace('\\', '/'))
         elif figwidth is not None:
@@ -8,7 +8,9 @@ from __future__ import annotations
 
 __docformat__ = 'reStructuredText'
 
+import os
 import re
+import threading
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -50,6 +52,13 @@ class Include(Directive):
     start and end line or text to match before and/or after the text
     to be used.
 
+    The content of included files is kept in `file_cache` while the
+    process runs.  It is not stored across runs: reading a stored copy
+    costs as much as reading the included file.  To skip unchanged
+    documents or reuse their parsed document trees across runs, see the
+    ``--incremental`` option of ``buildhtml.py`` and the "doctree_cache"
+    setting (`docutils.utils.doctree_cache`).
+
     https://docutils.sourceforge.io/docs/ref/rst/directives.html#include
     """
 
@@ -72,6 +81,22 @@ class Include(Directive):
 
     standard_include_path = Path(states.__file__).parent / 'include'
 
+    file_cache = {}
+    """Clipped content of recently included files (shared by all documents
+    in a process), least recently used first.  See `read_file()`."""
+
+    file_cache_lock = threading.Lock()
+    """Lock for changes of `file_cache` (documents may be processed
+    in several threads)."""
+
+    file_cache_size = 100
+    """Maximal number of entries in `file_cache`."""
+
+    file_cache_max_chars = 16*2**20
+    """Maximal total number of characters of the entries in `file_cache`.
+
+    Longer texts are not stored in the cache."""
+
     def run(self) -> list[Node]:
         """Include a file as part of the content of this reST file.
 
@@ -111,10 +136,42 @@ class Include(Directive):
     def read_file(self, path: StrPath) -> str:
         """Read text file at `path`. Clip and return content.
 
+        The content is cached in `Include.file_cache` with the file's
+        modification time and size, the encoding, and the clip options
+        (cf. `file_cache_size` and `file_cache_max_chars`).
+
         Provisional.
         """
         encoding = self.options.get('encoding', self.settings.input_encoding)
         error_handler = self.settings.input_encoding_error_handler
+        try:
+            stat = os.stat(path)
+        except (OSError, ValueError):
+            key = None  # let `io.FileInput` report the problem
+        else:
+            key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size,
+                   encoding, error_handler, self.clip_options)
+            with Include.file_cache_lock:
+                text = Include.file_cache.pop(key, None)
+                if text is not None:
+                    Include.file_cache[key] = text
+            if text is not None:
+                self.settings.record_dependencies.add(path)
+                return text
+        text = self.read_and_clip(path, encoding, error_handler)
+        if key is not None and len(text) <= self.file_cache_max_chars:
+            with Include.file_cache_lock:
+                Include.file_cache[key] = text
+                chars = sum(len(entry)
+                            for entry in Include.file_cache.values())
+                while (len(Include.file_cache) > self.file_cache_size
+                       or chars > self.file_cache_max_chars):
+                    oldest = next(iter(Include.file_cache))
+                    chars -= len(Include.file_cache.pop(oldest))
+        return text
+
+    def read_and_clip(self, path, encoding, error_handler) -> str:
+        # Read text file at `path` (see `read_file()`).
         try:
             include_file = io.FileInput(source_path=path,
                                         encoding=encoding,
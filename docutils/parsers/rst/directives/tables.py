@@ -10,6 +10,7 @@ __docformat__ = 'reStructuredText'
 
 
 import csv
+from itertools import islice
 from urllib.request import urlopen
 from urllib.error import URLError
 import warnings
@@ -56,35 +57,45 @@ class Table(Directive):
         return title, messages
 
     def check_table_dimensions(self, rows, header_rows, stub_columns):
-        if len(rows) < header_rows:
+        self.check_row_lengths([len(row) for row in rows],
+                               header_rows, stub_columns)
+
+    def check_row_lengths(self, row_lengths, header_rows, stub_columns):
+        """
+        Check the number of rows and the number of cells in every row.
+
+        Like `check_table_dimensions()` but with a list of the row
+        lengths instead of the rows.
+        """
+        if len(row_lengths) < header_rows:
             error = self.reporter.error('%s header row(s) specified but '
                 'only %s row(s) of data supplied ("%s" directive).'
-                % (header_rows, len(rows), self.name),
+                % (header_rows, len(row_lengths), self.name),
                 nodes.literal_block(self.block_text, self.block_text),
                 line=self.lineno)
             raise SystemMessagePropagation(error)
-        if len(rows) == header_rows > 0:
+        if len(row_lengths) == header_rows > 0:
             error = self.reporter.error(
-                f'Insufficient data supplied ({len(rows)} row(s)); '
+                f'Insufficient data supplied ({len(row_lengths)} row(s)); '
                 'no data remaining for table body, '
                 f'required by "{self.name}" directive.',
                 nodes.literal_block(self.block_text, self.block_text),
                 line=self.lineno)
             raise SystemMessagePropagation(error)
-        for row in rows:
-            if len(row) < stub_columns:
+        for row_length in row_lengths:
+            if row_length < stub_columns:
                 error = self.reporter.error(
                     f'{stub_columns} stub column(s) specified '
-                    f'but only {len(row)} columns(s) of data supplied '
+                    f'but only {row_length} columns(s) of data supplied '
                     f'("{self.name}" directive).',
                     nodes.literal_block(self.block_text, self.block_text),
                     line=self.lineno)
                 raise SystemMessagePropagation(error)
-            if len(row) == stub_columns > 0:
+            if row_length == stub_columns > 0:
                 error = self.reporter.error(
                     'Insufficient data supplied (%s columns(s)); '
                     'no data remaining for table body, required '
-                    'by "%s" directive.' % (len(row), self.name),
+                    'by "%s" directive.' % (row_length, self.name),
                     nodes.literal_block(self.block_text, self.block_text),
                     line=self.lineno)
                 raise SystemMessagePropagation(error)
@@ -285,29 +296,35 @@ class CSVTable(Table):
             title, messages = self.make_title()
             csv_data, source = self.get_csv_data()
             table_head, max_header_cols = self.process_header_option()
-            rows, max_cols = self.parse_csv_data_into_rows(
-                csv_data, self.DocutilsDialect(self.options), source)
-            max_cols = max(max_cols, max_header_cols)
+            dialect = self.DocutilsDialect(self.options)
+            # First pass: get the number of rows and columns.
+            row_lengths = [len(row)
+                           for row in self.read_csv_rows(csv_data, dialect)]
+            max_cols = max(max(row_lengths, default=0), max_header_cols)
             header_rows = self.options.get('header-rows', 0)
             stub_columns = self.options.get('stub-columns', 0)
-            self.check_table_dimensions(rows, header_rows, stub_columns)
-            table_head.extend(rows[:header_rows])
-            table_body = rows[header_rows:]
+            self.check_row_lengths(row_lengths, header_rows, stub_columns)
+            # Second pass: body rows are read and converted
+            # while the table is built.
+            rows = self.read_csv_rows(csv_data, dialect)
+            table_head.extend(self.make_rows(islice(rows, header_rows),
+                                             source))
+            table_body = self.make_rows(rows, source, max_cols)
             col_widths = self.get_column_widths(max_cols)
-            self.extend_short_rows_with_empty_cells(max_cols,
-                                                    (table_head, table_body))
+            self.extend_short_rows_with_empty_cells(max_cols, (table_head,))
         except SystemMessagePropagation as detail:
             return [detail.args[0]]
         except csv.Error as detail:
-            message = str(detail)
-            error = self.reporter.error('Error with CSV data'
-                ' in "%s" directive:\n%s' % (self.name, message),
-                nodes.literal_block(self.block_text, self.block_text),
-                line=self.lineno)
-            return [error]
+            return [self.csv_data_error(detail)]
         table = (col_widths, table_head, table_body)
-        table_node = self.state.build_table(table, self.content_offset,
-                                            stub_columns, widths=self.widths)
+        try:
+            # the body rows are read in the second pass over the data
+            table_node = self.state.build_table(table, self.content_offset,
+                                                stub_columns,
+                                                widths=self.widths)
+        except (csv.Error, UnicodeError) as detail:
+            # e.g. the external file changed since the first pass
+            return [self.csv_data_error(detail)]
         table_node['classes'] += self.options.get('class', [])
         if 'align' in self.options:
             table_node['align'] = self.options.get('align')
@@ -317,6 +334,13 @@ class CSVTable(Table):
             table_node.insert(0, title)
         return [table_node] + messages
 
+    def csv_data_error(self, detail):
+        """Return an error system message for invalid CSV data."""
+        return self.reporter.error('Error with CSV data'
+            ' in "%s" directive:\n%s' % (self.name, detail),
+            nodes.literal_block(self.block_text, self.block_text),
+            line=self.lineno)
+
     def get_csv_data(self):
         """
         Get CSV data from the directive content, from an external
@@ -351,7 +375,13 @@ class CSVTable(Table):
                 csv_file = FileInput(source_path=source,
                                      encoding=encoding,
                                      error_handler=error_handler)
-                csv_data = csv_file.read().splitlines()
+                if csv_file.encoding:
+                    # read line by line in every pass over the data
+                    csv_file.close()
+                    csv_data = FileLines(source, encoding, error_handler)
+                else:
+                    # the encoding detection requires the complete data
+                    csv_data = csv_file.read().splitlines()
             except OSError as error:
                 severe = self.reporter.severe(
                     'Problems with "%s" directive path:\n%s.'
@@ -386,20 +416,67 @@ class CSVTable(Table):
             raise SystemMessagePropagation(error)
         return csv_data, source
 
+    @staticmethod
+    def read_lines(csv_file):
+        """
+        Yield the lines of `csv_file` (a `FileInput` instance).
+
+        Same result as ``csv_file.read().splitlines()`` but the file is
+        read line by line (if the encoding is specified).
+        """
+        if not csv_file.encoding:
+            # the encoding detection requires the complete data
+            yield from csv_file.read().splitlines()
+            return
+        try:
+            for line in csv_file.source:
+                yield from line.splitlines()
+        finally:
+            csv_file.close()
+
+    def read_csv_rows(self, csv_data, dialect):
+        """
+        Return an iterator over the rows of `csv_data` (lists of cell strings).
+        """
+        return csv.reader((line + '\n' for line in csv_data),
+                          dialect=dialect)
+
+    def make_rows(self, rows, source, columns=0):
+        """
+        Yield the table data of `rows` (lists of cell strings).
+
+        Extend rows with less than `columns` cells with empty cells.
+        """
+        for row in rows:
+            row_data = [(0, 0, 0, statemachine.StringList(cell.splitlines(),
+                                                          source=source))
+                        for cell in row]
+            if len(row_data) < columns:
+                row_data.extend([(0, 0, 0, [])] * (columns - len(row_data)))
+            yield row_data
+
     def parse_csv_data_into_rows(self, csv_data, dialect, source):
-        csv_reader = csv.reader((line + '\n' for line in csv_data),
-                                dialect=dialect)
-        rows = []
-        max_cols = 0
-        for row in csv_reader:
-            row_data = []
-            for cell in row:
-                cell_data = (0, 0, 0, statemachine.StringList(
-                    cell.splitlines(), source=source))
-                row_data.append(cell_data)
-            rows.append(row_data)
-            max_cols = max(max_cols, len(row))
-        return rows, max_cols
+        rows = list(self.make_rows(self.read_csv_rows(csv_data, dialect),
+                                   source))
+        return rows, max(map(len, rows), default=0)
+
+
+class FileLines:
+
+    """
+    The lines of a text file, read line by line in every iteration
+    (cf. `CSVTable.read_lines()`).
+    """
+
+    def __init__(self, path, encoding, error_handler) -> None:
+        self.path = path
+        self.encoding = encoding
+        self.error_handler = error_handler
+
+    def __iter__(self):
+        return CSVTable.read_lines(FileInput(source_path=self.path,
+                                             encoding=self.encoding,
+                                             error_handler=self.error_handler))
 
 
 class ListTable(Table):
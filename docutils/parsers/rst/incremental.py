@@ -0,0 +1,195 @@
+# $Id$
+# Copyright: This module has been placed in the public domain.
+
+"""
+Incremental parsing of edited reStructuredText documents.
+
+`IncrementalParser` splits the input at section titles into chunks
+(like `docutils.parsers.rst.parallel`) and keeps the parse results of
+the chunks.  When it parses an edited version of the document, only
+chunks with changed text are parsed again.  Chunks moved by an edit
+changing the number of lines are re-used with adjusted line numbers
+(unless they contain lines inserted by an "include" directive).
+Chunks are also parsed again if a file they depend on (e.g. an included
+file) changed.  Chunks with errors (e.g. a missing included file) are
+not re-used.  Content read from URLs is not checked for changes.
+
+The result is identical to a serial parse: IDs, names, and substitution
+definitions are registered when the chunks are merged, absolute line
+numbers are shifted by the number of lines included in the preceding
+chunks (cf. `parallel`).  If the chunks cannot be merged into a
+document identical to a serial parse (cf. `parallel.parse()`), the
+document is parsed serially.
+
+Usage, e.g. for a live preview::
+
+    parser = IncrementalParser()
+    for source in edited_versions:
+        parts = docutils.core.publish_parts(source, parser=parser)
+
+Transforms and writers still process the complete document.
+
+Provisional.
+"""
+
+__docformat__ = 'reStructuredText'
+
+import os
+import pickle
+
+from docutils import nodes, statemachine
+from docutils.parsers import rst
+from docutils.parsers.rst import languages, parallel
+
+
+class IncrementalParser(rst.Parser):
+
+    """
+    The reStructuredText parser, re-using the results for unchanged parts
+    of the input from the previous run.
+    """
+
+    chunk_lines = 100
+    """Minimal number of lines in a chunk."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.chunk_cache = {}
+        """Parse results of the chunks of the last document.
+
+        Maps ``(lines, title_styles, level)`` to
+        ``(start, position, pickled result, dependencies)``.
+        `dependencies` maps the files the chunk depends on to their
+        modification time and size (cf. `file_stamps()`)."""
+
+        self.cache_context = None
+        """Source and settings of the last document."""
+
+    def parse_lines(self, inputlines, document) -> None:
+        if not self.parse_incremental(inputlines, document):
+            super().parse_lines(inputlines, document)
+
+    def parse_incremental(self, inputlines, document):
+        """
+        Parse `inputlines` into `document` re-using cached chunks.
+
+        Return False (leaving `document` unchanged) if the result would
+        differ from a serial parse.
+        """
+        if not parallel._precheck(self, inputlines):
+            return False
+        settings = document.settings
+        chunk_settings = settings.copy()
+        chunk_settings.warning_stream = None
+        chunk_settings.record_dependencies = None
+        source = document['source']
+        context = (source, dict(vars(chunk_settings)))
+        if context != self.cache_context:
+            self.chunk_cache.clear()
+            self.cache_context = context
+        titles = parallel.scan_titles(inputlines)
+        chunks = parallel.split(inputlines, titles, self.chunk_lines)
+        positions = parallel._positions(chunks, titles, source)
+        # as in `states.RSTStateMachine.run()`:
+        language = languages.get_language(settings.language_code,
+                                          document.reporter)
+        cache, self.chunk_cache = self.chunk_cache, {}
+        results = []
+        for (start, end, title_styles, level), position in zip(chunks,
+                                                               positions):
+            lines = tuple(inputlines[start:end])
+            key = (lines, tuple(title_styles), level)
+            result = None
+            if (key in cache
+                    and self.file_stamps(cache[key][3]) == cache[key][3]):
+                self.chunk_cache[key] = cache[key]
+                result = self.cached_result(cache[key], start, position)
+            if result is None:
+                try:
+                    result = parallel._parse_chunk(
+                        list(lines), start, chunk_settings, source,
+                        self.state_classes,
+                        self.initial_state if start == 0 else 'Body',
+                        list(title_styles), max(level - 1, 0), position)
+                except Exception:
+                    # e.g. `utils.SystemMessage` (cf. the "halt_level"
+                    # setting), let the serial parse raise it
+                    return False
+                dependencies = self.file_stamps(result['dependencies'])
+                if (result['max_level'] < 3
+                        and None not in dependencies.values()):
+                    self.chunk_cache[key] = (start, position,
+                                             pickle.dumps(result),
+                                             dependencies)
+            results.append(result)
+        assumptions = [chunk[2:] for chunk in chunks]
+        if not parallel._check(results, assumptions, document, language):
+            return False
+        parallel._merge(results, assumptions, document, self.statemachine)
+        return True
+
+    def cached_result(self, entry, start, position):
+        """
+        Return a copy of the cached chunk parse result `entry` for use at
+        line index `start` or None.
+        """
+        cached_start, cached_position, data, _dependencies = entry
+        result = pickle.loads(data)
+        # The first lookup of directives, roles, and language modules
+        # (in a process) may generate a system message.
+        if (result['directives'] or set(result['roles']) - {''}
+                or result['languages']):
+            return None
+        delta = start - cached_start
+        if not delta and position == cached_position:
+            return result
+        # The line numbers of included files do not change.  System
+        # messages without line number get the `position`.
+        if result['inserted'] or (
+                position is not None
+                and position[1] - cached_position[1] != delta):
+            return None
+
+        def moved(line):
+            return None if line is None else line + delta
+
+        chunk = result['document']
+        elements = list(chunk.findall(nodes.Element))
+        for message in chunk.parse_messages:
+            if message.parent is None:
+                elements.extend(message.findall(nodes.Element))
+        for node in elements:
+            node.line = moved(node.line)
+            if isinstance(node, nodes.system_message) and 'line' in node:
+                node['line'] = moved(node['line'])
+        chunk.registrations = [
+            (method, node, msgnode, anchor,
+             current and (current[0], moved(current[1])),
+             state and (*state[:3], moved(state[3])), messages,
+             (call_position[0], moved(call_position[1])), args)
+            for (method, node, msgnode, anchor, current, state, messages,
+                 call_position, args) in chunk.registrations]
+        if chunk.current_line is not None:
+            chunk.current_line += delta
+        result['line_offset'] += delta
+        lines = result['input_lines']
+        result['input_lines'] = statemachine.StringList(
+            lines.data, items=[(source, offset + delta)
+                               for source, offset in lines.items])
+        return result
+
+    @staticmethod
+    def file_stamps(paths):
+        """
+        Return a dictionary mapping `paths` to the modification time and
+        size of the files (None for files that cannot be accessed).
+        """
+        stamps = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except (OSError, ValueError):
+                stamps[path] = None
+            else:
+                stamps[path] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
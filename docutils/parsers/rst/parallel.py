@@ -0,0 +1,810 @@
+# $Id$
+# Copyright: This module has been placed in the public domain.
+
+"""
+Parse the sections of a long reStructuredText document in parallel.
+
+The input is pre-scanned for section titles (using the patterns of the
+`states.Body`, `states.Text`, and `states.Line` states).  It is split into
+chunks starting at section titles.  The chunks are parsed in a pool of
+worker processes (`concurrent.futures.ProcessPoolExecutor`) with the
+section title styles and section level expected at their start.
+The resulting subtrees and the document-level registries (footnotes,
+citations, pending transforms, ...) are merged into the target document.
+
+IDs, names, and substitution definitions are not registered in the
+workers: the calls of the registry methods are recorded (cf.
+`_ChunkDocument`) and repeated in the target document during the merge,
+in the order of a serial parse.  This generates the same IDs (including
+the numbers of automatic IDs), "dupnames" attributes, and system
+messages as a serial parse.  Absolute line numbers are marked in the
+workers (cf. `_line_mark`) and shifted by the number of lines that
+"include" directives insert in the preceding chunks during the merge.
+
+The result is identical to a serial parse.  Documents which define
+interpreted text roles are parsed serially (this is checked before
+any chunk is parsed).  Before anything is merged, the assumptions made
+for every chunk are checked against the results of the preceding
+chunks.  If a check fails, e.g. if an included file changes the
+section title styles, or if a worker fails, `parse()` returns False and
+the caller parses the document serially.
+
+Enable with the "parallel_sections" setting.  Provisional.
+"""
+
+__docformat__ = 'reStructuredText'
+
+import concurrent.futures
+import functools
+import io
+import re
+
+import docutils.languages
+from docutils import nodes, statemachine, utils
+from docutils.parsers.rst import directives, languages, roles, states
+from docutils.utils import column_width
+
+chunk_lines = 1000
+"""Minimal number of lines in a chunk parsed by a worker process."""
+
+chunks_per_worker = 4
+"""Target number of chunks per worker process (for load balancing)."""
+
+_in_worker = False
+# Set in worker processes to prevent nested parallel parsing.
+
+_body_transitions = [(name, re.compile(states.Body.patterns[name]))
+                     for name in states.Body.initial_transitions]
+_line_pattern = re.compile(states.Body.patterns['line'])
+_literal_end_pattern = re.compile(r'(?<!\\)(\\\\)*::$')
+_table_top_pattern = re.compile(states.Body.patterns['simple_table_top'])
+_role_pattern = re.compile(r'\.\. +(default-)?role::')
+_id_token = '\x00id'
+# Prefix of the temporary IDs of the nodes in a chunk.  The input of
+# a parallel parse does not contain null characters.
+_line_mark = 1 << 40
+# Added to the absolute line numbers of a chunk (the input offset of its
+# state machine).  Absolute line numbers differ from source line numbers
+# after lines inserted by the "include" directive.  Marking them
+# allows to shift them when the number of inserted lines is known.
+
+
+def parse(parser, inputlines, document, workers):
+    """
+    Parse `inputlines` into `document` with up to `workers` processes.
+
+    `parser` is the calling `docutils.parsers.rst.Parser` instance.
+    Return False (leaving `document` unchanged) if the document is too
+    short or cannot be parsed in parallel with a result identical to a
+    serial parse.
+    """
+    if _in_worker or not _precheck(parser, inputlines):
+        return False
+    titles = scan_titles(inputlines)
+    size = max(chunk_lines, len(inputlines) // (workers * chunks_per_worker))
+    chunks = split(inputlines, titles, size)
+    if len(chunks) < 2:
+        return False
+    settings = document.settings
+    # as in `states.RSTStateMachine.run()`:
+    language = languages.get_language(settings.language_code,
+                                      document.reporter)
+    worker_settings = settings.copy()
+    worker_settings.warning_stream = None
+    worker_settings.record_dependencies = None
+    source = document['source']
+    positions = _positions(chunks, titles, source)
+    initargs = (settings.language_code, dict(directives._directives),
+                dict(roles._roles),
+                list(docutils.languages.get_language.cache))
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+                 max_workers=workers, initializer=_init_worker,
+                 initargs=initargs) as executor:
+            futures = [executor.submit(
+                           _parse_chunk, inputlines[start:end], start,
+                           worker_settings, source, parser.state_classes,
+                           parser.initial_state if start == 0 else 'Body',
+                           title_styles, max(level - 1, 0), position)
+                       for (start, end, title_styles, level), position
+                       in zip(chunks, positions)]
+            results = [future.result() for future in futures]
+    except Exception:
+        return False
+    assumptions = [chunk[2:] for chunk in chunks]
+    if not _check(results, assumptions, document, language):
+        return False
+    _merge(results, assumptions, document, parser.statemachine)
+    return True
+
+
+def _precheck(parser, inputlines):
+    # Return False, if parsing `inputlines` in chunks cannot give the
+    # same result as a serial parse.  Cheap checks before any parsing.
+    # Interpreted text roles defined in one chunk are unknown to the
+    # following chunks (roles defined in nested content are detected
+    # by `_check()`).
+    return parser.inliner is None and not any(
+        '\x00' in line or _role_pattern.match(line) for line in inputlines)
+
+
+def scan_titles(lines):
+    """
+    Return a list of ``(index, style)`` tuples for the section titles
+    starting a block of text at the top indentation level of `lines`.
+
+    `index` is the index of the title's first line (the overline, if
+    there is one), `style` is the title style as stored by
+    `states.RSTState.check_subsection()`.
+
+    Titles in places where the scanner cannot tell whether they are
+    parsed as section titles (e.g. in simple tables or after a
+    paragraph ending with "::") are skipped.
+    """
+    titles = []
+    limit = len(lines)
+    i = 0
+    block_start = True  # at the start of a block of text?
+    literal_next = False  # a literal block may follow?
+    while i < limit:
+        line = lines[i]
+        if not line.strip():
+            block_start = True
+            i += 1
+            continue
+        if literal_next:
+            literal_next = False
+            if line[0] != ' ':  # quoted literal block (or warning)
+                block_start = False
+                i += 1
+                continue
+        if _table_top_pattern.match(line):
+            # a simple table (or a table border in a paragraph)
+            i = _simple_table_end(lines, i) + 1
+            block_start = False
+            continue
+        if not block_start or line[0] == ' ':
+            block_start = False
+            literal_next = bool(_literal_end_pattern.search(line))
+            i += 1
+            continue
+        block_start = False
+        transition = _first_transition(line)
+        if transition == 'enumerator' and i + 1 < limit:
+            # not a list item if followed by an underline
+            # (cf. `states.Body.is_enumerated_list_item()`)
+            if _line_pattern.match(lines[i+1]):
+                transition = 'text'
+        if transition == 'text':
+            if (i + 1 < limit and _line_pattern.match(lines[i+1])
+                    and _is_title(line, lines[i+1])):
+                titles.append((i, lines[i+1][0]))
+                block_start = True
+                i += 2
+                continue
+            while i + 1 < limit and lines[i+1].strip():  # paragraph
+                i += 1
+            literal_next = bool(_literal_end_pattern.search(lines[i]))
+        elif transition == 'line':
+            if (i + 2 < limit and lines[i+1].strip()
+                    and not _line_pattern.match(lines[i+1])
+                    and lines[i+2].rstrip() == line.rstrip()
+                    and _is_title(lines[i+1], line)):
+                titles.append((i, (line[0], line[0])))
+                block_start = True
+                i += 3
+                continue
+            literal_next = line.strip() == '::'
+        i += 1
+    return titles
+
+
+def _first_transition(line):
+    # Return the name of the first `states.Body` transition matching `line`.
+    for name, pattern in _body_transitions:
+        if pattern.match(line):
+            return name
+
+
+def _is_title(title, underline):
+    # Cf. `states.Text.underline()` and `states.Line.text()`.
+    underline = underline.rstrip()
+    return (column_width(title.rstrip()) <= len(underline)
+            or len(underline) >= 4)
+
+
+def _simple_table_end(lines, start):
+    # Return the index of the last line of the simple table starting at
+    # `start` (cf. `states.Body.isolate_simple_table()`).
+    limit = len(lines) - 1
+    toplen = len(lines[start].strip())
+    found = 0
+    for i in range(start + 1, limit + 1):
+        line = lines[i]
+        if states.Body.simple_table_border_pat.match(line):
+            if len(line.strip()) != toplen:
+                return i
+            found += 1
+            if found == 2 or i == limit or not lines[i+1].strip():
+                return i
+    return limit
+
+
+def split(lines, titles, size):
+    """
+    Return a list of chunks of `lines` for parsing in parallel.
+
+    `titles` is the result of `scan_titles()`.  Chunks are
+    ``(start, end, title_styles, level)`` tuples: the slice of `lines`,
+    the list of title styles in use before `start`, and the section
+    level of the title at `start` (0 for the first chunk).
+
+    Every chunk (but the first) starts with a section title.  It must
+    not contain a section title of a higher level (lower number) than
+    the first one.  Chunks have at least `size` lines.
+    """
+    # title styles in order of appearance (cf. `check_subsection()`)
+    title_styles = []
+    marks = []  # (index, level, number of title styles before index)
+    for index, style in titles:
+        known = len(title_styles)
+        if style not in title_styles:
+            title_styles.append(style)
+        marks.append((index, title_styles.index(style) + 1, known))
+    # split at the titles of the highest levels with sections of about
+    # `size` lines:
+    max_level = 1
+    while (max_level < len(title_styles)
+           and len(lines) > size * sum(level <= max_level
+                                       for _index, level, _known in marks)):
+        max_level += 1
+    chunks = [[0, len(lines), [], 0]]
+    for index, level, known in marks:
+        start, _end, _styles, start_level = chunks[-1]
+        if level > max_level or index == start:
+            continue
+        if level < start_level or index - start >= size:
+            chunks[-1][1] = index
+            chunks.append([index, len(lines), title_styles[:known], level])
+    if len(chunks) > 1:
+        last = chunks[-1]
+        if last[1] - last[0] < size // 2 and chunks[-2][3] <= last[3]:
+            # avoid a short last chunk
+            del chunks[-1]
+            chunks[-1][1] = last[1]
+    return [tuple(chunk) for chunk in chunks]
+
+
+def _positions(chunks, titles, source):
+    # Return the `(source, line)` tuples used for system messages without
+    # line number in the `chunks` (or None).
+    # Messages without line number get the position of the top-level
+    # state machine, i.e. the underline of the enclosing top-level
+    # section title in chunks starting with a subsection.
+    positions = []
+    for start, _end, _styles, level in chunks:
+        underlines = [index + len(style) for index, style in titles
+                      if index < start and style == titles[0][1]]
+        positions.append((source, underlines[-1] + 1) if level > 1 else None)
+    return positions
+
+
+class _ChunkStateMachine(states.RSTStateMachine):
+    """
+    Parse a chunk with the title styles and section level of its context.
+    """
+
+    def __init__(self, title_styles, section_level, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.title_styles = title_styles
+        self.section_level = section_level
+        self.title_messages = None
+        """Number of system messages reported before the first section
+        title was checked.  In a serial parse, a section title following
+        a section of the same or a lower level is examined twice (cf.
+        `states.RSTState.check_subsection()`)."""
+        for state in self.states.values():
+            state.check_subsection = functools.partial(
+                self.check_title, state.check_subsection)
+
+    def check_title(self, check_subsection, *args):
+        if self.title_messages is None:
+            self.title_messages = len(self.document.parse_messages)
+        return check_subsection(*args)
+
+    def runtime_init(self) -> None:
+        super().runtime_init()
+        self.memo.title_styles = self.title_styles
+        self.memo.section_level = self.section_level
+
+
+class _ChunkDocument(nodes.document):
+    """
+    Document for a chunk parsed in a worker process.
+
+    The registry methods for IDs, names, and substitution definitions
+    only record their calls.  The calls are repeated in the target
+    document when the chunks are merged (cf. `_register()`).
+    Nodes get temporary IDs.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.registrations = []
+        """Recorded calls of the registry methods: ``(method, node,
+        msgnode, anchor, current, state, messages, position, args)``
+        tuples.
+
+        `anchor` is the last child of `msgnode`, `current` the current
+        source and line of the document (or None if `msgnode` is not
+        part of the document), `state` the tuple ``(names, ids, source,
+        line)`` of `node` (cf. `get_source_line()`), `messages` the number
+        of parse messages, and `position` the position of the state
+        machine at the time of the call."""
+
+        self.reported_texts = {}
+        """The text of the parse messages (without the source and line)
+        at the time they were reported, by index in `parse_messages`.
+        Children may be added to a message after it was reported."""
+
+    def note_parse_message(self, message) -> None:
+        self.reported_texts[len(self.parse_messages)] = (
+            nodes.Element.astext(message))
+        super().note_parse_message(message)
+
+    def record(self, method, node, msgnode, *args) -> None:
+        """Record a call of the registry `method`."""
+        if msgnode is not None and len(msgnode):
+            anchor = msgnode[-1]
+        else:
+            anchor = None
+        if msgnode is not None and msgnode.document is not None:
+            # set by `nodes.Element.setup_child()` for new messages
+            current = (self.current_source, self.current_line)
+        else:
+            current = None
+        if node is None:
+            state = None
+        else:
+            state = (tuple(node['names']), tuple(node['ids']),
+                     *utils.get_source_line(node))
+        self.registrations.append(
+            (method, node, msgnode, anchor, current, state,
+             len(self.parse_messages), self.reporter.get_source_and_line(),
+             args))
+
+    def set_id(self, node, msgnode=None, suggested_prefix=''):
+        token = None
+        if not node['ids']:
+            token = f'{_id_token}{len(self.registrations)}'
+        self.record('set_id', node, msgnode, suggested_prefix, token)
+        if token:
+            node['ids'].append(token)
+            self.ids[token] = node
+        return node['ids'][-1]
+
+    def set_name_id_map(self, node, id, msgnode=None, explicit=False) -> None:
+        self.record('set_name_id_map', node, msgnode, id, explicit)
+        for name in node['names']:
+            self.nameids.setdefault(name, id)
+
+    def note_substitution_def(self, subdef, def_name, msgnode=None) -> None:
+        self.record('note_substitution_def', subdef, msgnode, def_name)
+
+    def has_name(self, name) -> bool:
+        # The answer may differ in the target document (cf. `_check()`).
+        found = name in self.nameids
+        self.record('has_name', None, None, name, found)
+        return found
+
+
+def _init_worker(language_code, directive_cache, role_cache, language_codes):
+    # Initialize a worker process.
+    # Fill the caches of directives, roles, and language modules like in
+    # the calling process (without generating system messages).
+    global _in_worker
+    _in_worker = True
+    directives._directives.update(directive_cache)
+    roles._roles.update(role_cache)
+    languages.get_language(language_code)
+    for code in language_codes:
+        docutils.languages.get_language(code)
+
+
+def _parse_chunk(lines, offset, settings, source, state_classes,
+                 initial_state, title_styles, section_level, position):
+    # Parse a chunk of lines in a worker process.
+    # Return a dictionary with the chunk's document and parse results.
+    # System messages are written to the warning stream by `_merge()`.
+    settings.warning_stream = io.StringIO()
+    settings.record_dependencies = utils.DependencyList()
+    reporter = utils.new_reporter(source, settings)
+    document = _ChunkDocument(settings, reporter, source=source)
+    document.note_source(source, -1)
+    reporter.attach_observer(document.note_parse_message)
+    known_directives = set(directives._directives)
+    known_roles = roles._roles.copy()
+    known_languages = set(docutils.languages.get_language.cache)
+    machine = _ChunkStateMachine(
+        title_styles, section_level, state_classes=state_classes,
+        initial_state=initial_state, debug=reporter.debug_flag)
+    input_lines = statemachine.StringList(
+        lines, items=[(source, offset + i) for i in range(len(lines))])
+    if position is not None:
+        def get_source_and_line(lineno=None):
+            if lineno is None:
+                return position
+            return machine.get_source_and_line(lineno)
+        reporter.get_source_and_line = get_source_and_line
+    try:
+        machine.run(input_lines, document, input_offset=offset + _line_mark)
+    finally:
+        # restore the caches for the next chunk
+        new_directives = {name: directives._directives.pop(name)
+                          for name in set(directives._directives)
+                          - known_directives}
+        new_roles = {name: role for name, role in roles._roles.items()
+                     if known_roles.get(name) is not role}
+        roles._roles.clear()
+        roles._roles.update(known_roles)
+        new_languages = (set(docutils.languages.get_language.cache)
+                         - known_languages)
+        for code in new_languages:
+            del docutils.languages.get_language.cache[code]
+    return {'document': document,
+            'transforms': document.transformer.transforms,
+            'input_lines': machine.input_lines,
+            'complete': machine.line_offset >= len(machine.input_lines),
+            'inserted': len(machine.input_lines) - len(lines),
+            'line_offset': machine.abs_line_offset(),
+            'title_messages': machine.title_messages or 0,
+            'title_styles': title_styles,
+            'max_level': reporter.max_level,
+            'dependencies': settings.record_dependencies.list,
+            'directives': new_directives,
+            'roles': {name: _canonical_role(role)
+                      for name, role in new_roles.items()},
+            'languages': new_languages,
+            }
+
+
+def _canonical_role(role):
+    # Return the canonical name of a registered role function or None.
+    for name, registered in roles._role_registry.items():
+        if registered is role:
+            return name
+    return None
+
+
+def _check(results, assumptions, document, language):
+    # Return True, if merging the `results` into `document` gives the
+    # same document as a serial parse.
+    title_styles = []
+    depth = 0  # number of open sections
+    names = set(document.nameids)
+    directive_messages, role_messages, language_modules = set(), set(), set()
+    for n, (result, (styles, level)) in enumerate(zip(results, assumptions)):
+        chunk = result['document']
+        if not result['complete'] or styles != title_styles:
+            return False
+        if n:
+            # the chunk continues the document with (sub)sections
+            if (level > depth + 1 or not len(chunk)
+                    or not all(isinstance(child, nodes.section)
+                               for child in chunk.children)):
+                return False
+            depth = level - 1
+        depth += len(_open_sections(chunk))
+        title_styles = result['title_styles']
+        # All IDs must be registered by the chunk document (not, e.g.,
+        # by the document of a custom parser, cf. "include" directive).
+        if not all(id.startswith(_id_token) for id in chunk.ids):
+            return False
+        # Names in use include the names registered in the preceding
+        # chunks.  If a name is in use, the "contents" directive does not
+        # give it to the next registered node (cf. `_register()`).
+        registrations = chunk.registrations
+        for i, registration in enumerate(registrations):
+            method, state, args = (registration[0], registration[5],
+                                   registration[-1])
+            if method == 'set_name_id_map':
+                names.update(state[0])
+            elif method == 'has_name' and (args[0] in names) != args[1]:
+                if (i + 1 == len(registrations)
+                        or registrations[i+1][0] != 'set_id'
+                        or registrations[i+1][5][0][-1:] != (args[0],)):
+                    return False
+        # Custom roles and the default role must be known to all chunks.
+        if (None in result['roles'].values()
+            or result['roles'].get('', roles.DEFAULT_INTERPRETED_ROLE)
+                != roles.DEFAULT_INTERPRETED_ROLE):
+            return False
+        # Roles, directives, and language modules are looked up once per
+        # process.  Only the first lookup may generate a system message.
+        messages = {name for name in result['directives']
+                    if name not in getattr(language, 'directives', {})}
+        if not directive_messages.isdisjoint(messages):
+            return False
+        directive_messages.update(messages)
+        messages = {name for name in result['roles']
+                    if name and name not in getattr(language, 'roles', {})}
+        if not role_messages.isdisjoint(messages):
+            return False
+        role_messages.update(messages)
+        modules = result['languages'] - {'en'}
+        if not language_modules.isdisjoint(modules):
+            return False
+        language_modules.update(modules)
+    return True
+
+
+def _open_sections(node):
+    # Return the sections which would contain text following `node`.
+    sections = []
+    while len(node) and isinstance(node[-1], nodes.section):
+        node = node[-1]
+        sections.append(node)
+    return sections
+
+
+def _merge(results, assumptions, document, machine):
+    # Merge the `results` of `_parse_chunk()` into `document`.
+    reporter = document.reporter
+    open_sections = [document]
+    lines, items = [], []
+    shift = 0  # number of lines inserted in the preceding chunks
+    for result, (_styles, level) in zip(results, assumptions):
+        chunk = result['document']
+        # registries and system messages
+        # (the first title is examined twice after a section of the
+        # same or a lower level)
+        repeated = level and level < len(open_sections)
+        ids = _register(result, document, shift, items, repeated)
+        _finish(chunk, ids, shift)
+        # document tree
+        if level:
+            del open_sections[level:]
+        container = open_sections[-1]
+        # keep missing source and line (cf. `nodes.Element.setup_child()`)
+        document.current_source = document.current_line = None
+        container.extend(chunk.children)
+        open_sections.extend(_open_sections(container))
+        for name, value in chunk.attributes.items():
+            if name not in nodes.Element.basic_attributes + ('source',):
+                document[name] = value
+        if chunk.decoration is not None:
+            document.decoration = chunk.decoration
+        document.current_source = chunk.current_source
+        document.current_line = chunk.current_line
+        for name in ('refnames', 'refids', 'footnote_refs', 'citation_refs'):
+            registry = getattr(document, name)
+            for key, value in getattr(chunk, name).items():
+                registry.setdefault(ids.get(key, key), []).extend(value)
+        for name in ('indirect_targets', 'autofootnotes', 'autofootnote_refs',
+                     'symbol_footnotes', 'symbol_footnote_refs', 'footnotes',
+                     'citations'):
+            getattr(document, name).extend(getattr(chunk, name))
+        for priority_string, transform_class, pending, kwargs in (
+                result['transforms']):
+            priority = int(priority_string.split('-')[0])
+            if pending is None:
+                document.transformer.add_transform(transform_class, priority,
+                                                   **kwargs)
+            else:
+                document.transformer.add_pending(pending, priority)
+        reporter.max_level = max(reporter.max_level, result['max_level'])
+        if result['dependencies']:
+            document.settings.record_dependencies.add(
+                *result['dependencies'])
+        # process-wide caches
+        directives._directives.update(result['directives'])
+        for name, canonical_name in result['roles'].items():
+            roles.register_local_role(name,
+                                      roles._role_registry[canonical_name])
+        for code in result['languages']:
+            docutils.languages.get_language(code)
+        lines.extend(result['input_lines'].data)
+        items.extend(result['input_lines'].items)
+        line_offset = result['line_offset'] + shift - _line_mark
+        shift += result['inserted']
+    # let the reporter determine source and line like after a serial parse
+    machine.input_lines = statemachine.StringList(lines, items=items)
+    machine.input_offset = 0
+    # every enclosing state machine advances one line at the end
+    machine.line_offset = line_offset + max(level - 1, 0)
+    if not hasattr(reporter, 'get_source_and_line'):
+        reporter.get_source_and_line = machine.get_source_and_line
+
+
+class _MessageList(list):
+    """Collects the system messages a registry method adds to `msgnode`."""
+
+    def __iadd__(self, message):
+        self.append(message)
+        return self
+
+
+def _register(result, document, shift, items, repeated=False):
+    # Repeat the calls of the registry methods recorded in the chunk
+    # (cf. `_ChunkDocument`) in `document` and report the system
+    # messages of the chunk in between, like a serial parse.
+    # `items` are the source and offset of the preceding input lines.
+    # If `repeated` is true, report copies of the messages of the first
+    # section title first (cf. `_ChunkStateMachine.title_messages`).
+    # Return a dictionary mapping the temporary IDs to the IDs.
+    chunk = result['document']
+    chunk_items = result['input_lines'].items
+    ids = {}
+    registered = {}  # registered nodes with their names and temporary IDs
+    inserted = set()  # system messages inserted by the registry methods
+    dropped = {}  # names not given to a node because they are in use
+    name_in_use = None
+    reported = 0
+
+    def get_source_and_line(lineno=None):
+        # Cf. `statemachine.StateMachine.get_source_and_line()` of the
+        # top-level state machine.
+        if lineno is None:
+            return position  # at the time of the call
+        offset = lineno - 1 - len(items)
+        if offset < 0:
+            source, line = items[lineno - 1]
+        elif offset < len(chunk_items):
+            source, line = chunk_items[offset]
+        elif offset == len(chunk_items):  # just past the end
+            source, line = chunk_items[-1]
+            return source, line + 2
+        else:
+            return None, None
+        return source, line + 1
+
+    reporter = document.reporter
+    saved = vars(reporter).get('get_source_and_line')
+    reporter.get_source_and_line = get_source_and_line
+    try:
+        if repeated:
+            # not attached to the document tree (cf. `universal.Messages`)
+            copies = [chunk.parse_messages[i].deepcopy()
+                      for i in range(result['title_messages'])]
+            _report(copies, 0, len(copies), reporter, shift,
+                    chunk.reported_texts)
+        for (method, node, msgnode, anchor, current, state, messages,
+             position, args) in chunk.registrations:
+            reported = _report(chunk.parse_messages, reported, messages,
+                               reporter, shift, chunk.reported_texts)
+            if node is None:  # `has_name()`, cf. `_check()`
+                name, found = args
+                if found != (name in document.nameids):
+                    name_in_use = name
+                continue
+            registered.setdefault(id(node),
+                                  (node, node['names'], node['ids']))
+            if name_in_use is not None:
+                registered[id(node)][1].remove(name_in_use)
+                dropped.setdefault(id(node), set()).add(name_in_use)
+                name_in_use = None
+            # let the node have the state at the time of the call
+            # (without the names made duplicate names since):
+            names, node_ids, source, line = state
+            excluded = set(node['dupnames']).union(dropped.get(id(node), ()))
+            node['names'] = [name for name in names if name not in excluded]
+            node['ids'] = [ids.get(i, i) for i in node_ids]
+            saved_state = node.source, node.line, node.parent
+            node.source, node.line = source, _shifted(line, shift)
+            if source is None and line is None:
+                node.parent = None
+            msglist = None if msgnode is None else _MessageList()
+            if method == 'set_id':
+                suggested_prefix, token = args
+                new_id = document.set_id(node, msglist, suggested_prefix)
+                if token:
+                    ids[token] = new_id
+            elif method == 'set_name_id_map':
+                new_id, explicit = args
+                document.set_name_id_map(node, ids.get(new_id, new_id),
+                                         msglist, explicit)
+            else:
+                document.note_substitution_def(node, args[0], msglist)
+            node.source, node.line, node.parent = saved_state
+            if msglist:
+                if current is not None:
+                    for message in msglist:
+                        if message.source is None:
+                            message.source = current[0]
+                        if message.line is None:
+                            message.line = _shifted(current[1], shift)
+                _insert_messages(msgnode, anchor, msglist, inserted)
+        _report(chunk.parse_messages, reported, len(chunk.parse_messages),
+                reporter, shift, chunk.reported_texts)
+    finally:
+        if saved is None:
+            del reporter.get_source_and_line
+        else:
+            reporter.get_source_and_line = saved
+    for node, names, node_ids in registered.values():
+        dupnames = node['dupnames']
+        node['names'] = [name for name in names if name not in dupnames]
+        node['ids'] = [ids.get(i, i) for i in node_ids]
+    return ids
+
+
+def _report(messages, start, stop, reporter, shift, texts):
+    # Report the system messages ``messages[start:stop]`` of a chunk like
+    # `utils.Reporter.system_message()` and return `stop`.
+    # `texts` maps indices to the text of the messages when reported.
+    for index in range(start, stop):
+        message = messages[index]
+        _shift_line(message, shift)
+        level = message['level']
+        if reporter.stream and (level >= reporter.report_level
+                                or reporter.debug_flag
+                                and level == reporter.DEBUG_LEVEL):
+            text = texts.get(index)
+            if text is None:
+                text = message.astext()
+            else:  # cf. `nodes.system_message.astext()`
+                text = '%s:%s: (%s/%s) %s' % (
+                    message['source'], message.get('line', ''),
+                    message['type'], level, text)
+            reporter.stream.write(text + '\n')
+        reporter.notify_observers(message)
+    return stop
+
+
+def _insert_messages(parent, anchor, messages, inserted):
+    # Insert the system `messages` into `parent` after `anchor` and the
+    # messages inserted after `anchor` before, like appending them at
+    # the time of the registry method's call.
+    try:
+        index = 0 if anchor is None else parent.index(anchor) + 1
+    except ValueError:
+        index = len(parent)
+    while index < len(parent) and id(parent[index]) in inserted:
+        index += 1
+    for message in messages:
+        parent.insert(index, message)
+        inserted.add(id(message))
+        index += 1
+
+
+def _shifted(line, shift):
+    # Return `line` with a marked absolute line number replaced
+    # (cf. `_line_mark`).
+    if line is not None and line >= _line_mark:
+        return line + shift - _line_mark
+    return line
+
+
+def _shift_line(node, shift):
+    # Replace marked absolute line numbers in `node`.
+    node.line = _shifted(node.line, shift)
+    if isinstance(node, nodes.system_message) and 'line' in node:
+        node['line'] = _shifted(node['line'], shift)
+
+
+def _finish(chunk, ids, shift):
+    # Replace the temporary IDs and the marked absolute line numbers in
+    # the nodes of `chunk`.
+    def replace(values):
+        # Replace temporary IDs in the items of the dictionary `values`.
+        for key, value in values.items():
+            if isinstance(value, str):
+                if value in ids:
+                    values[key] = ids[value]
+            elif isinstance(value, list):
+                if any(isinstance(item, str) and item in ids
+                       for item in value):
+                    values[key] = [ids.get(item, item)
+                                   if isinstance(item, str) else item
+                                   for item in value]
+
+    elements = list(chunk.findall(nodes.Element))
+    for message in chunk.parse_messages:
+        if message.parent is None:
+            elements.extend(message.findall(nodes.Element))
+    for node in elements:
+        _shift_line(node, shift)
+        if ids:
+            replace(node.attributes)
+            if isinstance(node, nodes.pending):
+                replace(node.details)
@@ -201,6 +201,19 @@ class NestedStateMachine(StateMachineWS):
                                'empty!')
         return results
 
+    def clear(self) -> None:
+        """
+        Remove references to the document and input of the last run.
+
+        Called before the state machine is returned to the pool of
+        `RSTState.nested_list_parse()`.
+        """
+        self.memo = self.document = self.reporter = self.node = None
+        self.input_lines = self.line = None
+        for state in self.states.values():
+            state.memo = state.document = state.reporter = None
+            state.inliner = state.parent = None
+
 
 class RSTState(StateWS):
 
@@ -212,6 +225,9 @@ class RSTState(StateWS):
 
     nested_sm = NestedStateMachine
     nested_sm_cache = []
+    nested_list_sm_cache = {}
+    """Pools of state machines for `nested_list_parse()`, keyed by
+    state machine class, state classes, initial state, and debug flag."""
 
     def __init__(self, state_machine, debug=False) -> None:
         self.nested_sm_kwargs = {'state_classes': state_classes,
@@ -304,14 +320,25 @@ class RSTState(StateWS):
         Create a new StateMachine rooted at `node` and run it over the input
         `block`. Also keep track of optional intermediate blank lines and the
         required final one.
+
+        With the default `state_machine_kwargs`, the StateMachine is taken
+        from (and returned to) a pool instead of being created anew.
         """
         if state_machine_class is None:
             state_machine_class = self.nested_sm
+        pool = None
         if state_machine_kwargs is None:
             state_machine_kwargs = self.nested_sm_kwargs.copy()
+            pool = self.nested_list_sm_cache.setdefault(
+                (state_machine_class,
+                 tuple(state_machine_kwargs['state_classes']),
+                 initial_state, self.debug), [])
         state_machine_kwargs['initial_state'] = initial_state
-        state_machine = state_machine_class(debug=self.debug,
-                                            **state_machine_kwargs)
+        if pool:
+            state_machine = pool.pop()
+        else:
+            state_machine = state_machine_class(debug=self.debug,
+                                                **state_machine_kwargs)
         if blank_finish_state is None:
             blank_finish_state = initial_state
         state_machine.states[blank_finish_state].blank_finish = blank_finish
@@ -320,8 +347,16 @@ class RSTState(StateWS):
         state_machine.run(block, input_offset, memo=self.memo,
                           node=node, match_titles=match_titles)
         blank_finish = state_machine.states[blank_finish_state].blank_finish
-        state_machine.unlink()
-        return state_machine.abs_line_offset(), blank_finish
+        new_offset = state_machine.abs_line_offset()
+        if pool is None:
+            state_machine.unlink()
+        else:
+            # Do not leak settings or document references into later runs:
+            for key in extra_settings:
+                delattr(state_machine.states[initial_state], key)
+            state_machine.clear()
+            pool.append(state_machine)
+        return new_offset, blank_finish
 
     def section(self, title, source, style, lineno, messages) -> None:
         """Check for a valid subsection and create one if it checks out."""
@@ -472,7 +507,47 @@ class Inliner:
         """List of (pattern, bound method) tuples, used by
         `self.implicit_inline`."""
 
+        self.prescan_dispatch = []
+        """Copy of `self.implicit_dispatch` when the prescan patterns
+        were compiled.  Text without a match for `self.patterns.prescan`
+        is only returned unchanged if `self.implicit_dispatch` is equal.
+        """
+
+    compiled_patterns = {}
+    """Cache of `compile_patterns()` results, keyed by `Inliner` class and
+    the values of the relevant settings (see `init_customizations()`)."""
+
     def init_customizations(self, settings) -> None:
+        key = (self.__class__,
+               bool(getattr(settings, 'character_level_inline_markup',
+                            False)),
+               bool(settings.pep_references),
+               bool(settings.rfc_references))
+        if key not in Inliner.compiled_patterns:
+            Inliner.compiled_patterns[key] = self.compile_patterns(settings)
+        (self.start_string_prefix, self.end_string_suffix, self.parts,
+         self.patterns) = Inliner.compiled_patterns[key]
+
+        implicit = [(self.patterns.uri, self.standalone_uri)]
+        if settings.pep_references:
+            implicit.append((self.patterns.pep, self.pep_reference))
+        if settings.rfc_references:
+            implicit.append((self.patterns.rfc, self.rfc_reference))
+        # Do not add the same entries again (Inliner used for several
+        # documents):
+        self.implicit_dispatch.extend(entry for entry in implicit
+                                      if entry not in self.implicit_dispatch)
+        self.prescan_dispatch = self.implicit_dispatch.copy()
+
+    def compile_patterns(self, settings):
+        """
+        Return the inline markup patterns for `settings`.
+
+        Return a tuple: start-string prefix, end-string suffix, definition
+        of the initial pattern (see `build_regexp()`), and a `Struct` of
+        compiled patterns.  The result is shared by all instances of the
+        class (don't modify it).
+        """
         # lookahead and look-behind expressions for inline markup rules
         if getattr(settings, 'character_level_inline_markup', False):
             start_string_prefix = '(^|(?<!\x00))'
@@ -516,11 +591,7 @@ class Inliner:
              )
             ]
         )
-        self.start_string_prefix = start_string_prefix
-        self.end_string_suffix = end_string_suffix
-        self.parts = parts
-
-        self.patterns = Struct(
+        patterns = Struct(
           initial=build_regexp(parts),
           emphasis=re.compile(self.non_whitespace_escape_before
                               + r'(\*)' + end_string_suffix),
@@ -606,14 +677,17 @@ class Inliner:
                 (RFC(-|\s+)?(?P<rfcnum>\d+))
                 %(end_string_suffix)s""" % args, re.VERBOSE))
 
-        self.implicit_dispatch.append((self.patterns.uri,
-                                       self.standalone_uri))
+        # Strings required by the patterns in `self.implicit_dispatch`
+        # and (with escapes and inline markup start-strings) by
+        # `self.patterns.initial`, cf. `parse()` and `implicit_inline()`:
+        implicit_prescan = '[:@]'  # standalone URI or email address
         if settings.pep_references:
-            self.implicit_dispatch.append((self.patterns.pep,
-                                           self.pep_reference))
+            implicit_prescan += '|pep-|PEP'
         if settings.rfc_references:
-            self.implicit_dispatch.append((self.patterns.rfc,
-                                           self.rfc_reference))
+            implicit_prescan += '|RFC'
+        patterns.implicit_prescan = re.compile(implicit_prescan)
+        patterns.prescan = re.compile(r'[\\*`_|]|' + implicit_prescan)
+        return start_string_prefix, end_string_suffix, parts, patterns
 
     def parse(self, text, lineno, memo, parent):
         # Needs to be refactored for nested inline markup.
@@ -638,6 +712,10 @@ class Inliner:
         self.document = memo.document
         self.language = memo.language
         self.parent = parent
+        if (self.patterns.prescan.search(text) is None
+            and self.implicit_dispatch == self.prescan_dispatch):
+            # plain text: no escapes, no inline markup
+            return ([nodes.Text(text)] if text else []), []
         pattern_search = self.patterns.initial.search
         dispatch = self.dispatch
         remaining = escape2null(text)
@@ -1039,6 +1117,9 @@ class Inliner:
         """
         if not text:
             return []
+        if (self.patterns.implicit_prescan.search(text) is None
+            and self.implicit_dispatch == self.prescan_dispatch):
+            return [nodes.Text(text)]
         for pattern, method in self.implicit_dispatch:
             match = pattern.search(text)
             if match:
@@ -1163,6 +1244,10 @@ class Body(RSTState):
           'line',
           'text')
 
+    nontext_pattern = None
+    """Combined pattern of the initial transitions except "text";
+    set by `plain_paragraph()`."""
+
     def indent(self, match, context, next_state):
         """Block quote."""
         (indented, indent, line_offset, blank_finish
@@ -1835,10 +1920,49 @@ class Body(RSTState):
             entry = nodes.entry(**attributes)
             row += entry
             if ''.join(cellblock):
-                self.nested_parse(cellblock, input_offset=tableline+offset,
-                                  node=entry)
+                paragraph = self.plain_paragraph(cellblock)
+                if paragraph is None:
+                    self.nested_parse(cellblock,
+                                      input_offset=tableline+offset,
+                                      node=entry)
+                else:
+                    entry += paragraph
         return row
 
+    def plain_paragraph(self, block):
+        """
+        Return a paragraph for a `block` with one line of plain text or None.
+
+        Shortcut for the `nested_parse()` of table cells.  Plain text
+        does not start a body element (other than a paragraph) and
+        contains no inline markup, so the result is the same.
+        """
+        if (len(block) != 1
+            or self.nested_sm is not NestedStateMachine
+            or self.nested_sm_kwargs != {'state_classes': state_classes,
+                                         'initial_state': 'Body'}):
+            return None
+        if Body.nontext_pattern is None:
+            patterns = tuple(re.compile(Body.patterns[name])
+                             for name in Body.initial_transitions[:-1])
+            Body.nontext_pattern = self.make_transition_prefilter(patterns)[0]
+        text = block[0]
+        if (text != text.strip() or text.endswith('::')
+            or Body.nontext_pattern.match(text)):
+            return None
+        inliner = self.inliner
+        if (inliner.patterns.prescan.search(text) is not None
+            or inliner.implicit_dispatch != inliner.prescan_dispatch):
+            return None
+        source, offset = block.info(0)
+        if offset is None:
+            return None
+        paragraph = nodes.paragraph(text, '', nodes.Text(text))
+        paragraph.source, paragraph.line = source, offset + 1
+        # like the nested state machine at the end of `block`:
+        self.document.note_source(source, None)
+        return paragraph
+
     explicit = Struct()
     """Patterns and constants used for explicit markup recognition."""
 
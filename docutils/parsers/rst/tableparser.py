@@ -20,10 +20,12 @@ and produce a well-formed data structure suitable for building a CALS table.
 __docformat__ = 'reStructuredText'
 
 
+import bisect
+import heapq
 import re
 import sys
 from docutils import DataError
-from docutils.utils import strip_combining_chars
+from docutils.utils import find_combining_chars, strip_combining_chars
 
 
 class TableMarkupError(DataError):
@@ -153,6 +155,10 @@ class GridTableParser(TableParser):
         self.cells = []
         self.rowseps = {0: [0]}
         self.colseps = {0: [0]}
+        # Indices of lines with combining characters (see `get_cell_block()`):
+        self.combining_lines = [i for i, line in enumerate(self.block)
+                                if not line.isascii()
+                                and find_combining_chars(line)]
 
     def parse_table(self):
         """
@@ -166,9 +172,9 @@ class GridTableParser(TableParser):
         We'll end up knowing all the row and column boundaries, cell positions
         and their dimensions.
         """
-        corners = [(0, 0)]
+        corners = [(0, 0)]  # a heap, `heapq.heappop()` returns the top-most
         while corners:
-            top, left = corners.pop(0)
+            top, left = heapq.heappop(corners)
             if (top == self.bottom
                 or left == self.right
                 or top <= self.done[left]):
@@ -180,16 +186,37 @@ class GridTableParser(TableParser):
             update_dict_of_lists(self.rowseps, rowseps)
             update_dict_of_lists(self.colseps, colseps)
             self.mark_done(top, left, bottom, right)
-            cellblock = self.block.get_2D_block(top + 1, left + 1,
-                                                bottom, right)
+            cellblock = self.get_cell_block(top, left, bottom, right)
             cellblock.disconnect()      # lines in cell can't sync with parent
             cellblock.replace(self.double_width_pad_char, '')
             self.cells.append((top, left, bottom, right, cellblock))
-            corners.extend([(top, right), (bottom, left)])
-            corners.sort()
+            heapq.heappush(corners, (top, right))
+            heapq.heappush(corners, (bottom, left))
         if not self.check_parse_complete():
             raise TableMarkupError('Malformed table; parse incomplete.')
 
+    def get_cell_block(self, top, left, bottom, right):
+        """
+        Return the content of the cell with the given borders.
+
+        Like ``self.block.get_2D_block(top + 1, left + 1, bottom, right)``
+        but without the (costly) conversion of column indices to string
+        indices for lines without combining characters.
+        """
+        index = bisect.bisect_right(self.combining_lines, top)
+        if (index < len(self.combining_lines)
+                and self.combining_lines[index] < bottom):
+            return self.block.get_2D_block(top + 1, left + 1, bottom, right)
+        block = self.block[top + 1:bottom]
+        indent = right
+        for i, line in enumerate(block.data):
+            block.data[i] = line = line[left + 1:right].rstrip()
+            if line:
+                indent = min(indent, len(line) - len(line.lstrip()))
+        if 0 < indent < right:
+            block.data = [line[indent:] for line in block.data]
+        return block
+
     def mark_done(self, top, left, bottom, right) -> None:
         """For keeping track of how much of each text column has been seen."""
         before = top - 1
@@ -431,10 +431,14 @@ class StateMachine:
         """
         if transitions is None:
             transitions = state.transition_order
+            # skip the transitions that cannot match:
+            start = state.first_transition(self.line)
+        else:
+            start = 0
         if self.debug:
             print('\nStateMachine.check_line: state="%s", transitions=%r.'
                   % (state.__class__.__name__, transitions), file=sys.stderr)
-        for name in transitions:
+        for name in transitions[start:]:
             pattern, method, next_state = state.transitions[name]
             match = pattern.match(self.line)
             if match:
@@ -579,6 +583,39 @@ class State:
     defaults.
     """
 
+    pattern_tokens = re.compile(r"""\\.                     # escaped character
+                                   |\[\^?\]?(?:\\.|[^]\\])*\] # character set
+                                   |\(\?P<\w+>              # named group
+                                   |\(\?[P(]?               # extension
+                                   |.""", re.VERBOSE | re.DOTALL)
+    """Tokenizer for transition patterns, see `make_transition_prefilter()`."""
+
+    numbered_references = tuple(f'\\{i}' for i in range(1, 10))
+    """Tokens of references to groups by number (1 to 9)."""
+
+    transition_tables = {}
+    """
+    Transitions of `State` subclasses, shared by all instances
+    (see `bind_transitions()`).
+    """
+
+    transition_prefilters = {}
+    """
+    Cache of combined transition patterns shared by all `State` objects
+    (keys: tuples of transition patterns, values: see `transition_prefilter`).
+    """
+
+    transition_prefilter = None
+    """
+    A 2-tuple (compiled pattern, list of transition indices) combining the
+    patterns of all transitions in one alternation, or ``None``.
+
+    Built on demand by `first_transition()`, reset by `add_transitions()`,
+    `add_transition()`, and `remove_transition()`.  Use these methods
+    (rather than modifying `transitions` and `transition_order` directly)
+    to change the transitions of a `State` object.
+    """
+
     def __init__(self, state_machine, debug=False) -> None:
         """
         Initialize a `State` object; make & add initial transitions.
@@ -628,7 +665,7 @@ class State:
     def add_initial_transitions(self) -> None:
         """Make and add transitions listed in `self.initial_transitions`."""
         if self.initial_transitions:
-            names, transitions = self.make_transitions(
+            names, transitions = self.bind_transitions(
                                      self.initial_transitions)
             self.add_transitions(names, transitions)
 
@@ -650,6 +687,7 @@ class State:
                 raise UnknownTransitionError(name)
         self.transition_order[:0] = names
         self.transitions.update(transitions)
+        self.transition_prefilter = None
 
     def add_transition(self, name, transition):
         """
@@ -663,6 +701,7 @@ class State:
             raise DuplicateTransitionError(name)
         self.transition_order[:0] = [name]
         self.transitions[name] = transition
+        self.transition_prefilter = None
 
     def remove_transition(self, name):
         """
@@ -675,6 +714,87 @@ class State:
             self.transition_order.remove(name)
         except:  # NoQA: E722 (catchall)
             raise UnknownTransitionError(name)
+        self.transition_prefilter = None
+
+    def first_transition(self, line):
+        """
+        Return the index of the first transition that may match `line`.
+
+        The transitions in `self.transition_order` before the returned index
+        do not match.  Return ``len(self.transition_order)`` if no transition
+        matches.
+
+        The patterns of all transitions are combined into one alternation
+        (see `make_transition_prefilter()`), so that a line is classified
+        with one regular expression match instead of one match per
+        transition.
+        """
+        if self.transition_prefilter is None:
+            patterns = tuple(self.transitions[name][0]
+                             for name in self.transition_order)
+            prefilters = State.transition_prefilters
+            if patterns not in prefilters:
+                if len(prefilters) >= 256:
+                    prefilters.clear()
+                prefilters[patterns] = self.make_transition_prefilter(
+                                                            patterns)
+            self.transition_prefilter = prefilters[patterns]
+        pattern, indices = self.transition_prefilter
+        match = pattern.match(line)
+        if match is None:
+            return len(self.transition_order)
+        return indices[match.lastindex]
+
+    def make_transition_prefilter(self, patterns):
+        """
+        Return a 2-tuple: combined pattern and list of transition indices.
+
+        The combined pattern is an alternation of `patterns` (the compiled
+        patterns of the transitions in search order), each one wrapped in a
+        group.  The list maps the number of the last group in a match (the
+        wrapping group) to the index of the matching transition.
+
+        Capturing groups in transition patterns become non-capturing unless
+        they are referenced by number.  Patterns that cannot be embedded
+        (patterns with flags, named references or conditional groups) are
+        replaced by an empty pattern: from their index on, the transitions
+        are tried one by one (see `StateMachine.check_line()`).
+        """
+        parts = []
+        indices = [None]  # group 0 is the whole match
+        for index, pattern in enumerate(patterns):
+            source = pattern.pattern
+            if not isinstance(source, str):
+                return re.compile('()'), [None, 0]
+            tokens = self.pattern_tokens.findall(source)
+            references = [i for i, token in enumerate(tokens)
+                          if token in self.numbered_references]
+            indices.append(index)
+            if (pattern.flags != re.UNICODE
+                or '(?P' in tokens or '(?(' in tokens
+                or any(''.join(tokens[i+1:i+2]).isdigit()  # group 10 to 99
+                       for i in references)):
+                parts.append('()')
+            elif references:
+                # keep the groups, renumber the references
+                offset = len(indices) - 1
+                parts.append('(%s)' % ''.join(
+                    '(' if token.startswith('(?P<')
+                    else f'(?:\\{int(token[1:]) + offset})'
+                    if token in self.numbered_references
+                    else token for token in tokens))
+                indices.extend([index] * pattern.groups)
+            else:
+                parts.append('(%s)' % ''.join(
+                    '(?:' if token == '(' or token.startswith('(?P<')
+                    else token for token in tokens))
+        try:
+            combined = re.compile('|'.join(parts))
+        except re.error:
+            combined = None
+        if combined is None or combined.groups != len(indices) - 1:
+            return re.compile('()'), [None, 0]
+        return combined, indices
 
     def make_transition(self, name, next_state=None):
         """
@@ -728,6 +848,32 @@ class State:
                 names.append(namestate[0])
         return names, transitions
 
+    def bind_transitions(self, name_list):
+        """
+        Return a list of transition names and a transition mapping.
+
+        Like `make_transitions()`, but the patterns and next states are
+        looked up once per `State` subclass and `name_list` (see
+        `transition_tables`); only the transition methods are looked up
+        for every `State` object.
+        """
+        tables = State.transition_tables
+        try:
+            names, table = tables[(self.__class__, name_list)]
+        except (KeyError, TypeError):  # not cached or list not hashable
+            key = (self.__class__,
+                   tuple(namestate if isinstance(namestate, str)
+                         else tuple(namestate) for namestate in name_list))
+            if key not in tables:
+                names, transitions = self.make_transitions(name_list)
+                tables[key] = names, [
+                    (name, pattern, next_state) for name, (
+                        pattern, method, next_state) in transitions.items()]
+                return names, transitions
+            names, table = tables[key]
+        return names, {name: (pattern, getattr(self, name), next_state)
+                       for name, pattern, next_state in table}
+
     def no_match(self, context, transitions):
         """
         Called when there is no match from `StateMachine.check_line()`.
@@ -962,7 +1108,7 @@ class StateWS(State):
         if self.patterns is None:
             self.patterns = {}
         self.patterns.update(self.ws_patterns)
-        names, transitions = self.make_transitions(
+        names, transitions = self.bind_transitions(
             self.ws_initial_transitions)
         self.add_transitions(names, transitions)
 
@@ -1450,7 +1596,7 @@ class StringList(ViewList):
         """
         for i in range(len(self.data)):
             line = self.data[i]
-            if isinstance(line, str):
+            if isinstance(line, str) and not line.isascii():
                 new = []
                 for char in line:
                     new.append(char)
@@ -23,8 +23,9 @@ choose to perform on the parsed document.
 
 __docformat__ = 'reStructuredText'
 
+import time
 
-from docutils import languages, ApplicationError, TransformSpec
+from docutils import languages, nodes, ApplicationError, TransformSpec
 
 
 class TransformError(ApplicationError):
@@ -100,6 +101,26 @@ class Transformer(TransformSpec):
         """Internal serial number to keep track of the add order of
         transforms."""
 
+        self.profile = {}
+        """Time, created and removed nodes of the applied transforms.
+
+        Filled in by `self.apply_transforms()` if the "profile_transforms"
+        setting is True.  Maps transform names (``module.Class``, with
+        suffix " (pending)" for transforms with associated pending node)
+        to dictionaries with the number of applications ("calls"), the
+        total time in seconds ("time"), the number of nodes created
+        ("created", including copies), and the number of nodes removed
+        from the document tree or created but not inserted ("removed").
+        Nodes moved within the document tree are not counted.  Inserting
+        nodes that were created earlier (e.g. stored in a "pending"
+        element) reduces the number of removed nodes.
+
+        Provisional.
+        """
+
+        self.node_count = None
+        """Number of nodes in the document tree (internal, for profiling)."""
+
     def add_transform(self, transform_class, priority=None, **kwargs) -> None:
         """
         Store a single transform.  Use `priority` to override the default.
@@ -171,6 +192,12 @@ class Transformer(TransformSpec):
         """Apply all of the stored transforms, in priority order."""
         self.document.reporter.attach_observer(
             self.document.note_transform_message)
+        if (getattr(self.document.settings, 'node_index', None)
+            and self.document.node_index is None):
+            self.document.enable_node_index()
+        profile = getattr(self.document.settings, 'profile_transforms', None)
+        if profile:
+            self.node_count = self.count_nodes()
         while self.transforms:
             if not self.sorted:
                 # Unsorted initially, and whenever a transform is added
@@ -179,7 +206,89 @@ class Transformer(TransformSpec):
                 self.sorted = True
             priority, transform_class, pending, kwargs = self.transforms.pop()
             transform = transform_class(self.document, startnode=pending)
-            transform.apply(**kwargs)
+            if profile:
+                self.apply_profiled(transform, pending, kwargs)
+            else:
+                transform.apply(**kwargs)
             self.applied.append((priority, transform_class, pending, kwargs))
         self.document.reporter.detach_observer(
             self.document.note_transform_message)
+
+    def apply_profiled(self, transform, pending, kwargs) -> None:
+        """Apply `transform` and record time and nodes in `self.profile`.
+
+        Nodes are counted while they are created.  The number of nodes
+        in the document tree is determined after the transform (outside
+        the measured time), the difference to the number of created nodes
+        is the number of removed nodes.
+        """
+        with NodeCounter() as counter:
+            start = time.perf_counter()
+            transform.apply(**kwargs)
+            elapsed = time.perf_counter() - start
+        node_count = self.count_nodes()
+        transform_class = transform.__class__
+        name = f'{transform_class.__module__}.{transform_class.__qualname__}'
+        if pending is not None:
+            name += ' (pending)'
+        record = self.profile.setdefault(
+            name, {'calls': 0, 'time': 0, 'created': 0, 'removed': 0})
+        record['calls'] += 1
+        record['time'] += elapsed
+        record['created'] += counter.count
+        record['removed'] += counter.count - (node_count - self.node_count)
+        self.node_count = node_count
+
+    def count_nodes(self) -> int:
+        """Return the number of nodes in the document tree."""
+        return sum(1 for node in self.document.findall())
+
+    def profile_report(self) -> str:
+        """Return `self.profile` as table, sorted by time (descending).
+
+        Provisional.
+        """
+        lines = ['\n::: Transform profile:',
+                 '  time [s]  calls  created  removed  transform']
+        for name, record in sorted(self.profile.items(),
+                                   key=lambda item: item[1]['time'],
+                                   reverse=True):
+            lines.append(f'{record["time"]:10.4f} {record["calls"]:6d} '
+                         f'{record["created"]:8d} {record["removed"]:8d}  '
+                         f'{name}')
+        return '\n'.join(lines)
+
+
+class NodeCounter:
+    """
+    Count the `nodes.Element` and `nodes.Text` instances created
+    within a ``with`` statement.
+
+    Used by `Transformer.apply_profiled()`: the constructors are wrapped
+    while the counter is active.  This affects all threads.
+
+    Provisional.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __enter__(self):
+        element_init = nodes.Element.__init__
+        text_new = nodes.Text.__new__
+
+        def counting_init(node, *args, **kwargs) -> None:
+            self.count += 1
+            element_init(node, *args, **kwargs)
+
+        def counting_new(cls, *args, **kwargs):
+            self.count += 1
+            return text_new(cls, *args, **kwargs)
+
+        self.saved = (element_init, nodes.Text.__dict__['__new__'])
+        nodes.Element.__init__ = counting_init
+        nodes.Text.__new__ = staticmethod(counting_new)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        nodes.Element.__init__, nodes.Text.__new__ = self.saved
@@ -450,7 +450,7 @@ class DocInfo(Transform):
             parser.parse('\\'+f_body.rawsource, _document)
             if (len(_document.children) == 1
                 and isinstance(_document.children[0], nodes.paragraph)):
-                f_body.children = _document.children
+                f_body[:] = _document.children
                 return True
         # Check failed, add a warning
         content = [f'<{e.tagname}>' for e in f_body.children]
@@ -46,6 +46,12 @@ class SystemMessage(ApplicationError):
         Exception.__init__(self, system_message.astext())
         self.level = level
 
+    def __reduce__(self):
+        # `__init__()` expects a `nodes.system_message` (the default
+        # unpickling calls it with the message text).
+        return (self.__class__.__new__, (self.__class__, *self.args),
+                self.__dict__)
+
 
 class SystemMessagePropagation(ApplicationError):
     pass
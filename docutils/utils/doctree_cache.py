@@ -0,0 +1,210 @@
+# $Id$
+# Copyright: This module has been placed in the public domain.
+
+"""
+On-disk cache for parsed and transformed document trees.
+
+The `docutils.core.Publisher` uses a `DoctreeCache` if the
+"doctree_cache" setting is not empty.
+
+Provisional.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import TYPE_CHECKING
+
+import docutils
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any
+
+    from docutils import SettingsSpec, nodes
+    from docutils.frontend import Values
+    from docutils.nodes import StrPath
+
+
+volatile_settings = frozenset((
+    '_destination', '_config_files', 'output', 'output_encoding',
+    'output_encoding_error_handler', 'record_dependencies',
+    'warning_stream', 'writer', 'doctree_cache', 'doctree_cache_size',
+    'dump_settings', 'dump_internals', 'dump_transforms', 'dump_pseudo_xml'))
+"""Names of settings that do not affect the document tree."""
+
+
+class DoctreeCache:
+
+    """
+    Directory storing pickled document trees.
+
+    Entries are stored under a key computed from the source text and the
+    runtime settings (see `key()`).  Every entry also stores the files
+    the document depends on (e.g. included files, cf. `DependencyList`).
+    An entry is only returned if the content of these files is unchanged.
+
+    The total size of the entries is bounded by `max_size`.
+    Least recently used entries are removed first.
+    """
+
+    suffix = '.doctree'
+    """File name extension of cache entries."""
+
+    def __init__(self, directory: StrPath, max_size: int = 256*2**20,
+                 ) -> None:
+        self.directory = os.fspath(directory)
+        """Path of the cache directory."""
+
+        self.max_size = max_size
+        """Maximal total size of the cache entries (in bytes)."""
+
+    def key(self,
+            source: str,
+            settings: Values,
+            ignore: Iterable[str] = (),
+            ) -> str:
+        """Return the cache key for `source` processed with `settings`.
+
+        Settings in `ignore` and `volatile_settings` are not considered.
+        """
+        ignore = volatile_settings.union(ignore)
+        relevant = sorted((name, repr(value))
+                          for name, value in vars(settings).items()
+                          if name not in ignore)
+        key = hashlib.sha256(docutils.__version__.encode())
+        key.update(repr(relevant).encode('utf-8', 'backslashreplace'))
+        key.update(source.encode('utf-8', 'surrogatepass'))
+        return key.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.suffix)
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """Return the cache entry for `key` or None.
+
+        The entry is a dictionary with the keys
+
+        :document:     the `nodes.document` (without settings, reporter,
+                       and transformer),
+        :dependencies: the list of files the document depends on,
+        :messages:     system messages reported during processing (`str`),
+        :max_level:    the highest system message level.
+        """
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError,
+                AttributeError, ImportError, IndexError, TypeError):
+            return None
+        for dependency, checksum in entry['dependencies'].items():
+            if file_checksum(dependency) != checksum:
+                return None
+        os.utime(path)  # mark as recently used
+        entry['dependencies'] = list(entry['dependencies'])
+        return entry
+
+    def store(self,
+              key: str,
+              document: nodes.document,
+              dependencies: Iterable[StrPath] = (),
+              messages: Iterable[str] = (),
+              max_level: int = -1,
+              ) -> bool:
+        """Store a cache entry for `document` under `key`.
+
+        Return False if the document cannot be pickled.
+        """
+        entry = {'document': document,
+                 'dependencies': {path: file_checksum(path)
+                                  for path in dependencies},
+                 'messages': list(messages),
+                 'max_level': max_level}
+        # The settings are replaced when the document is re-used:
+        settings, document.settings = document.settings, None
+        try:
+            data = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+        finally:
+            document.settings = settings
+        os.makedirs(self.directory, exist_ok=True)
+        # write to a temporary file first, the cache may be shared
+        # by several processes
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path(key))
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+        self.prune()
+        return True
+
+    def prune(self) -> None:
+        """Remove least recently used entries exceeding `self.max_size`."""
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(self.suffix):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        total = sum(size for _mtime, size, _path in entries)
+        for _mtime, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+def file_checksum(path: StrPath) -> str | None:
+    """Return a hash of the content of the file `path` or None."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def setting_names(component: SettingsSpec) -> set[str]:
+    """Return the names of the settings defined by `component`.
+
+    Settings of options that override a setting of another component
+    (e.g. the writer setting "footnote_references" overriding the parser
+    setting "trim_footnote_reference_space") are not included.
+    """
+    names = set(component.settings_defaults or ())
+    overriding = {}
+    spec = component.settings_spec
+    for i in range(0, len(spec), 3):
+        for _help, option_strings, kwargs in spec[i+2]:
+            if 'dest' in kwargs:
+                name = kwargs['dest']
+            else:
+                long_options = [opt for opt in option_strings
+                                if opt.startswith('--')]
+                if not long_options:
+                    continue
+                name = long_options[0][2:].replace('-', '_')
+            names.add(name)
+            if 'overrides' in kwargs:
+                overriding[name] = kwargs['overrides']
+    return {name for name in names
+            if overriding.get(name, name) in names}
@@ -0,0 +1,309 @@
+# $Id$
+# Copyright: This module has been placed in the public domain.
+
+"""
+Metadata of local image files: size, MIME type, and "data:" URI.
+
+`read_size()` reads the size of PNG, GIF, JPEG, and SVG images from the
+file header.  The Python Imaging Library (PIL) is only required for other
+image formats.
+
+`cache` is an `ImageInfoCache` shared by all documents processed in a
+process.  It is used by the "figure" directive (``:figwidth: image``) and
+the HTML writers (size of scaled images, embedded images).  Applications
+may keep the metadata between runs with `ImageInfoCache.save()` and
+`ImageInfoCache.load()`.
+
+Provisional.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+import base64
+import mimetypes
+import os
+import pickle
+import re
+import struct
+import tempfile
+from typing import TYPE_CHECKING
+from xml.etree import ElementTree as ET
+
+try:  # check for the Python Imaging Library
+    import PIL.Image
+except ImportError:
+    try:  # sometimes PIL modules are put in PYTHONPATH's root
+        import Image
+        class PIL: pass  # noqa:E701  dummy wrapper
+        PIL.Image = Image
+    except ImportError:
+        PIL = None
+
+if TYPE_CHECKING:
+    from docutils.nodes import StrPath
+
+
+def read_size(path: StrPath) -> tuple[float, float] | None:
+    """Return the size (width, height) of the image file `path` in pixels.
+
+    The size of PNG, GIF, JPEG, and SVG images is read from the file
+    header, other formats require PIL.  Return None if the size cannot
+    be determined without PIL and PIL is not installed.
+
+    Raise `OSError` if the file cannot be read (or PIL cannot identify
+    the image format).
+    """
+    with open(path, 'rb') as f:
+        head = f.read(32)
+        size = None
+        if (head.startswith(b'\x89PNG\r\n\x1a\n') and head[12:16] == b'IHDR'
+                and len(head) >= 24):
+            size = struct.unpack('>II', head[16:24])
+        elif head[:6] in (b'GIF87a', b'GIF89a') and len(head) >= 10:
+            size = struct.unpack('<HH', head[6:10])
+        elif head.startswith(b'\xff\xd8'):
+            f.seek(2)
+            size = jpeg_size(f)
+        elif mimetypes.guess_type(os.fspath(path))[0] == 'image/svg+xml':
+            f.seek(0)
+            size = svg_size(f)
+    if size is None and PIL:
+        with PIL.Image.open(path) as img:
+            size = img.size
+    return size
+
+
+def jpeg_size(f) -> tuple[int, int] | None:
+    """Return the size of the JPEG image in the binary file object `f`.
+
+    Read the markers from the current position of `f` (after the
+    "start of image" marker) up to the first "start of frame" segment.
+    """
+    while True:
+        byte = f.read(1)
+        while byte == b'\xff':  # fill bytes before the marker
+            marker = f.read(1)
+            if marker != b'\xff':
+                break
+        else:
+            return None  # not at a marker
+        if not marker or marker == b'\xd9':  # end of data or image
+            return None
+        if marker == b'\x01' or b'\xd0' <= marker <= b'\xd7':
+            continue  # markers without segment
+        header = f.read(2)
+        if len(header) < 2:
+            return None
+        length = struct.unpack('>H', header)[0]
+        if (b'\xc0' <= marker <= b'\xcf'
+                and marker not in (b'\xc4', b'\xc8', b'\xcc')):
+            # start of frame: precision, height, width
+            data = f.read(5)
+            if len(data) < 5:
+                return None
+            height, width = struct.unpack('>HH', data[1:])
+            return width, height
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+_svg_length = re.compile(r'\s*([0-9]*\.?[0-9]+(?:[eE][+-]?[0-9]+)?)'
+                         r'\s*(px)?\s*$')
+
+
+def svg_size(f) -> tuple[float, float] | None:
+    """Return the size of the SVG image in the binary file object `f`.
+
+    Use the "width" and "height" attributes of the root element
+    if they are given in pixels, else the size of the "viewBox".
+    Only the document up to the start tag of the root element is parsed.
+    """
+    try:
+        for _event, root in ET.iterparse(f, events=('start',)):
+            break
+        else:
+            return None
+    except ET.ParseError:
+        return None
+    size = []
+    for dimension in ('width', 'height'):
+        match = _svg_length.match(root.get(dimension, ''))
+        if match:
+            size.append(float(match.group(1)))
+    if len(size) == 2:
+        return tuple(size)
+    if 'width' in root.attrib or 'height' in root.attrib:
+        return None  # relative or absolute units
+    viewbox = root.get('viewBox', '').replace(',', ' ').split()
+    try:
+        if len(viewbox) == 4:
+            return float(viewbox[2]), float(viewbox[3])
+    except ValueError:
+        pass
+    return None
+
+
+def _number(value: float) -> float:
+    # Return integral values as `int` (e.g. for formatting with "%d").
+    return int(value) if value == int(value) else value
+
+
+class ImageInfo:
+
+    """Metadata of one image file (cf. `ImageInfoCache`)."""
+
+    unknown = object()
+    """Marker for metadata not (yet) read from the file."""
+
+    def __init__(self, path: str, stat: os.stat_result) -> None:
+        self.path = path
+        self.stamp = (stat.st_mtime_ns, stat.st_size)
+        """Modification time and size of the file."""
+        self.mimetype = mimetypes.guess_type(path)[0]
+        self.size = self.unknown
+        """Size (width, height) in pixels (cf. `read_size()`)."""
+        self.data_uri = self.unknown
+        """The file content as "data:" URI."""
+
+
+class ImageInfoCache:
+
+    """
+    Metadata of image files, keyed by the absolute path.
+
+    An entry is valid as long as the modification time and size of the
+    file are unchanged.  The number of entries is bounded by
+    `max_entries`, the total size of the stored "data:" URIs by
+    `max_data_size`.  Least recently used entries are removed first.
+    """
+
+    def __init__(self, max_entries: int = 1000,
+                 max_data_size: int = 32*2**20) -> None:
+        self.entries: dict[str, ImageInfo] = {}
+        """Cache entries (in the order of use)."""
+
+        self.max_entries = max_entries
+        """Maximal number of entries."""
+
+        self.max_data_size = max_data_size
+        """Maximal total length of the stored "data:" URIs."""
+
+        self.data_size = 0
+        """Total length of the stored "data:" URIs."""
+
+    def info(self, path: StrPath) -> ImageInfo:
+        """Return the cache entry for the image file `path`.
+
+        Raise `OSError` if the file does not exist.
+        """
+        stat = os.stat(path)
+        path = os.path.abspath(path)
+        entry = self.entries.pop(path, None)
+        if entry is None or entry.stamp != (stat.st_mtime_ns, stat.st_size):
+            self.forget_data(entry)
+            entry = ImageInfo(path, stat)
+        self.entries[path] = entry
+        if len(self.entries) > self.max_entries:
+            self.forget_data(self.entries.pop(next(iter(self.entries))))
+        return entry
+
+    def size(self, path: StrPath) -> tuple[float, float] | None:
+        """Return the size of the image file `path` (cf. `read_size()`)."""
+        entry = self.info(path)
+        if entry.size is ImageInfo.unknown:
+            size = read_size(entry.path)
+            entry.size = size and tuple(_number(value) for value in size)
+        return entry.size
+
+    def mimetype(self, path: StrPath) -> str | None:
+        """Return the MIME type of the image file `path`."""
+        return self.info(path).mimetype
+
+    def data_uri(self, path: StrPath) -> str:
+        """Return the content of the image file `path` as "data:" URI."""
+        entry = self.info(path)
+        if entry.data_uri is not ImageInfo.unknown:
+            return entry.data_uri
+        with open(entry.path, 'rb') as f:
+            data64 = base64.b64encode(f.read()).decode()
+        data_uri = f'data:{entry.mimetype};base64,{data64}'
+        if len(data_uri) <= self.max_data_size:
+            entry.data_uri = data_uri
+            self.data_size += len(data_uri)
+            for other in list(self.entries.values()):
+                if self.data_size <= self.max_data_size:
+                    break
+                self.forget_data(other)
+        return data_uri
+
+    def forget_data(self, entry: ImageInfo | None) -> None:
+        """Drop the "data:" URI stored in `entry`."""
+        if entry is not None and entry.data_uri is not ImageInfo.unknown:
+            self.data_size -= len(entry.data_uri)
+            entry.data_uri = ImageInfo.unknown
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.entries.clear()
+        self.data_size = 0
+
+    def save(self, path: StrPath) -> bool:
+        """Store the sizes and MIME types of the entries in file `path`.
+
+        "data:" URIs are not stored.  Return False in case of an error.
+        """
+        records = {entry.path: (entry.stamp, entry.mimetype, entry.size)
+                   for entry in self.entries.values()
+                   if entry.size not in (ImageInfo.unknown, None)}
+        directory = os.path.dirname(os.path.abspath(path))
+        # write to a temporary file first, the file may be shared
+        # by several processes
+        try:
+            fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=directory)
+        except OSError:
+            return False
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(records, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+        return True
+
+    def load(self, path: StrPath) -> bool:
+        """Add the entries stored in file `path` (cf. `save()`).
+
+        Entries of changed or removed image files are ignored.
+        Return False if the file cannot be read.
+        """
+        try:
+            with open(path, 'rb') as f:
+                records = pickle.load(f)
+            records = dict(records)
+        except (OSError, EOFError, pickle.UnpicklingError,
+                AttributeError, ImportError, IndexError, TypeError,
+                ValueError):
+            return False
+        for image_path, (stamp, mimetype, size) in records.items():
+            if image_path in self.entries:
+                continue
+            try:
+                entry = ImageInfo(image_path, os.stat(image_path))
+            except (OSError, TypeError, ValueError):
+                continue
+            if entry.stamp != stamp:
+                continue
+            entry.mimetype, entry.size = mimetype, size
+            self.entries[image_path] = entry
+        while len(self.entries) > self.max_entries:
+            self.forget_data(self.entries.pop(next(iter(self.entries))))
+        return True
+
+
+cache = ImageInfoCache()
+"""Image metadata shared by all documents processed in a process."""
@@ -14,10 +14,11 @@ import importlib
 from typing import TYPE_CHECKING
 
 import docutils
-from docutils import languages, Component
+from docutils import io, languages, Component
 from docutils.transforms import universal
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from typing import Any, Final
 
     from docutils import nodes
@@ -64,6 +65,12 @@ class Writer(Component):
     Set by `write()`.
     """
 
+    streamed: bool = False
+    """True if `write()` wrote the output in parts (see `translate_parts()`).
+
+    Then `output` and `parts` are not set.  Provisional.
+    """
+
     def __init__(self) -> None:
 
         self.parts: dict[str, Any] = {}
@@ -84,6 +91,11 @@ class Writer(Component):
         native format, and write it out to its `destination` (a
         `docutils.io.Output` subclass object).
 
+        If the "stream_output" setting is True and `destination` is a
+        `docutils.io.FileOutput` instance, the output is written in parts
+        (see `translate_parts()`) and None is returned.  `self.output`
+        and `self.parts` are not set in this case (see `streamed`).
+
         Normally not overridden or extended in subclasses.
         """
         self.document = document
@@ -91,6 +103,14 @@ class Writer(Component):
             document.settings.language_code,
             document.reporter)
         self.destination = destination
+        self.streamed = False
+        if (getattr(document.settings, 'stream_output', False)
+                and isinstance(destination, io.FileOutput)):
+            self.destination.write_parts(self.translate_parts())
+            self.output = None
+            self.parts = {}
+            self.streamed = True
+            return None
         self.translate()
         return self.destination.write(self.output)
 
@@ -108,11 +128,35 @@ class Writer(Component):
         """
         raise NotImplementedError('subclass must override this method')
 
+    def translate_parts(self) -> Iterator[str | bytes]:
+        """
+        Translate `self.document` and yield the output in parts.
+
+        Called from `write()` if the "stream_output" setting is True.
+        Override in subclasses that can generate the output piecewise.
+        The default implementation calls `translate()` and yields
+        `self.output`.
+
+        `self.document` is the complete, transformed document tree:
+        only the output is generated piecewise.
+
+        Provisional.
+        """
+        self.translate()
+        yield self.output
+
     def assemble_parts(self) -> None:
         """Assemble the `self.parts` dictionary.  Extend in subclasses.
 
         See <https://docutils.sourceforge.io/docs/api/publisher.html>.
+
+        Raise `RuntimeError` if the output was written in parts
+        (see `streamed`).
         """
+        if self.streamed:
+            raise RuntimeError('Cannot assemble the document parts: the '
+                               'output was written in parts ("stream_output" '
+                               'setting).')
         self.parts['whole'] = self.output
         self.parts['encoding'] = self.document.settings.output_encoding
         self.parts['errors'] = (
@@ -20,7 +20,6 @@ from __future__ import annotations
 
 __docformat__ = 'reStructuredText'
 
-import base64
 import mimetypes
 import os
 import os.path
@@ -35,12 +34,15 @@ from typing import TYPE_CHECKING
 import docutils
 from docutils import frontend, languages, nodes, utils, writers
 from docutils.parsers.rst.directives import length_or_percentage_or_unitless
-from docutils.parsers.rst.directives.images import PIL
 from docutils.transforms import writer_aux
+from docutils.utils import image_info
+from docutils.utils.image_info import PIL  # noqa: F401  backwards compat.
 from docutils.utils.math import (latex2mathml, math2html, tex2mathml_extern,
                                  unichar2tex, wrap_math_code, MathError)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from docutils.transforms import Transform
 
 
@@ -166,6 +168,57 @@ class Writer(writers.Writer):
             setattr(self, attr, getattr(visitor, attr))
         self.output = self.apply_template()
 
+    def translate_parts(self) -> Iterator[str]:
+        """Translate `self.document` and yield the output in parts.
+
+        The head and the front matter (title, subtitle, metadata,
+        decoration, docinfo) are generated from the complete document
+        first.  Then the body is generated and yielded separately for
+        every following child of the document.
+
+        Templates using the "fragment" or "html_body" parts require the
+        complete body: then the output is generated at once.
+
+        Provisional.
+        """
+        template = Path(self.document.settings.template).read_text(
+                       encoding='utf-8')
+        if (template.count('%(body)s') != 1
+                or '%(fragment)s' in template
+                or '%(html_body)s' in template):
+            yield from super().translate_parts()
+            return
+        self.visitor = visitor = self.translator_class(self.document)
+        document = self.document
+        visitor.visit_document(document)
+        front = 0
+        for index, child in enumerate(document):
+            if isinstance(child, (nodes.Titular, nodes.meta,
+                                  nodes.decoration, nodes.docinfo)):
+                front = index + 1
+        for child in document[:front]:
+            child.walkabout(visitor)
+        visitor.prepare_head(document)
+        body, visitor.body = visitor.body, []
+        visitor.depart_document(document)
+        for attr in self.visitor_attributes:
+            setattr(self, attr, getattr(visitor, attr))
+        subs = self.interpolation_dict()
+        head, tail = template.split('%(body)s')
+        yield head % subs
+        newlines = ''  # trailing newlines are stripped from the body
+        for child in document[front:]:
+            child.walkabout(visitor)
+            text = newlines + ''.join(body + visitor.body)
+            body, visitor.body = [], []
+            stripped = text.rstrip('\n')
+            newlines = text[len(stripped):]
+            if stripped:
+                yield stripped
+        if not document[front:]:
+            yield ''.join(body).rstrip('\n')
+        yield tail % subs
+
     def apply_template(self) -> str:
         template_path = Path(self.document.settings.template)
         template = template_path.read_text(encoding='utf-8')
@@ -427,7 +480,7 @@ class HTMLTranslator(nodes.NodeVisitor):
                 measures[dimension] = nodes.parse_measure(node[dimension])
         if 'scale' in node and len(measures) < 2:
             # supplement with (unitless) values read from image file
-            imgsize = self.read_size_with_PIL(node)
+            imgsize = self.read_image_size(node)
             if imgsize:
                 for dimension, value in zip(dimensions, imgsize):
                     if dimension not in measures:
@@ -447,26 +500,27 @@ class HTMLTranslator(nodes.NodeVisitor):
             size_atts['style'] = ' '.join(declarations)
         return size_atts
 
-    def read_size_with_PIL(self, node) -> tuple[int, int] | None:
-        # Try reading size from image file.
+    def read_image_size(self, node) -> tuple[float, float] | None:
+        # Try reading size from image file (cf. `utils.image_info`).
         # Internal auxiliary method called from `self.image_size()`.
         reading_problems = []
         uri = node['uri']
-        if not PIL:
-            reading_problems.append('Requires Python Imaging Library.')
         if mimetypes.guess_type(uri)[0] in self.videotypes:
-            reading_problems.append('PIL cannot read video images.')
+            reading_problems.append('Cannot read the size of video images.')
         if not self.settings.file_insertion_enabled:
             reading_problems.append('Reading external files disabled.')
         if not reading_problems:
             try:
                 imagepath = self.uri2imagepath(uri)
-                with PIL.Image.open(imagepath) as img:
-                    imgsize = img.size
+                imgsize = image_info.cache.size(imagepath)
             except (ValueError, OSError, UnicodeEncodeError) as err:
                 reading_problems.append(str(err))
             else:
-                self.settings.record_dependencies.add(imagepath)
+                if imgsize is None:
+                    reading_problems.append(
+                        'Requires Python Imaging Library.')
+                else:
+                    self.settings.record_dependencies.add(imagepath)
         if reading_problems:
             msg = ['Cannot scale image!',
                    f'Could not get size from "{uri}":',
@@ -476,6 +530,53 @@ class HTMLTranslator(nodes.NodeVisitor):
             return None
         return imgsize
 
+    def read_size_with_PIL(self, node) -> tuple[float, float] | None:
+        # Deprecated, will be removed in Docutils 1.0.
+        warnings.warn('`HTMLTranslator.read_size_with_PIL()` is obsoleted by'
+                      ' `HTMLTranslator.read_image_size()`'
+                      ' and will be removed in Docutils 1.0.',
+                      DeprecationWarning, stacklevel=2)
+        return self.read_image_size(node)
+
+    def prepare_head(self, document) -> None:
+        # Prepare the parts of the head (and the body start tag) that
+        # depend on elements in the body of `document`.
+        #
+        # Internal auxiliary method called from `Writer.translate_parts()`
+        # before the body is translated.
+        math = next(document.findall(
+                        lambda node: isinstance(node, (nodes.math,
+                                                       nodes.math_block))),
+                    None)
+        if math is not None:
+            self.prepare_math_header(math)
+
+    def prepare_math_header(self, node) -> None:
+        # Set `self.math_header` (style sheets or scripts required by the
+        # "math_output") when called for the first math element `node`.
+        #
+        # Internal auxiliary method called from `self.visit_math()` and
+        # `Writer.translate_parts()`.
+        if self.math_header:
+            return
+        if self.math_output == 'html' and self.math_options:
+            self.math_header = [
+                self.stylesheet_call(utils.find_file_in_dirs(
+                    s, self.settings.stylesheet_dirs), adjust_path=True)
+                for s in self.math_options.split(',')]
+        elif self.math_output == 'mathjax':
+            if self.math_options:
+                self.mathjax_url = self.math_options
+            else:
+                self.document.reporter.warning(
+                    'No MathJax URL specified, using local fallback '
+                    '(see config.html).', base_node=node)
+            # append MathJax configuration
+            # (input LaTeX with AMS, output common HTML):
+            if '?' not in self.mathjax_url:
+                self.mathjax_url += '?config=TeX-AMS_CHTML'
+            self.math_header = [self.mathjax_script % self.mathjax_url]
+
     def prepare_svg(self, code: str, node: nodes.Element, atts: dict) -> str:
         # Parse SVG source `code` (ignoring comments and preamble code),
         # add relevant attributes from `node` and `atts` to the root element.
@@ -1191,7 +1292,7 @@ class HTMLTranslator(nodes.NodeVisitor):
                 if mimetype == 'image/svg+xml':
                     imagedata = Path(imagepath).read_text(encoding='utf-8')
                 else:
-                    imagedata = Path(imagepath).read_bytes()
+                    data_uri = image_info.cache.data_uri(imagepath)
             except (ValueError, OSError, UnicodeError) as err:
                 self.messages.append(self.document.reporter.error(
                     f'Cannot embed image "{uri}":\n  {err}', base_node=node))
@@ -1201,8 +1302,7 @@ class HTMLTranslator(nodes.NodeVisitor):
                 if mimetype == 'image/svg+xml':
                     element = self.prepare_svg(imagedata, node, atts)
                 else:
-                    data64 = base64.b64encode(imagedata).decode()
-                    uri = f'data:{mimetype};base64,{data64}'
+                    uri = data_uri
 
         # No newlines around inline images (but all images may be nested
         # in a `reference` node which is a `TextElement` instance):
@@ -1352,12 +1452,8 @@ class HTMLTranslator(nodes.NodeVisitor):
         math_code = node.astext().translate(unichar2tex.uni2tex_table)
 
         # preamble code and conversion
+        self.prepare_math_header(node)
         if format == 'html':
-            if self.math_options and not self.math_header:
-                self.math_header = [
-                    self.stylesheet_call(utils.find_file_in_dirs(
-                        s, self.settings.stylesheet_dirs), adjust_path=True)
-                    for s in self.math_options.split(',')]
             math2html.DocumentParameters.displaymode = is_block
             # TODO: fix display mode in matrices and fractions
             math_code = wrap_math_code(math_code, is_block)
@@ -1365,18 +1461,6 @@ class HTMLTranslator(nodes.NodeVisitor):
         elif format == 'latex':
             math_code = self.encode(math_code)
         elif format == 'mathjax':
-            if not self.math_header:
-                if self.math_options:
-                    self.mathjax_url = self.math_options
-                else:
-                    self.document.reporter.warning(
-                        'No MathJax URL specified, using local fallback '
-                        '(see config.html).', base_node=node)
-                # append MathJax configuration
-                # (input LaTeX with AMS, output common HTML):
-                if '?' not in self.mathjax_url:
-                    self.mathjax_url += '?config=TeX-AMS_CHTML'
-                self.math_header = [self.mathjax_script % self.mathjax_url]
             if is_block:
                 math_code = wrap_math_code(math_code, is_block)
             else:
@@ -61,6 +61,30 @@ class Writer(writers.Writer):
         self.document.walkabout(visitor)
         self.output = ''.join(visitor.output)
 
+    def translate_parts(self):
+        """Yield the XML representation of `self.document` in parts.
+
+        Sections are split into their children.
+        """
+        self.visitor = visitor = self.translator_class(self.document)
+
+        def walk(node):
+            # Like `node.walkabout(visitor)`, yield after every child
+            # of a document or section.
+            if isinstance(node, (nodes.document, nodes.section)):
+                visitor.dispatch_visit(node)
+                for child in node.children:
+                    yield from walk(child)
+                visitor.dispatch_departure(node)
+            else:
+                node.walkabout(visitor)
+            yield
+
+        for _ in walk(self.document):
+            if visitor.output:
+                yield ''.join(visitor.output)
+                visitor.output = []
+
 
 class XMLTranslator(nodes.GenericNodeVisitor):
 
@@ -18,8 +18,8 @@ import os.path
 import re
 
 from docutils import frontend, nodes, writers
+from docutils.utils import image_info
 from docutils.writers import _html_base
-from docutils.writers._html_base import PIL
 
 
 class Writer(writers._html_base.Writer):
@@ -569,16 +569,16 @@ class HTMLTranslator(writers._html_base.HTMLTranslator):
         if 'height' in node:
             atts['height'] = node['height']
         if 'scale' in node:
-            if (PIL and ('width' not in node or 'height' not in node)
+            if (('width' not in node or 'height' not in node)
                 and self.settings.file_insertion_enabled):
                 try:
                     imagepath = self.uri2imagepath(uri)
-                    with PIL.Image.open(imagepath) as img:
-                        img_size = img.size
+                    img_size = image_info.cache.size(imagepath)
                 except (ValueError, OSError, UnicodeEncodeError) as e:
                     self.document.reporter.warning(
                         f'Problem reading image file: {e}')
-                else:
+                    img_size = None
+                if img_size:
                     self.settings.record_dependencies.add(
                         imagepath.replace('\\', '/'))
                     if 'width' not in atts:
@@ -128,6 +128,15 @@ class HTMLTranslator(_html_base.HTMLTranslator):
         self.meta.append('<meta name="viewport" '
                          'content="width=device-width, initial-scale=1" />\n')
 
+    def prepare_head(self, document) -> None:
+        # Set the body class for a table of contents (cf. `visit_topic()`).
+        super().prepare_head(document)
+        for child in document:
+            if (isinstance(child, nodes.topic)
+                    and 'contents' in child['classes']):
+                self.body_prefix[0] = '</head>\n<body class="with-toc">\n'
+                break
+
     # <acronym> tag obsolete in HTML5. Use the <abbr> tag instead.
     def visit_acronym(self, node) -> None:
         # @@@ implementation incomplete ("title" attribute)
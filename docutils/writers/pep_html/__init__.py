@@ -12,7 +12,7 @@ __docformat__ = 'reStructuredText'
 import os
 import os.path
 
-from docutils import frontend, nodes, utils
+from docutils import frontend, nodes, utils, writers
 from docutils.writers import html4css1
 
 
@@ -87,6 +87,10 @@ class Writer(html4css1.Writer):
             self.body_pre_docinfo + self.docinfo + self.body)
         return subs
 
+    def translate_parts(self):
+        # The PEP template uses the complete body.
+        return writers.Writer.translate_parts(self)
+
     def assemble_parts(self) -> None:
         html4css1.Writer.assemble_parts(self)
         self.parts['title'] = [self.title]
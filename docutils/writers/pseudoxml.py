@@ -9,7 +9,7 @@ Simple internal document tree Writer, writes indented pseudo-XML.
 __docformat__ = 'reStructuredText'
 
 
-from docutils import writers, frontend
+from docutils import frontend, nodes, writers
 
 
 class Writer(writers.Writer):
@@ -35,6 +35,22 @@ class Writer(writers.Writer):
     def translate(self) -> None:
         self.output = self.document.pformat()
 
+    def translate_parts(self):
+        """Yield the pseudo-XML representation of `self.document` in parts.
+
+        Sections are split into their children (cf. `nodes.Element.pformat()`).
+        """
+        def node_parts(node, level):
+            if (isinstance(node, (nodes.document, nodes.section))
+                    and node.__class__.pformat is nodes.Element.pformat):
+                yield '%s%s\n' % ('    '*level, node.starttag())
+                for child in node.children:
+                    yield from node_parts(child, level+1)
+            else:
+                yield node.pformat('    ', level)
+
+        return node_parts(self.document, 0)
+
     def supports(self, format) -> bool:
         """This writer supports all format-specific elements."""
         return True
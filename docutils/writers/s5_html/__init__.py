@@ -15,7 +15,7 @@ import sys
 from pathlib import Path
 
 import docutils
-from docutils import frontend, nodes, utils
+from docutils import frontend, nodes, utils, writers
 from docutils.writers import html4css1
 
 themes_dir_path = utils.relative_path(
@@ -91,6 +91,10 @@ class Writer(html4css1.Writer):
         html4css1.Writer.__init__(self)
         self.translator_class = S5HTMLTranslator
 
+    def translate_parts(self):
+        # The slide layout depends on the complete body.
+        return writers.Writer.translate_parts(self)
+
 
 class S5HTMLTranslator(html4css1.HTMLTranslator):
 
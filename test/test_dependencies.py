@@ -22,7 +22,6 @@ if __name__ == '__main__':
 import docutils.core
 import docutils.utils
 import docutils.io
-from docutils.parsers.rst.directives.images import PIL
 from docutils.writers import html4css1, html5_polyglot, latex2e, docutils_xml
 
 TEST_ROOT = Path(__file__).parent  # ./test/ from the docutils root
@@ -74,7 +73,7 @@ class RecordDependenciesTests(unittest.TestCase):
         # parsing even if not used in the chosen output format.
         # This should change (see parsers/rst/directives/misc.py).
         keys = ['include', 'raw']
-        if PIL and os.path.exists('../docs/user/rst/images/'):
+        if os.path.exists('../docs/user/rst/images/'):
             keys += ['figure-image']
         expected = [paths[key] for key in keys]
         record, _output = self.get_record(writer=docutils_xml.Writer())
@@ -83,13 +82,13 @@ class RecordDependenciesTests(unittest.TestCase):
 
     def test_dependencies_html(self):
         keys = ['include', 'raw']
-        if PIL and os.path.exists('../docs/user/rst/images/'):
+        if os.path.exists('../docs/user/rst/images/'):
             keys += ['figure-image', 'scaled-image']
         expected = [paths[key] for key in keys]
         # stylesheets are tested separately in test_stylesheet_dependencies():
         settings = {'stylesheet_path': None,
                     'stylesheet': None,
-                    'report_level': 4}  # drop warning if PIL is missing
+                    'report_level': 4}
         record, output = self.get_record(writer=html5_polyglot.Writer(),
                                          settings_overrides=settings)
         # the order of the files is arbitrary
@@ -102,7 +101,7 @@ class RecordDependenciesTests(unittest.TestCase):
         # parsing even if not used in the chosen output format.
         # This should change (see parsers/rst/directives/misc.py).
         keys = ['include', 'raw']
-        if PIL and os.path.exists('../docs/user/rst/images/'):
+        if os.path.exists('../docs/user/rst/images/'):
             keys += ['figure-image']
         expected = [paths[key] for key in keys]
         record, output = self.get_record(
@@ -13,6 +13,7 @@ import locale
 import os.path
 import sys
 import unittest
+from unittest import mock
 import warnings
 from io import StringIO, BytesIO
 from pathlib import Path
@@ -221,6 +222,29 @@ class OutputTests(unittest.TestCase):
                               encoding='latin1', autoclose=False)
         self.assertRaises(ValueError, fo.write, self.udata)
 
+    def test_write_parts(self):
+        fo = du_io.FileOutput(destination=self.udrain, encoding='utf-8',
+                              autoclose=False)
+        fo.write_parts(iter(['a', self.udata, 'b']))
+        self.assertEqual('a' + self.udata + 'b', self.udrain.getvalue())
+
+    def test_write_parts_encoded(self):
+        # with an encoding clash, the parts are encoded one at a time
+        # (with only one BOM)
+        fo = du_io.FileOutput(destination=self.mock_stdout,
+                              encoding='utf-16', autoclose=False)
+        with mock.patch.object(fo, 'write', wraps=fo.write) as write:
+            fo.write_parts(iter(['a', self.udata, 'b']))
+        self.assertEqual(write.call_count, 3)
+        self.assertEqual(('a' + self.udata + 'b').encode('utf-16'),
+                         self.mock_stdout.buffer.getvalue())
+
+    def test_write_parts_encoding_error(self):
+        fo = du_io.FileOutput(destination=self.mock_stdout,
+                              encoding='ascii', autoclose=False)
+        with self.assertRaisesRegex(UnicodeError, 'output-encoding is: ascii'):
+            fo.write_parts(iter(['a', self.udata]))
+
 
 class ErrorOutputTests(unittest.TestCase):
     def test_defaults(self):
@@ -7,7 +7,9 @@
 Test module for nodes.py.
 """
 
+import io
 from pathlib import Path
+import pickle
 import sys
 import unittest
 
@@ -105,6 +107,21 @@ class NodeTests(unittest.TestCase):
         self.assertEqual(e[0][0].next_node(ascend=True), e[0][1])
         self.assertEqual(e[2].next_node(), None)
 
+    def test_document(self):
+        document = utils.new_document('test data')
+        text = nodes.Text('text')
+        paragraph = nodes.paragraph('', '', nodes.emphasis('', '', text))
+        quote = nodes.block_quote('', paragraph)
+        self.assertIsNone(text.document)
+        document += quote
+        # the document is passed on to all descendants
+        self.assertIs(text._document, document)
+        self.assertIs(text.document, document)
+        # nodes moved to another document refer to the new document
+        other = utils.new_document('other test data')
+        other += nodes.section('', paragraph)
+        self.assertIs(text.document, other)
+
 
 class TextTests(unittest.TestCase):
 
@@ -233,6 +250,50 @@ class ElementTests(unittest.TestCase):
         self.assertEqual(c1.previous_sibling(), None)
         self.assertEqual(c2.previous_sibling(), c1)
 
+    def test_sibling_positions(self):
+        # Sibling navigation uses the position of a node in its parent
+        # stored during the last lookup.  It must stay correct when the
+        # children are modified.
+        e = nodes.Element()
+        children = [nodes.Element(), nodes.Text('sample'),
+                    nodes.Element(), nodes.Text('sample'), nodes.Element()]
+        e.extend(children)
+        # Text nodes are located by identity, not by value:
+        self.assertIs(e[3].next_node(siblings=True), e[4])
+        self.assertIs(e[1].next_node(siblings=True, descend=False), e[2])
+        new = nodes.Element()
+        e.insert(0, new)
+        self.assertEqual(e.index(children[2]), 3)
+        self.assertIs(children[2].previous_sibling(), children[1])
+        self.assertIs(children[0].previous_sibling(), new)
+        e.remove(children[2])
+        self.assertEqual(e.index(children[4]), 4)
+        self.assertIs(children[4].previous_sibling(), children[3])
+        e[0:2] = [children[2]]
+        self.assertEqual(e.index(children[2]), 0)
+        self.assertEqual(e.index(children[4]), 3)
+        with self.assertRaises(ValueError):
+            e.index(new)
+        with self.assertRaises(ValueError):
+            e.remove(children[0])
+        e[3].replace_self(new)
+        self.assertIs(e[3], new)
+        self.assertEqual(e.index(new), 3)
+
+    def test_findall_modified_siblings(self):
+        # The following siblings are visited as they were when the
+        # iteration reached them, even if the children are modified.
+        e = nodes.Element()
+        children = [nodes.Element(), nodes.Element(), nodes.Element()]
+        e.extend(children)
+        visited = []
+        for node in children[0].findall(siblings=True, include_self=False):
+            visited.append(node)
+            if node is children[1]:
+                e.remove(children[2])
+                e.append(nodes.Element())
+        self.assertEqual(visited, children[1:])
+
     def test_clear(self):
         element = nodes.Element()
         element += nodes.Element()
@@ -270,6 +331,34 @@ class ElementTests(unittest.TestCase):
                          {'ids': ['someid']})
         self.assertTrue(element.is_not_default('ids'))
 
+    def test_lazy_list_attributes(self):
+        # list attributes are stored on first access
+        element = nodes.Element()
+        self.assertEqual({}, dict(element.attributes))
+        self.assertTrue('ids' in element)
+        self.assertTrue(element.hasattr('classes'))
+        self.assertEqual(element.attributes, {'ids': [], 'classes': [],
+                                              'names': [], 'dupnames': []})
+        element.get('ids').append('someid')
+        element.setdefault('classes').append('cls')
+        element['names'] += ['somename']
+        self.assertEqual(dict(element.attributes), {'ids': ['someid'],
+                                                    'classes': ['cls'],
+                                                    'names': ['somename']})
+        self.assertEqual(element.get('foo', 'default'), 'default')
+        # not a list attribute of `Element`:
+        self.assertRaises(KeyError, element.__getitem__, 'backrefs')
+        self.assertEqual(nodes.footnote()['backrefs'], [])
+        # empty lists are not stored
+        self.assertEqual({}, dict(nodes.Element(ids=[]).attributes))
+        # list attributes of a new node can be deleted
+        element = nodes.paragraph()
+        element.delattr('ids')
+        del element['classes']
+        self.assertEqual(element.attributes.pop('names'), [])
+        self.assertEqual({}, dict(element.attributes))
+        self.assertEqual(element['ids'], [])
+
     def test_update_basic_atts(self):
         element1 = nodes.Element(ids=['foo', 'bar'], test=['test1'])
         element2 = nodes.Element(ids=['baz', 'qux'], test=['test2'])
@@ -407,6 +496,12 @@ class ElementTests(unittest.TestCase):
         # Children are not copied.
         self.assertEqual(len(e_copy), 0)
 
+    def test_pickle(self):
+        element = nodes.footnote(ids=['foo'])
+        copy = pickle.loads(pickle.dumps(element))
+        self.assertEqual(element.attributes, copy.attributes)
+        self.assertEqual(copy['backrefs'], [])
+
     def test_deepcopy(self):
         # Deep copy:
         grandchild = nodes.Text('grandchild text')
@@ -474,6 +569,64 @@ class ElementTests(unittest.TestCase):
         self.assertEqual(len(parent), 5)
 
 
+class NodeIndexTests(unittest.TestCase):
+
+    def setUp(self):
+        self.document = utils.new_document('test data')
+        self.document += nodes.section(
+            '', nodes.title('', 'Title'),
+            nodes.paragraph('', 'one ', nodes.emphasis('', 'two')))
+        self.document += nodes.paragraph('', 'three')
+        self.document.enable_node_index()
+
+    def check(self, condition):
+        # compare with the result of a document tree traversal
+        self.assertEqual(list(self.document.findall(condition)),
+                         list(nodes.Node.findall(self.document, condition)))
+
+    def test_findall(self):
+        self.assertIsNotNone(self.document.node_index)
+        self.check(nodes.paragraph)
+        self.check(nodes.TextElement)
+        self.check(nodes.Element)  # includes the document
+        self.check(nodes.Text)  # not indexed, traverse the tree
+        self.check(nodes.reference)
+
+    def test_add_nodes(self):
+        section = self.document[0]
+        section.insert(1, nodes.paragraph('', 'zero'))
+        section[-1] += nodes.paragraph()  # invalid, but indexed
+        section[-1][1].replace_self(nodes.strong('', 'five'))
+        subsection = nodes.section('', nodes.paragraph('', 'four'))
+        section.append(subsection)
+        self.check(nodes.paragraph)
+        self.check(nodes.Inline)
+        self.assertEqual(len(list(self.document.findall(nodes.section))), 2)
+
+    def test_remove_nodes(self):
+        section = self.document[0]
+        paragraph = section[1]
+        section.remove(paragraph)
+        self.check(nodes.paragraph)
+        self.check(nodes.emphasis)
+        self.assertNotIn(id(paragraph),
+                         self.document.node_index[nodes.paragraph])
+        # re-insert removed element
+        self.document.append(paragraph)
+        self.check(nodes.paragraph)
+        self.check(nodes.emphasis)
+
+    def test_disable(self):
+        self.document.disable_node_index()
+        self.assertIsNone(self.document.node_index)
+        self.document += nodes.paragraph('', 'four')
+        self.check(nodes.paragraph)
+
+    def test_pickle(self):
+        copy = pickle.loads(pickle.dumps(self.document))
+        self.assertIsNone(copy.node_index)
+
+
 class ColspecTests(unittest.TestCase):
 
     def test_propwidth(self):
@@ -941,6 +1094,39 @@ class NodeVisitorTests(unittest.TestCase):
         rv = self.visitor.dispatch_visit(nodes.meta())
         self.assertIsNone(rv)
 
+    def test_dispatch_methods(self):
+        # methods are looked up once per node class and visitor instance
+        visitor = nodes.SparseNodeVisitor(self.document)
+        log = []
+        visitor.visit_paragraph = log.append  # instance attribute
+        paragraph = nodes.paragraph()
+        visitor.dispatch_visit(paragraph)
+        visitor.dispatch_visit(paragraph)
+        visitor.dispatch_departure(paragraph)
+        self.assertEqual(log, [paragraph, paragraph])
+        self.assertEqual(visitor._visit_methods,
+                         {nodes.paragraph: log.append})
+        self.assertIn(nodes.paragraph, visitor._depart_methods)
+
+    def test_dispatch_without_init(self):
+        class Visitor(nodes.SparseNodeVisitor):
+            def __init__(self, document):
+                self.document = document  # no NodeVisitor.__init__() call
+
+        visitor = Visitor(self.document)
+        visitor.dispatch_visit(nodes.paragraph())
+        visitor.dispatch_departure(nodes.paragraph())
+
+    def test_dispatch_debug(self):
+        stream = io.StringIO()
+        self.document.reporter.stream = stream
+        self.document.reporter.debug_flag = True
+        visitor = nodes.SparseNodeVisitor(self.document)
+        visitor.dispatch_visit(nodes.paragraph())
+        self.assertEqual('test:: (DEBUG/0) docutils.nodes.NodeVisitor'
+                         '.dispatch_visit calling _nop for paragraph\n',
+                         stream.getvalue())
+
 
 class MiscFunctionTests(unittest.TestCase):
 
@@ -49,6 +49,23 @@ class GridTableParserTestCase(unittest.TestCase):
                         output = f'{details.__class__.__name__}: {details}'
                     self.assertEqual(case_expected, output)
 
+    def test_get_cell_block(self):
+        # same result as `StringList.get_2D_block()`
+        # (which also handles lines with combining characters)
+        parser = tableparser.GridTableParser()
+        lines = ['+-------+------+',
+                 '|   a   | b    |',
+                 '| t\u0306ab\u0306le | c    |',
+                 '|  x    |      |',
+                 '+-------+------+']
+        parser.setup(StringList(lines, 'test data'))
+        self.assertEqual(parser.combining_lines, [2])
+        for top, left, bottom, right in ((0, 0, 4, 8), (0, 8, 4, 15),
+                                         (2, 0, 4, 8), (0, 0, 2, 8)):
+            self.assertEqual(
+                parser.get_cell_block(top, left, bottom, right),
+                parser.block.get_2D_block(top+1, left+1, bottom, right))
+
 
 totest = {}
 
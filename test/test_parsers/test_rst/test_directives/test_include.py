@@ -7,9 +7,12 @@
 Tests for misc.py "include" directive.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import os.path
+import tempfile
 import unittest
+from unittest import mock
 import sys
 
 if __name__ == '__main__':
@@ -20,6 +23,7 @@ if __name__ == '__main__':
 from docutils import core, parsers, utils
 from docutils.frontend import get_default_settings
 from docutils.parsers.rst import Parser
+from docutils.parsers.rst.directives.misc import Include
 from docutils.utils import new_document
 from docutils.utils.code_analyzer import with_pygments
 from test.test_parsers.test_rst.test_directives.test_code \
@@ -75,6 +79,78 @@ class ParserTestCase(unittest.TestCase):
                                              settings_overrides=settings)
                 self.assertEqual(expected, output)
 
+    def test_file_cache(self):
+        parser = Parser()
+        settings = get_default_settings(Parser)
+        settings.warning_stream = ''
+
+        def parse(sample):
+            settings.record_dependencies = utils.DependencyList()
+            document = new_document('test data', settings.copy())
+            parser.parse(sample, document)
+            return document.astext(), settings.record_dependencies.list
+
+        with tempfile.TemporaryDirectory() as tmpdir, \
+             mock.patch.object(Include, 'file_cache', {}), \
+             mock.patch.object(Include, 'file_cache_size', 2):
+            path = Path(tmpdir) / 'snippet.rst'
+            path.write_text('first line\n\nsecond line\n', encoding='utf-8')
+            sample = f'.. include:: {path.as_posix()}\n'
+            self.assertEqual(parse(sample)[0], 'first line\n\nsecond line')
+            self.assertEqual(len(Include.file_cache), 1)
+            # cached content, the dependency is still recorded
+            with mock.patch('docutils.io.FileInput') as file_input:
+                text, dependencies = parse(sample)
+            file_input.assert_not_called()
+            self.assertEqual(text, 'first line\n\nsecond line')
+            self.assertEqual(dependencies, [utils.relative_path(None, path)])
+            # changed file
+            path.write_text('changed\n', encoding='utf-8')
+            self.assertEqual(parse(sample)[0], 'changed')
+            # separate entries for different clip options,
+            # least recently used entries are removed
+            sample += '   :end-line: 1\n'
+            path.write_text('line 1\n\nline 3\n', encoding='utf-8')
+            self.assertEqual(parse(sample)[0], 'line 1')
+            self.assertEqual(len(Include.file_cache), 2)
+            self.assertEqual(
+                [key[-1] for key in Include.file_cache],
+                [(None, None, '', ''), (None, 1, '', '')])
+            # the total length of the cached texts is limited, too
+            with mock.patch.object(Include, 'file_cache_max_chars', 10):
+                path.write_text('line 1\n\n3\n', encoding='utf-8')
+                self.assertEqual(parse(sample)[0], 'line 1')
+                self.assertEqual(list(Include.file_cache.values()),
+                                 ['line 1'])
+                # longer texts are not cached
+                path.write_text('line 1\n\nline 3\n', encoding='utf-8')
+                parse(sample.replace(':end-line: 1', ':end-line: 3'))
+                self.assertEqual(list(Include.file_cache.values()),
+                                 ['line 1'])
+
+    def test_file_cache_threads(self):
+        # The cache is shared by documents parsed in several threads.
+        settings = get_default_settings(Parser)
+        settings.warning_stream = ''
+
+        def parse(sample):
+            document = new_document('test data', settings.copy())
+            Parser().parse(sample, document)
+            return document.astext()
+
+        with tempfile.TemporaryDirectory() as tmpdir, \
+             mock.patch.object(Include, 'file_cache', {}), \
+             mock.patch.object(Include, 'file_cache_size', 3):
+            samples = {}
+            for i in range(8):
+                path = Path(tmpdir) / f'snippet{i}.rst'
+                path.write_text(f'snippet {i}\n', encoding='utf-8')
+                samples[f'.. include:: {path.as_posix()}\n'] = f'snippet {i}'
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(parse, list(samples) * 20))
+            self.assertEqual(results, list(samples.values()) * 20)
+            self.assertEqual(len(Include.file_cache), 3)
+
 
 try:
     chr(0x11111111)
@@ -13,7 +13,9 @@ import csv
 import platform
 from pathlib import Path
 import sys
+import tempfile
 import unittest
+from unittest import mock
 
 if __name__ == '__main__':
     # prepend the "docutils root" to the Python library path
@@ -21,7 +23,8 @@ if __name__ == '__main__':
     sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
 
 from docutils.frontend import get_default_settings
-from docutils.parsers.rst import Parser
+from docutils.parsers.rst import Parser, states
+from docutils.parsers.rst.directives import tables
 from docutils.utils import new_document
 
 # TEST_ROOT is ./test/ from the docutils root
@@ -46,6 +49,168 @@ class ParserTestCase(unittest.TestCase):
                     self.assertEqual(case_expected, output)
 
 
+class PlainParagraphTests(unittest.TestCase):
+
+    def parse(self, text):
+        settings = get_default_settings(Parser)
+        settings.warning_stream = ''
+        settings.halt_level = 5
+        document = new_document('test data', settings)
+        Parser().parse(text, document)
+        return document.pformat()
+
+    def check_shortcut(self, text):
+        # Check that the shortcut for cells with plain text gives
+        # the same result as the nested parse.
+        # Return the texts of the plain paragraphs.
+        with mock.patch.object(states.Body, 'plain_paragraph',
+                               return_value=None):
+            expected = self.parse(text)
+        results = []
+        original = states.Body.plain_paragraph
+
+        def plain_paragraph(state, block):
+            results.append(original(state, block))
+            return results[-1]
+
+        with mock.patch.object(states.Body, 'plain_paragraph',
+                               autospec=True, side_effect=plain_paragraph):
+            self.assertEqual(self.parse(text), expected)
+        return [paragraph.astext() for paragraph in results
+                if paragraph is not None]
+
+    def test_markup_cells(self):
+        # Cells with inline markup or starting like a body element
+        # are parsed as before.
+        text = """\
+.. |sub| replace:: substitution
+
+.. csv-table::
+
+   .. note:: directive, .. comment, .. _target: https://example.org
+   :field: list, -a  option, --long=arg  option
+   * bullet, + bullet, (i) roman
+   >>> doctest, ``literal``, :emphasis:`role`
+   `interpreted`, _`inline target`, |sub| reference
+   "| line", "-- attribution", plain: colon
+   "  indented", "::", 12. Dec. 2024
+   A. Author, end with `, "trailing space "
+
++------------------+---------------------+--------------+
+| .. note:: grid   | :field: list        | - item       |
++------------------+---------------------+--------------+
+| **strong**       | text_ reference     | plain cell   |
++------------------+---------------------+--------------+
+| 1) enumerated    | ``literal`` text    | |sub|        |
++------------------+---------------------+--------------+
+
+.. _text: https://example.org/text
+"""
+        # "--" starts an attribution only in a block quote
+        self.assertEqual(self.check_shortcut(text),
+                         ['-- attribution', 'plain cell'])
+
+    def test_plain_paragraph(self):
+        # The shortcut for cells with plain text gives the same result
+        # as the nested parse.
+        text = """\
+.. csv-table:: Plain and not so plain cells
+   :header-rows: 1
+
+   plain text, *emphasis*, 1. enumerated, https://example.org
+   "two
+   lines", trailing::, - item, a_ reference
+   ========, | line, [#]_ footnote, 42
+
+.. _a: https://example.org/a
+.. [#] footnote
+"""
+        # only "plain text" and "42" are plain paragraphs:
+        self.assertEqual(self.check_shortcut(text), ['plain text', '42'])
+
+
+class CSVFileTests(unittest.TestCase):
+
+    def parse(self, text):
+        settings = get_default_settings(Parser)
+        settings.warning_stream = ''
+        document = new_document('test data', settings)
+        Parser().parse(text, document)
+        return document.pformat()
+
+    def test_read_file_twice(self):
+        # The file is read line by line in two passes: first to get the
+        # table dimensions, then to build the rows.  The rows are not
+        # kept in memory.
+        data = 'a, b\nc, d, e\nf\n'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'data.csv'
+            path.write_text(data, encoding='utf-8')
+            lines = []
+            read_lines = tables.CSVTable.read_lines
+
+            def record_lines(csv_file):
+                for line in read_lines(csv_file):
+                    lines.append(line)
+                    yield line
+
+            with mock.patch.object(tables.CSVTable, 'read_lines',
+                                   record_lines):
+                output = self.parse('.. csv-table::\n'
+                                    '   :header-rows: 1\n'
+                                    f'   :file: {path.as_posix()}\n')
+        self.assertEqual(lines, data.splitlines() * 2)
+        expected = self.parse('.. csv-table::\n'
+                              '   :header-rows: 1\n\n'
+                              '   a, b\n'
+                              '   c, d, e\n'
+                              '   f\n')
+        self.assertEqual(output.replace(path.as_posix(), 'test data'),
+                         expected)
+
+    def test_table_dimensions(self):
+        # The dimensions are checked before the rows are built.
+        output = self.parse('.. csv-table::\n'
+                            '   :header-rows: 2\n'
+                            '   :stub-columns: 2\n\n'
+                            '   a, b, c\n'
+                            '   d, e\n'
+                            '   f\n')
+        # the first row with too few columns is reported
+        self.assertIn('Insufficient data supplied (2 columns(s))', output)
+        self.assertNotIn('<table', output)
+
+
+    def test_malformed_rows(self):
+        # Errors in rows after the first are reported as system messages,
+        # also if they occur while the table is built (second pass).
+        text = ('.. csv-table::\n'
+                '   :header-rows: 1\n\n'
+                '   a, b\n'
+                '   c, d\n'
+                '   "e"f, g\n')
+        output = self.parse(text)
+        self.assertIn('Error with CSV data in "csv-table" directive:',
+                      output)
+        self.assertNotIn('<table', output)
+        read_csv_rows = tables.CSVTable.read_csv_rows
+        passes = []
+
+        def read_changed_rows(directive, csv_data, dialect):
+            # rows of data changed after the first pass
+            passes.append(csv_data)
+            if len(passes) > 1:
+                csv_data = [*csv_data[:2], '"e"f, g']
+            return read_csv_rows(directive, csv_data, dialect)
+
+        with mock.patch.object(tables.CSVTable, 'read_csv_rows',
+                               read_changed_rows):
+            output = self.parse(text.replace('"e"f', 'e'))
+        self.assertEqual(len(passes), 2)
+        self.assertIn('Error with CSV data in "csv-table" directive:',
+                      output)
+        self.assertNotIn('<table', output)
+
 mydir = os.path.join(TEST_ROOT, 'test_parsers/test_rst/test_directives')
 utf_16_csv = os.path.join(mydir, 'utf-16.csv')
 empty_txt = os.path.join(mydir, 'empty.rst')
@@ -0,0 +1,172 @@
+#! /usr/bin/env python3
+# $Id$
+# Copyright: This module has been placed in the public domain.
+
+"""
+Tests for the incremental parser (docutils.parsers.rst.incremental).
+"""
+
+import io
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+if __name__ == '__main__':
+    # prepend the local "docutils root" to the Python library path
+    sys.path.insert(0, Path(__file__).resolve().parents[3].as_posix())
+
+from docutils import frontend, nodes, utils
+from docutils.parsers.rst import Parser, parallel
+from docutils.parsers.rst.incremental import IncrementalParser
+
+
+section = """\
+Section %(n)s
+%(equals)s
+
+Paragraph with a footnote [#]_ and `link %(n)s <https://example.org/%(n)s>`_.
+
+.. [#] Auto-numbered footnote.
+
+Subsection %(n)s
+%(dashes)s
+
+A paragraph.
+
+"""
+
+
+def sections(number):
+    return [section % {'n': n, 'equals': '=' * (8 + len(str(n))),
+                       'dashes': '-' * (11 + len(str(n)))}
+            for n in range(number)]
+
+
+class IncrementalParserTests(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = IncrementalParser()
+        self.parser.chunk_lines = 5
+
+    def parse(self, text, parser):
+        # Return the parsed document, the line numbers of its elements,
+        # the warnings, the messages not attached to the document, and
+        # the number of parsed chunks.
+        settings = frontend.get_default_settings(Parser)
+        settings.warning_stream = io.StringIO()
+        settings.halt_level = 5
+        document = utils.new_document('test data', settings)
+        with mock.patch.object(parallel, '_parse_chunk',
+                               wraps=parallel._parse_chunk) as parse_chunk:
+            parser.parse(text, document)
+        lines = [(node.tagname, node.line)
+                 for node in document.findall(nodes.Element)]
+        loose_messages = [message.astext() for message
+                          in document.parse_messages
+                          if message.parent is None]
+        return (document.pformat(), lines,
+                settings.warning_stream.getvalue(), loose_messages,
+                parse_chunk.call_count)
+
+    def check(self, text, parsed_chunks):
+        expected = self.parse(text, Parser())[:-1]
+        self.assertEqual(self.parse(text, self.parser),
+                         (*expected, parsed_chunks))
+        return expected
+
+    def test_edit(self):
+        parts = sections(6)
+        self.check(''.join(parts), 12)
+        self.check(''.join(parts), 0)
+        # changed text in one chunk:
+        parts[2] = parts[2].replace('A paragraph.', 'Changed *text*.')
+        self.check(''.join(parts), 1)
+
+    def test_line_numbers(self):
+        # Chunks following an insertion get new line numbers.
+        parts = sections(6)
+        self.check(''.join(parts), 12)
+        parts[0] = parts[0].replace('A paragraph.', 'Two\n\nparagraphs.')
+        self.check(''.join(parts), 1)
+
+    def test_included_file(self):
+        # Chunks are parsed again if an included file changed.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            included = Path(tmpdir) / 'included.rst'
+            included.write_text('Old text.\n', encoding='utf-8')
+            parts = sections(6)
+            parts[1] += f'.. include:: {included.as_posix()}\n\n'
+            self.check(''.join(parts), 12)
+            self.check(''.join(parts), 0)
+            included.write_text('New and\nlonger text.\n',
+                                encoding='utf-8')
+            self.check(''.join(parts), 1)
+            self.assertIn('longer text.',
+                          self.parse(''.join(parts), self.parser)[0])
+            # chunks with a missing included file are not re-used:
+            included.unlink()
+            self.check(''.join(parts), 1)
+            self.check(''.join(parts), 1)
+
+    def test_escaped_digits(self):
+        # Backslash-escaped digits (null-escaped in the parser) are
+        # kept in re-used chunks.
+        parts = sections(6)
+        parts[2] = parts[2].replace('A paragraph.', 'Digits a\\0\\b.')
+        self.check(''.join(parts), 12)
+        self.assertIn('Digits a0b.',
+                      self.parse(''.join(parts), self.parser)[0])
+
+    def test_duplicate_names(self):
+        # Names used in more than one chunk are registered like in a
+        # serial parse ("dupnames", system messages).  The chunks are
+        # re-used.
+        parts = sections(6)
+        self.check(''.join(parts), 12)
+        parts.append(parts[2])
+        self.check(''.join(parts), 0)
+        parts.insert(1, 'New text.\n\n')
+        self.check(''.join(parts), 1)
+
+    def test_system_messages(self):
+        # Edited and moved chunks report the same system messages as a
+        # serial parse.
+        parts = sections(6)
+        self.check(''.join(parts), 12)
+        # too short title underline (examined twice in a serial parse):
+        parts[3] = parts[3].replace('Section 3\n=========',
+                                    'Section 3 (edited)\n==========')
+        self.check(''.join(parts), 1)
+        parts[0] = parts[0].replace('A paragraph.', 'Two\n\nparagraphs.')
+        _, _, warnings, loose_messages = self.check(''.join(parts), 1)
+        self.assertEqual(warnings.count('Title underline too short.'), 2)
+        self.assertEqual(len(loose_messages), 1)
+
+    def test_document(self):
+        # A document with an included header and repeated section titles.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            header = Path(tmpdir) / 'header.rst'
+            header.write_text('.. |project| replace:: Docutils\n\n'
+                              '.. _home: https://docutils.sourceforge.io\n',
+                              encoding='utf-8')
+            parts = [f'.. include:: {header.as_posix()}\n\n'
+                     'The |project| manual.\n\n'
+                     '.. contents::\n\n']
+            for n in range(6):
+                parts.append(f'Command {n}\n==========\n\n'
+                             f'Use ``command {n}`` with |project|.\n\n'
+                             'Examples\n--------\n\n'
+                             f'* ``command {n} --help``\n\n'
+                             'Notes\n-----\n\n'
+                             'See home_.\n\n')
+            self.check(''.join(parts), 19)
+            self.check(''.join(parts), 0)
+            parts[2] = parts[2].replace('Notes\n-----\n\n',
+                                        'Notes\n-----\n\nA\n\nnew note.\n\n')
+            self.check(''.join(parts), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
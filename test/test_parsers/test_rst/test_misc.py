@@ -8,6 +8,7 @@ Tests for basic functionality of parser classes.
 """
 
 from pathlib import Path
+import re
 import sys
 import unittest
 
@@ -15,8 +16,9 @@ if __name__ == '__main__':
     # prepend the local "docutils root" to the Python library path
     sys.path.insert(0, Path(__file__).resolve().parents[2].as_posix())
 
-from docutils import frontend, utils
+from docutils import frontend, nodes, utils
 import docutils.parsers.rst
+from docutils.parsers.rst import states
 
 
 class RstParserTests(unittest.TestCase):
@@ -29,6 +31,137 @@ class RstParserTests(unittest.TestCase):
         with self.assertRaises(TypeError):
             parser.parse(b'hol', document)
 
+    def parse(self, text):
+        parser = docutils.parsers.rst.Parser()
+        settings = frontend.get_default_settings(parser)
+        settings.report_level = 5
+        document = utils.new_document('test data', settings)
+        parser.parse(text, document)
+        return document.pformat()
+
+    def test_nested_list_state_machines(self):
+        # State machines for nested lists are taken from a pool.
+        # Reused state machines must give the same results as new ones.
+        text = """\
+#. auto
+#. enumerated
+
+   a) nested
+   b) list
+
+      * bullet
+      * list
+
+3. explicit
+4. enumerated
+
+:field: list
+:other: field
+
+   term
+      definition
+
+-a  option
+-b  list
+
+| line
+| block
+
+i. roman
+ii. numerals
+"""
+        states.RSTState.nested_list_sm_cache.clear()
+        expected = self.parse(text)
+        pools = states.RSTState.nested_list_sm_cache
+        self.assertTrue(pools)
+        # one state machine per nesting level:
+        self.assertEqual(max(len(pool) for pool in pools.values()), 2)
+        self.assertEqual(self.parse(text), expected)
+
+    def test_nested_list_state_machine_reset(self):
+        # A pooled state machine keeps neither the extra settings
+        # nor references to the document of the previous list.
+        states.RSTState.nested_list_sm_cache.clear()
+        self.parse('#. auto\n#. enumerated\n')
+        (pool,) = [pool for key, pool
+                   in states.RSTState.nested_list_sm_cache.items()
+                   if key[2] == 'EnumeratedList']
+        (state_machine,) = pool
+        for key in ('auto', 'format', 'lastordinal'):
+            self.assertNotIn(key, vars(state_machine.states['EnumeratedList']))
+        self.assertIsNone(state_machine.memo)
+        self.assertIsNone(state_machine.document)
+        self.assertIsNone(state_machine.node)
+        self.assertIsNone(state_machine.states['Body'].document)
+        # The next list of another kind uses the same state machine
+        # and gives the same result as with a new one.
+        text = 'a) alphabetic\nb) enumerated\n'
+        output = self.parse(text)
+        self.assertIs(pool[0], state_machine)
+        states.RSTState.nested_list_sm_cache.clear()
+        self.assertEqual(self.parse(text), output)
+
+
+class InlinerTests(unittest.TestCase):
+
+    def setUp(self):
+        settings = frontend.get_default_settings(docutils.parsers.rst.Parser)
+        settings.pep_references = settings.rfc_references = True
+        self.document = utils.new_document('test data', settings)
+        self.memo = states.Struct(document=self.document,
+                                  reporter=self.document.reporter,
+                                  language=None)
+        self.inliner = states.Inliner()
+        self.inliner.init_customizations(settings)
+
+    def parse(self, text):
+        nodelist, messages = self.inliner.parse(text, 1, self.memo,
+                                                self.document)
+        self.assertEqual(messages, [])
+        return [(node.__class__.__name__, node.astext())
+                for node in nodelist]
+
+    def test_plain_text(self):
+        # Text without markup characters is returned as one Text node.
+        self.assertEqual(self.parse('plain text.'), [('Text', 'plain text.')])
+        self.assertEqual(self.parse(''), [])
+        self.assertEqual(self.parse('see pep-0287 or RFC 2822'),
+                         [('Text', 'see '), ('reference', 'pep-0287'),
+                          ('Text', ' or '), ('reference', 'RFC 2822')])
+        self.assertEqual(self.parse('mail me@example.org'),
+                         [('Text', 'mail '),
+                          ('reference', 'me@example.org')])
+        self.assertEqual(self.parse(r'es\caped'), [('Text', 'escaped')])
+
+    def test_compiled_patterns(self):
+        # The patterns are compiled once per combination of settings.
+        settings = self.document.settings
+        inliner = states.Inliner()
+        inliner.init_customizations(settings)
+        self.assertIs(inliner.patterns, self.inliner.patterns)
+        self.assertEqual(inliner.implicit_dispatch[0],
+                         (inliner.patterns.uri, inliner.standalone_uri))
+        # no duplicate entries when the Inliner is reused:
+        inliner.init_customizations(settings)
+        self.assertEqual(len(inliner.implicit_dispatch), 3)
+        settings.character_level_inline_markup = True
+        self.inliner = states.Inliner()
+        self.inliner.init_customizations(settings)
+        self.assertIsNot(inliner.patterns, self.inliner.patterns)
+        self.assertEqual(self.parse('in*line*markup'),
+                         [('Text', 'in'), ('emphasis', 'line'),
+                          ('Text', 'markup')])
+
+    def test_custom_implicit_dispatch(self):
+        # Patterns added to `implicit_dispatch` disable the shortcut.
+        def reference(match, lineno):
+            return [nodes.reference(match.group(), match.group())]
+        self.inliner.implicit_dispatch.append((re.compile('issue42'),
+                                               reference))
+        self.assertEqual(self.parse('fixes issue42.'),
+                         [('Text', 'fixes '), ('reference', 'issue42'),
+                          ('Text', '.')])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,233 @@
+#! /usr/bin/env python3
+# $Id$
+# Copyright: This module has been placed in the public domain.
+
+"""
+Tests for the parallel parsing of sections (docutils.parsers.rst.parallel).
+"""
+
+import io
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+if __name__ == '__main__':
+    # prepend the local "docutils root" to the Python library path
+    sys.path.insert(0, Path(__file__).resolve().parents[3].as_posix())
+
+from docutils import frontend, nodes, utils
+from docutils.parsers.rst import Parser, parallel
+from docutils.statemachine import string2lines
+
+parallel_parse = parallel.parse
+
+
+section = """\
+Section %(n)s
+%(equals)s
+
+Paragraph with a footnote [#]_, a symbol footnote [*]_,
+an `anonymous reference`__, and `link %(n)s <https://example.org/%(n)s>`_.
+*Unbalanced emphasis.
+
+.. [#] Auto-numbered footnote.
+.. [*] Symbol footnote.
+__ https://example.org/anonymous
+
+Subsection %(n)s
+%(dashes)s
+
+3. An enumerated list with start value 3.
+4. Use |substitution %(n)s|.
+
+.. |substitution %(n)s| replace:: replacement text
+
+"""
+
+
+def sections(number):
+    return ''.join(section % {'n': n, 'equals': '=' * (8 + len(str(n))),
+                              'dashes': '-' * (11 + len(str(n)))}
+                   for n in range(number))
+
+
+class ScannerTests(unittest.TestCase):
+
+    def test_scan_titles(self):
+        lines = string2lines("""\
+=====
+Title
+=====
+
+Section
+=======
+
+1. Numbered
+-----------
+
+paragraph
+---------
+
+  indented
+  --------
+
+Literal block::
+
+Quoted
+------
+
+=====  =====
+table  cells
+-----  -----
+title  ?
+=====  =====
+
+Last
+====
+""")
+        self.assertEqual(parallel.scan_titles(lines),
+                         [(0, ('=', '=')), (4, '='), (7, '-'), (10, '-'),
+                          (27, '=')])
+
+    def test_split(self):
+        lines = string2lines(sections(4))
+        titles = parallel.scan_titles(lines)
+        self.assertEqual(len(titles), 8)
+        chunks = parallel.split(lines, titles, 15)
+        self.assertEqual([chunk[0] for chunk in chunks],
+                         [0] + [index for index, style in titles[2::2]])
+        self.assertEqual(chunks[-1][1], len(lines))
+        self.assertEqual(chunks[1][2:], (['=', '-'], 1))
+        # no chunks shorter than `size`:
+        self.assertEqual(len(parallel.split(lines, titles, 60)), 1)
+
+
+class ParallelParserTests(unittest.TestCase):
+
+    def parse(self, text, workers=2):
+        # Parse `text`, store the result of `parallel.parse()` (if called),
+        # the warnings, and the messages not attached to the document.
+        parser = Parser()
+        settings = frontend.get_default_settings(Parser)
+        settings.warning_stream = io.StringIO()
+        settings.halt_level = 5
+        settings.parallel_sections = workers
+        document = utils.new_document('test data', settings)
+        results = []
+
+        def parse(*args):
+            results.append(parallel_parse(*args))
+            return results[-1]
+
+        with mock.patch.object(parallel, 'chunk_lines', 20), \
+             mock.patch.object(parallel, 'parse', parse):
+            parser.parse(text, document)
+        self.parallel = results[0] if results else None
+        self.lines = [(node.tagname, node.line)
+                      for node in document.findall(nodes.Element)]
+        self.warnings = settings.warning_stream.getvalue()
+        self.loose_messages = [message.astext() for message
+                               in document.parse_messages
+                               if message.parent is None]
+        return document.pformat()
+
+    def check(self, text):
+        # Compare the results of a serial and a parallel parse.
+        expected = self.parse(text, workers=0)
+        lines, warnings = self.lines, self.warnings
+        loose_messages = self.loose_messages
+        self.assertEqual(self.parse(text), expected)
+        self.assertTrue(self.parallel)
+        self.assertEqual(self.lines, lines)
+        self.assertEqual(self.warnings, warnings)
+        self.assertEqual(self.loose_messages, loose_messages)
+        return expected
+
+    def test_parallel(self):
+        text = sections(6)
+        expected = self.parse(text, workers=0)
+        self.assertIsNone(self.parallel)
+        self.assertEqual(self.parse(text), expected)
+        self.assertTrue(self.parallel)
+        self.assertIn('ids="footnote-6"', expected)
+
+    def test_escaped_digits(self):
+        # Backslash-escaped digits (null-escaped while parsing) are not
+        # mistaken for temporary IDs.
+        text = sections(6) + """\
+Last
+====
+
+Escaped digits a\\0\\b and \\1\\2 next to an auto-numbered footnote [#]_.
+
+.. [#] Footnote.
+"""
+        expected = self.parse(text, workers=0)
+        self.assertEqual(self.parse(text), expected)
+        self.assertTrue(self.parallel)
+        self.assertIn('Escaped digits a0b and 12 ', expected)
+
+    def test_duplicate_names(self):
+        # Names used in more than one chunk become "dupnames" with
+        # system messages at the same place as in a serial parse.
+        text = sections(3) + sections(3)
+        expected = self.parse(text, workers=0)
+        self.assertEqual(self.parse(text), expected)
+        self.assertTrue(self.parallel)
+        self.assertIn('dupnames="section\\ 2"', expected)
+        self.assertIn('Duplicate implicit target name: "section 2"', expected)
+        self.assertIn('Duplicate substitution definition name', expected)
+
+    def test_include(self):
+        # Lines inserted by the "include" directive shift the absolute
+        # line numbers of the following chunks.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            included = Path(tmpdir) / 'header.rst'
+            included.write_text('.. |version| replace:: 1.0\n\n'
+                                '.. _header: https://example.org\n\n'
+                                'Header text.\n', encoding='utf-8')
+            text = (f'.. include:: {included.as_posix()}\n\n'
+                    + sections(6)
+                    + '.. _header: https://example.org/other\n')
+            expected = self.parse(text, workers=0)
+            lines = self.lines
+            self.assertEqual(self.parse(text), expected)
+            self.assertTrue(self.parallel)
+            self.assertEqual(self.lines, lines)
+        self.assertIn('Duplicate explicit target name: "header"', expected)
+
+    def test_reported_text(self):
+        # Warnings are written as reported, even if children are added
+        # to the message later (here: the "include" directive block).
+        text = sections(4) + '.. include:: nonexistent.rst\n\n' + sections(2)
+        self.check(text)
+        self.assertIn('No such file or directory', self.warnings)
+        self.assertNotIn('.. include::', self.warnings)
+
+    def test_title_messages(self):
+        # A section title following a section of the same or a lower level
+        # is examined twice in a serial parse: the messages of the first
+        # examination are not attached to the document.  Here, the title
+        # with the short underline starts the second chunk.
+        text = (sections(2) + 'Short\n====\n\n' + 'Text.\n\n' * 10
+                + sections(3))
+        self.check(text)
+        self.assertEqual(len(self.loose_messages), 1)
+        self.assertIn('Title underline too short.', self.loose_messages[0])
+        self.assertEqual(self.warnings.count('Title underline too short.'),
+                         2)
+
+    def test_fallback(self):
+        # Custom roles require a serial parse.  Chunks are not parsed.
+        text = '.. role:: custom\n\n' + sections(6)
+        expected = self.parse(text, workers=0)
+        with mock.patch.object(parallel, '_parse_chunk') as parse_chunk:
+            self.assertEqual(self.parse(text), expected)
+        self.assertIs(self.parallel, False)
+        parse_chunk.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
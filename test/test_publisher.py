@@ -7,9 +7,11 @@
 """
 Test the `Publisher` facade and the ``publish_*`` convenience functions.
 """
+import io
 import pickle
 from pathlib import Path
 import sys
+import tempfile
 import unittest
 
 if __name__ == '__main__':
@@ -19,7 +21,7 @@ if __name__ == '__main__':
 
 import docutils
 import docutils.parsers.null
-from docutils import core, nodes, parsers, readers, writers
+from docutils import core, nodes, parsers, readers, utils, writers
 from docutils.writers import html4css1, odf_odt, pseudoxml
 
 # DATA_ROOT is ./test/data/ from the docutils root
@@ -241,6 +243,201 @@ class ConvenienceFunctionTests(unittest.TestCase):
             '<?xml version="1.0" encoding="utf-8"?>'))
 
 
+class TimingTests(unittest.TestCase):
+
+    settings = {'_disable_config': True,
+                'warning_stream': '',
+                'output_encoding': 'unicode'}
+
+    def test_timing_hook(self):
+        recorded = []
+        publisher = core.Publisher(reader='standalone',
+                                   parser='restructuredtext',
+                                   writer='pseudoxml',
+                                   source_class=docutils.io.StringInput,
+                                   destination_class=docutils.io.StringOutput)
+        publisher.timing_hook = lambda phase, record: recorded.append(phase)
+        publisher.process_programmatic_settings(None, self.settings, None)
+        publisher.set_source(test_document)
+        output = publisher.publish()
+        self.assertEqual(['read', 'parse', 'transforms', 'write'], recorded)
+        self.assertEqual(recorded, list(publisher.timings))
+        for record in publisher.timings.values():
+            self.assertEqual({'wall', 'cpu', 'memory_peak'}, set(record))
+        # timing does not change the output
+        self.assertEqual(core.publish_string(test_document,
+                                             settings_overrides=self.settings),
+                         output)
+
+    def test_timing_report(self):
+        settings = dict(self.settings, timing_report=True)
+        stderr = io.StringIO()
+        publisher = core.Publisher(reader='standalone',
+                                   parser='restructuredtext',
+                                   writer='null',
+                                   source_class=docutils.io.StringInput,
+                                   destination_class=docutils.io.NullOutput)
+        publisher._stderr = docutils.io.ErrorOutput(stderr)
+        publisher.process_programmatic_settings(None, settings, None)
+        publisher.set_source(test_document)
+        publisher.publish()
+        self.assertIn('::: Timing report:', stderr.getvalue())
+        self.assertIn('transforms', stderr.getvalue())
+
+    def test_no_timing(self):
+        publisher = core.Publisher(reader='standalone',
+                                   parser='restructuredtext',
+                                   writer='null',
+                                   source_class=docutils.io.StringInput,
+                                   destination_class=docutils.io.NullOutput)
+        publisher.process_programmatic_settings(None, self.settings, None)
+        publisher.set_source(test_document)
+        publisher.publish()
+        self.assertEqual({}, publisher.timings)
+
+
+class PublishManyTests(unittest.TestCase):
+
+    settings = {'_disable_config': True,
+                'output_encoding': 'unicode',
+                'report_level': 2}
+
+    def test_publish_many(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            broken = Path(tmpdir) / 'broken.rst'
+            broken.write_text(test_document, encoding='utf-8')
+            jobs = [(DATA_ROOT/'include.rst', None),
+                    (broken, None, {'report_level': 5}),
+                    (broken, None)]
+            results = core.publish_many(jobs, writer='pseudoxml',
+                                        settings_overrides=self.settings,
+                                        max_workers=2)
+        self.assertEqual(len(jobs), len(results))
+        # results are returned in the order of the jobs
+        self.assertIn('Some include text.', results[0][0])
+        self.assertIn('Test Document', results[1][0])
+        self.assertEqual([], results[0][1])
+        # system messages are returned, if above the "report_level"
+        self.assertEqual([], results[1][1])
+        self.assertEqual(1, len(results[2][1]))
+        self.assertIn('(ERROR/3) Unknown target name: "nonexistent".',
+                      results[2][1][0])
+
+    def test_publish_many_exception(self):
+        # A job reaching the "halt_level" does not break the other jobs.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            broken = Path(tmpdir) / 'broken.rst'
+            broken.write_text(test_document, encoding='utf-8')
+            destinations = [Path(tmpdir) / f'out{i}.txt' for i in range(3)]
+            jobs = [(DATA_ROOT/'include.rst', destinations[0]),
+                    (broken, None, {'halt_level': 2}),
+                    (broken, destinations[2])]
+            with self.assertRaises(utils.SystemMessage) as context:
+                core.publish_many(jobs,
+                                  settings_overrides={'_disable_config': True},
+                                  max_workers=2)
+            self.assertEqual(3, context.exception.level)
+            self.assertIn('Some include text.',
+                          destinations[0].read_text(encoding='utf-8'))
+            self.assertIn('Test Document',
+                          destinations[2].read_text(encoding='utf-8'))
+
+    def test_publish_many_file_output(self):
+        settings = {'_disable_config': True}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            destination = Path(tmpdir) / 'include.txt'
+            results = core.publish_many([(DATA_ROOT/'include.rst',
+                                          destination)],
+                                        settings_overrides=settings)
+            self.assertEqual(results[0][0],
+                             destination.read_text(encoding='utf-8'))
+
+
+class DoctreeCacheTests(unittest.TestCase):
+
+    def publish(self, source_path, cache_dir, writer='pseudoxml', **kwargs):
+        warnings = io.StringIO()
+        settings = {'_disable_config': True,
+                    'doctree_cache': cache_dir,
+                    'warning_stream': warnings,
+                    'output_encoding': 'unicode',
+                    **kwargs}
+        output = core.publish_string(source_path.read_text(),
+                                     source_path=source_path,
+                                     writer=writer,
+                                     settings_overrides=settings)
+        return output, warnings.getvalue()
+
+    def test_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            source = tmpdir / 'broken.rst'
+            source.write_text(test_document, encoding='utf-8')
+            cache_dir = tmpdir / 'cache'
+            uncached = self.publish(source, None)
+            first = self.publish(source, cache_dir)
+            self.assertEqual(1, len(list(cache_dir.iterdir())))
+            second = self.publish(source, cache_dir)
+            # output and system messages of cached and uncached runs match
+            self.assertEqual(uncached, first)
+            self.assertEqual(uncached, second)
+            self.assertIn('Unknown target name: "nonexistent"', second[1])
+            # most writer settings do not influence the cache key
+            self.publish(source, cache_dir, writer='html5')
+            self.publish(source, cache_dir, writer='html4')
+            self.assertEqual(2, len(list(cache_dir.iterdir())))
+            # other settings do
+            self.publish(source, cache_dir, doctitle_xform=False)
+            self.assertEqual(3, len(list(cache_dir.iterdir())))
+
+    def test_dependencies(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            source = tmpdir / 'main.rst'
+            source.write_text('.. include:: inc.rst\n', encoding='utf-8')
+            included = tmpdir / 'inc.rst'
+            included.write_text('old text\n', encoding='utf-8')
+            cache_dir = tmpdir / 'cache'
+            self.assertIn('old text', self.publish(source, cache_dir)[0])
+            included.write_text('new text\n', encoding='utf-8')
+            self.assertIn('new text', self.publish(source, cache_dir)[0])
+
+    def test_prune(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            source = tmpdir / 'broken.rst'
+            source.write_text(test_document, encoding='utf-8')
+            cache_dir = tmpdir / 'cache'
+            self.publish(source, cache_dir, doctree_cache_size=0)
+            self.assertEqual([], list(cache_dir.iterdir()))
+
+
+class PublishMultiTests(unittest.TestCase):
+
+    def test_publish_multi(self):
+        warnings = io.StringIO()
+        settings = {'_disable_config': True,
+                    'warning_stream': warnings,
+                    'output_encoding': 'unicode'}
+        writers = ['html5', 'pseudoxml', 'manpage']
+        outputs = core.publish_multi(test_document, writers,
+                                     settings_overrides=settings)
+        # parsed once: system messages are reported once
+        self.assertEqual(1, warnings.getvalue().count('Unknown target'))
+        # the output matches separate processing
+        settings['warning_stream'] = ''
+        for writer, output in zip(writers, outputs):
+            self.assertEqual(core.publish_string(test_document,
+                                                 writer=writer,
+                                                 settings_overrides=settings),
+                             output)
+
+    def test_destination_paths(self):
+        with self.assertRaises(ValueError):
+            core.publish_multi(test_document, ['html5', 'latex'],
+                               destination_paths=['test.html'])
+
+
 class PublishDoctreeTestCase(unittest.TestCase, docutils.SettingsSpec):
 
     settings_default_overrides = {
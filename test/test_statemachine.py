@@ -168,6 +168,18 @@ class SMWSTests(unittest.TestCase):
         self.assertEqual(list(self.sm.states.keys()), ['MockState'])
         self.assertEqual(len(self.sm.states['MockState'].transitions), 4)
 
+    def test_shared_transitions(self):
+        # Patterns and next states are shared by all instances of a class,
+        # transition methods are bound to the instance.
+        state = self.sm.states['MockState']
+        other = MockState(self.sm, debug=debug)
+        self.assertEqual(other.transition_order, state.transition_order)
+        for name, (pattern, method, next_state) in other.transitions.items():
+            self.assertIs(pattern, state.transitions[name][0])
+            self.assertIs(method.__self__, other)
+            self.assertEqual(method, getattr(other, name))
+            self.assertEqual(next_state, state.transitions[name][2])
+
     def test_get_indented(self):
         self.sm.input_lines = statemachine.StringList(testtext)
         self.sm.line_offset = -1
@@ -279,6 +291,33 @@ class EmptyStateTests(unittest.TestCase):
                                     self.state.__class__.__name__),
                            'nop3': (dummy, self.state.nop3, 'bogus')}))
 
+    def test_first_transition(self):
+        # The combined pattern selects the first matching transition
+        # in `transition_order`.
+        self.state.patterns = {'nop': r'(a)(?P<b>b)?',
+                               'nop2': r'(.)\1',  # back-reference
+                               'nop3': r'(?i)c',  # flag
+                               'bogus': r'[cd]'}
+        self.state.bogus = self.state.nop
+        names, transitions = self.state.make_transitions(
+                                 ['nop', 'nop2', 'nop3', 'bogus'])
+        self.state.add_transitions(names, transitions)
+        self.assertEqual(self.state.first_transition('ab'), 0)
+        self.assertEqual(self.state.first_transition('bb'), 1)
+        # transitions with flags are not combined, transitions from
+        # their index on must be tried one by one:
+        self.assertEqual(self.state.first_transition('c'), 2)
+        self.assertEqual(self.state.first_transition('xyz'), 2)
+        # the combined pattern is updated when transitions change:
+        self.state.remove_transition('nop2')
+        self.state.remove_transition('nop3')
+        self.assertEqual(self.state.first_transition('c'), 1)
+        self.assertEqual(self.state.first_transition('d'), 1)
+        self.assertEqual(self.state.first_transition('bb'), 2)
+        self.assertEqual(self.state.first_transition('xyz'), 2)
+        self.state.add_transition('nop3', transitions['nop3'])
+        self.assertEqual(self.state.first_transition('bb'), 0)
+
 
 class MiscTests(unittest.TestCase):
 
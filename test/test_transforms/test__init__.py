@@ -17,7 +17,7 @@ if __name__ == '__main__':
     # so we import the local `docutils` package.
     sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from docutils import transforms, utils
+from docutils import frontend, nodes, transforms, utils
 
 
 class TestTransform(transforms.Transform):
@@ -47,5 +47,58 @@ class KwargsTestCase(unittest.TestCase):
         self.assertEqual(transform_record[3], {'foo': 42})
 
 
+class AddParagraph(transforms.Transform):
+
+    default_priority = 200
+
+    def apply(self):
+        self.document += nodes.paragraph('', 'new text')
+
+
+class ReplaceParagraph(transforms.Transform):
+
+    default_priority = 300
+
+    def apply(self):
+        # create and remove the same number of nodes
+        self.document[-1] = nodes.paragraph('', 'replacement')
+
+
+class ProfileTestCase(unittest.TestCase):
+
+    def test_profile(self):
+        settings = frontend.get_default_settings()
+        settings.profile_transforms = True
+        document = utils.new_document('test data', settings)
+        transformer = transforms.Transformer(document)
+        transformer.add_transform(TestTransform, foo=42)
+        transformer.add_transform(AddParagraph)
+        transformer.add_transform(AddParagraph)
+        transformer.add_transform(ReplaceParagraph)
+        transformer.apply_transforms()
+        self.assertEqual(4, len(transformer.applied))
+        name = f'{__name__}.AddParagraph'
+        self.assertEqual(2, transformer.profile[name]['calls'])
+        # paragraph and text node
+        self.assertEqual(4, transformer.profile[name]['created'])
+        self.assertEqual(0, transformer.profile[name]['removed'])
+        self.assertIn(name, transformer.profile_report())
+        record = transformer.profile[f'{__name__}.ReplaceParagraph']
+        self.assertEqual(2, record['created'])
+        self.assertEqual(2, record['removed'])
+        # the node constructors are restored
+        with transforms.NodeCounter() as counter:
+            nodes.paragraph('', 'counted')
+        nodes.paragraph('', 'not counted')
+        self.assertEqual(2, counter.count)
+
+    def test_no_profile(self):
+        document = utils.new_document('test data')
+        transformer = transforms.Transformer(document)
+        transformer.add_transform(AddParagraph)
+        transformer.apply_transforms()
+        self.assertEqual({}, transformer.profile)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -18,7 +18,7 @@ if __name__ == '__main__':
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import docutils
-from docutils import core, nodes, writers
+from docutils import core, nodes, utils, writers
 
 
 stop_traversal_input = '''
@@ -77,5 +77,138 @@ class StopTraversalTests(unittest.TestCase, docutils.SettingsSpec):
             writer=AttentiveWriter())
 
 
+class RecordingVisitor(nodes.SparseNodeVisitor):
+    """Record visits and departures, raise exceptions as requested."""
+
+    def __init__(self, document, prune):
+        super().__init__(document)
+        self.prune = prune  # {'visit a': exception class, ...}
+        self.log = []
+
+    def unknown_visit(self, node):
+        self.record('visit', node)
+
+    def unknown_departure(self, node):
+        self.record('depart', node)
+
+    def record(self, method, node):
+        event = f'{method} {node["ids"][0]}'
+        self.log.append(event)
+        if event in self.prune:
+            raise self.prune[event]
+
+
+class PruningTests(unittest.TestCase):
+
+    def setUp(self):
+        # a(b, c(d, e), f)
+        self.document = utils.new_document('test data')
+        self.tree = nodes.Element(ids=['a'])
+        self.tree += nodes.Element(ids=['b'])
+        self.tree += nodes.Element('', nodes.Element(ids=['d']),
+                                   nodes.Element(ids=['e']), ids=['c'])
+        self.tree += nodes.Element(ids=['f'])
+
+    def walkabout(self, **prune):
+        visitor = RecordingVisitor(self.document, prune)
+        stop = self.tree.walkabout(visitor)
+        return stop, ' '.join(visitor.log)
+
+    def walk(self, **prune):
+        visitor = RecordingVisitor(self.document, prune)
+        stop = self.tree.walk(visitor)
+        return stop, ' '.join(visitor.log)
+
+    def test_no_pruning(self):
+        self.assertEqual(self.walk(),
+                         (False, 'visit a visit b visit c visit d visit e '
+                          'visit f'))
+        self.assertEqual(self.walkabout(),
+                         (False, 'visit a visit b depart b visit c visit d '
+                          'depart d visit e depart e depart c visit f '
+                          'depart f depart a'))
+
+    def test_skip_children(self):
+        self.assertEqual(self.walkabout(**{'visit c': nodes.SkipChildren}),
+                         (False, 'visit a visit b depart b visit c depart c '
+                          'visit f depart f depart a'))
+        self.assertEqual(self.walk(**{'visit c': nodes.SkipChildren}),
+                         (False, 'visit a visit b visit c visit f'))
+
+    def test_skip_node(self):
+        self.assertEqual(self.walkabout(**{'visit c': nodes.SkipNode}),
+                         (False, 'visit a visit b depart b visit c '
+                          'visit f depart f depart a'))
+
+    def test_skip_departure(self):
+        self.assertEqual(self.walkabout(**{'visit c': nodes.SkipDeparture}),
+                         (False, 'visit a visit b depart b visit c visit d '
+                          'depart d visit e depart e visit f depart f '
+                          'depart a'))
+
+    def test_skip_siblings(self):
+        # the node raising SkipSiblings is not departed
+        self.assertEqual(self.walkabout(**{'visit b': nodes.SkipSiblings}),
+                         (False, 'visit a visit b depart a'))
+        self.assertEqual(self.walkabout(**{'depart d': nodes.SkipSiblings}),
+                         (False, 'visit a visit b depart b visit c visit d '
+                          'depart d depart c visit f depart f depart a'))
+        self.assertEqual(self.walk(**{'visit d': nodes.SkipSiblings}),
+                         (False, 'visit a visit b visit c visit d visit f'))
+        with self.assertRaises(nodes.SkipSiblings):
+            self.walk(**{'visit a': nodes.SkipSiblings})
+
+    def test_stop_traversal(self):
+        self.assertEqual(self.walkabout(**{'visit d': nodes.StopTraversal}),
+                         (True, 'visit a visit b depart b visit c visit d '
+                          'depart d depart c depart a'))
+        self.assertEqual(self.walkabout(**{'depart b': nodes.StopTraversal}),
+                         (True, 'visit a visit b depart b depart a'))
+        self.assertEqual(self.walk(**{'visit d': nodes.StopTraversal}),
+                         (True, 'visit a visit b visit c visit d'))
+
+    def test_exception(self):
+        with self.assertRaises(ValueError):
+            self.walkabout(**{'depart d': ValueError})
+
+
+class DeepTreeTests(unittest.TestCase):
+    """Traversals must not be limited by the Python recursion limit."""
+
+    def setUp(self):
+        self.depth = sys.getrecursionlimit() * 2
+        node = nodes.Text('leaf')
+        for _i in range(self.depth + 1):
+            node = nodes.Element('', node)
+        self.tree = node
+
+    def test_findall(self):
+        self.assertEqual(len(list(self.tree.findall())), self.depth + 2)
+        self.assertEqual(len(list(self.tree.findall(nodes.Text))), 1)
+        self.assertEqual(len(list(self.tree.findall(
+                         lambda node: isinstance(node, nodes.Text)))), 1)
+
+    def test_walk(self):
+        document = utils.new_document('test data')
+        visitor = RecordingVisitor(document, {})
+        visitor.record = lambda method, node: visitor.log.append(method)
+        self.tree.walkabout(visitor)
+        self.assertEqual(len(visitor.log), 2 * (self.depth + 1))
+        visitor.log = []
+        self.tree.walk(visitor)
+        self.assertEqual(len(visitor.log), self.depth + 1)
+
+    def test_astext(self):
+        self.assertEqual(self.tree.astext(), 'leaf')
+
+    def test_pformat(self):
+        self.assertEqual(len(self.tree.pformat(indent='').splitlines()),
+                         self.depth + 2)
+
+    def test_deepcopy(self):
+        copy = self.tree.deepcopy()
+        self.assertEqual(len(list(copy.findall())), self.depth + 2)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,137 @@
+#! /usr/bin/env python3
+
+# $Id$
+# Copyright: This module has been placed in the public domain.
+
+"""
+Tests for `docutils.utils.image_info`.
+"""
+
+import os
+from pathlib import Path
+import struct
+import sys
+import tempfile
+import unittest
+
+if __name__ == '__main__':
+    # prepend the "docutils root" to the Python library path
+    # so we import the local `docutils` package.
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from docutils.utils import image_info
+
+# TEST_ROOT is ./test/ from the docutils root
+TEST_ROOT = Path(__file__).resolve().parents[1]
+DATA_ROOT = TEST_ROOT / 'data'
+BLUE_SQUARE = TEST_ROOT / 'functional/input/data/blue square.png'
+
+GIF = b'GIF89a' + struct.pack('<HH', 40, 30) + b'\x00' * 10
+JPEG = (b'\xff\xd8'
+        + b'\xff\xe0' + struct.pack('>H', 16) + b'JFIF\x00' + b'\x00' * 9
+        + b'\xff\xff\xc0' + struct.pack('>HBHHB', 11, 8, 30, 40, 1)
+        + b'\x01\x11\x00' + b'\xff\xd9')
+
+
+class ReadSizeTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def write(self, name, data):
+        path = Path(self.tmpdir.name) / name
+        if isinstance(data, str):
+            path.write_text(data, encoding='utf-8')
+        else:
+            path.write_bytes(data)
+        return path
+
+    def test_png(self):
+        self.assertEqual(image_info.read_size(BLUE_SQUARE), (32, 32))
+
+    def test_gif(self):
+        self.assertEqual(image_info.read_size(self.write('a.gif', GIF)),
+                         (40, 30))
+
+    def test_jpeg(self):
+        self.assertEqual(image_info.read_size(self.write('a.jpg', JPEG)),
+                         (40, 30))
+
+    def test_svg(self):
+        self.assertEqual(image_info.read_size(DATA_ROOT / 'circle.svg'),
+                         (10, 10))
+        samples = {'<svg width="40px" height="30"/>': (40, 30),
+                   '<?xml version="1.0"?>\n<!-- comment -->\n'
+                   '<svg viewBox="0,0 40 30.5"><broken>': (40, 30.5),
+                   '<svg width="100%" height="30" viewBox="0 0 4 3"/>': None,
+                   'not XML': None,
+                   }
+        for sample, size in samples.items():
+            with self.subTest(sample=sample):
+                path = self.write('a.svg', sample)
+                if size is None and image_info.PIL:
+                    with self.assertRaises(OSError):
+                        image_info.read_size(path)
+                else:
+                    self.assertEqual(image_info.read_size(path), size)
+
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            image_info.read_size('dummy.png')
+
+
+class ImageInfoCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = Path(self.tmpdir.name) / 'image.gif'
+        self.path.write_bytes(GIF)
+        self.cache = image_info.ImageInfoCache()
+
+    def test_size(self):
+        self.assertEqual(self.cache.size(self.path), (40, 30))
+        self.assertEqual(self.cache.mimetype(self.path), 'image/gif')
+        entry = self.cache.info(self.path)
+        self.assertIs(self.cache.info(str(self.path)), entry)
+        # a changed file is read again:
+        self.path.write_bytes(GIF.replace(b'(', b'*'))
+        os.utime(self.path, ns=(0, 0))
+        self.assertEqual(self.cache.size(self.path), (42, 30))
+        self.assertIsNot(self.cache.info(self.path), entry)
+
+    def test_data_uri(self):
+        data_uri = self.cache.data_uri(self.path)
+        self.assertEqual(data_uri,
+                         'data:image/gif;base64,R0lGODlhKAAeAAAAAAAAAAAAAAA=')
+        self.assertEqual(self.cache.data_size, len(data_uri))
+        # data URIs exceeding `max_data_size` are not stored:
+        self.cache.max_data_size = 20
+        self.cache.clear()
+        self.assertEqual(self.cache.data_uri(self.path), data_uri)
+        self.assertEqual(self.cache.data_size, 0)
+
+    def test_max_entries(self):
+        self.cache.max_entries = 1
+        self.cache.size(self.path)
+        self.cache.size(BLUE_SQUARE)
+        self.assertEqual(list(self.cache.entries), [str(BLUE_SQUARE)])
+
+    def test_save_and_load(self):
+        cache_file = Path(self.tmpdir.name) / 'images.pickle'
+        self.cache.size(self.path)
+        self.assertTrue(self.cache.save(cache_file))
+        cache = image_info.ImageInfoCache()
+        self.assertTrue(cache.load(cache_file))
+        self.assertEqual(cache.info(self.path).size, (40, 30))
+        # entries of changed files are ignored:
+        os.utime(self.path, ns=(0, 0))
+        cache = image_info.ImageInfoCache()
+        self.assertTrue(cache.load(cache_file))
+        self.assertEqual(cache.entries, {})
+        self.assertFalse(cache.load(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,7 +14,8 @@ Test for docutils XML writer.
    module mirrors the current behaviour of the docutils_xml writer.
 """
 
-
+from pathlib import Path
+import tempfile
 import unittest
 
 import docutils
@@ -200,6 +201,22 @@ class DocutilsXMLTestCase(unittest.TestCase):
         with self.assertRaises(docutils.utils.SystemMessage):
             publish_xml(settings, invalid_raw_xml_source)
 
+    def test_stream_output(self):
+        settings = self.settings.copy()
+        settings['indents'] = True
+        source = 'Title\n=====\n\nText.\n\nSection\n-------\n\nMore text.\n'
+        expected = publish_xml(settings, source).decode('latin1')
+        settings['stream_output'] = True
+        with tempfile.TemporaryDirectory() as tmpdir:
+            destination = Path(tmpdir) / 'stream.xml'
+            docutils.core.publish_file(source=StringIO(source),
+                                       source_path='<string>',
+                                       destination_path=destination,
+                                       writer=docutils_xml.Writer(),
+                                       settings_overrides=settings)
+            self.assertEqual(expected,
+                             destination.read_text(encoding='latin1'))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,7 +21,6 @@ if __name__ == '__main__':
 
 import docutils
 import docutils.core
-from docutils.parsers.rst.directives.images import PIL
 from docutils.utils.code_analyzer import with_pygments
 from docutils.writers import html4css1
 
@@ -38,12 +37,6 @@ TEST_ROOT = Path(__file__).parents[1]
 DATA_ROOT = TEST_ROOT / 'data'
 ROOT_PREFIX = (TEST_ROOT / 'functional/input').as_posix()
 
-# Pillow/PIL is optional:
-if PIL:
-    SCALING_OUTPUT = 'style="width: 32.0px; height: 32.0px;" '
-else:
-    SCALING_OUTPUT = ''
-
 
 class Html5WriterPublishPartsTestCase(unittest.TestCase):
     """Test case for HTML5 writer via the publish_parts() interface."""
@@ -425,8 +418,8 @@ totest['root_prefix'] = ({'root_prefix': ROOT_PREFIX,
    :scale: 100%
 .. figure:: /data/blue%20square.png
 """,
-f"""\
-<img alt="/data/blue%20square.png" src="/data/blue%20square.png" {SCALING_OUTPUT}/>
+"""\
+<img alt="/data/blue%20square.png" src="/data/blue%20square.png" style="width: 32.0px; height: 32.0px;" />
 <div class="figure">
 <img alt="/data/blue%20square.png" src="/data/blue%20square.png" />
 </div>
@@ -540,7 +533,7 @@ Unknown LaTeX command &quot;\\my&quot;.</div>
 """],
 ])
 
-totest['system_messages-PIL'] = ({'math_output': 'mathml',
+totest['system_messages-image_size'] = ({'math_output': 'mathml',
                                   'warning_stream': '',
                                   }, [
 ["""\
@@ -22,7 +22,6 @@ if __name__ == '__main__':
 
 import docutils
 import docutils.core
-from docutils.parsers.rst.directives.images import PIL
 from docutils.utils.code_analyzer import with_pygments
 from docutils.writers import html5_polyglot
 
@@ -38,34 +37,6 @@ TEST_ROOT = Path(__file__).parents[1]
 DATA_ROOT = TEST_ROOT / 'data'
 ROOT_PREFIX = (TEST_ROOT / 'functional/input').as_posix()
 
-# Pillow/PIL is optional:
-if PIL:
-    REQUIRES_PIL = ''
-    ONLY_LOCAL = 'Can only read local images.'
-    DUMMY_PNG_NOT_FOUND = "[Errno 2] No such file or directory: 'dummy.png'"
-    # Pillow reports the absolute path since version 10.3.0 (cf. [bugs: 485])
-    if (tuple(int(i) for i in PIL.__version__.split('.')) >= (10, 3)):
-        DUMMY_PNG_NOT_FOUND = ("[Errno 2] No such file or directory: '%s'"
-                               % Path('dummy.png').resolve())
-    HEIGHT_ATTR = 'height="32" '
-    WIDTH_ATTR = 'width="32" '
-    NO_PIL_SYSTEM_MESSAGE = ''
-else:
-    REQUIRES_PIL = '\n  Requires Python Imaging Library.'
-    ONLY_LOCAL = 'Requires Python Imaging Library.'
-    DUMMY_PNG_NOT_FOUND = 'Requires Python Imaging Library.'
-    HEIGHT_ATTR = ''
-    WIDTH_ATTR = ''
-    NO_PIL_SYSTEM_MESSAGE = (
-        '<aside class="system-message">\n'
-        '<p class="system-message-title">System Message:'
-        ' WARNING/2 (<span class="docutils literal">'
-        '&lt;string&gt;</span>, line 1)</p>\n'
-        '<p>Cannot scale image!\n'
-        '  Could not get size from &quot;/data/blue%20square.png&quot;:\n'
-        '  Requires Python Imaging Library.</p>\n'
-        '</aside>\n')
-
 
 class Html5WriterPublishPartsTestCase(unittest.TestCase):
     """Test case for HTML5 writer via the publish_parts() interface."""
@@ -454,11 +425,11 @@ totest['root_prefix'] = ({'root_prefix': ROOT_PREFIX,
    :scale: 100%
 .. figure:: /data/blue%20square.png
 """,
-f'<img alt="/data/blue%20square.png" {HEIGHT_ATTR}src="data:image/png;base64,'
+'<img alt="/data/blue%20square.png" height="32" src="data:image/png;base64,'
 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAIAAAD8GO2jAAAALElEQVR4nO3NMQ'
 'EAMAjAsDFjvIhHFCbgSwU0kdXvsn96BwAAAAAAAAAAAIsNnEwBk52VRuMAAAAA'
 'SUVORK5CYII="'
-f' {WIDTH_ATTR}/>\n{NO_PIL_SYSTEM_MESSAGE}'
+' width="32" />\n'
 '<figure>\n'
 '<img alt="/data/blue%20square.png" src="data:image/png;base64,'
 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAIAAAD8GO2jAAAALElEQVR4nO3NMQ'
@@ -582,7 +553,7 @@ f"""\
 """],
 ])
 
-totest['system_messages-PIL'] = ({'math_output': 'mathml',
+totest['system_messages-image_size'] = ({'math_output': 'mathml',
                                   'warning_stream': '',
                                   }, [
 ["""\
@@ -590,14 +561,14 @@ totest['system_messages-PIL'] = ({'math_output': 'mathml',
    :scale: 100%
    :loading: embed
 """,
-f"""\
+"""\
 <img alt="dummy.png" src="dummy.png" />
 <aside class="system-message">
 <p class="system-message-title">System Message: WARNING/2 \
 (<span class="docutils literal">&lt;string&gt;</span>, line 1)</p>
 <p>Cannot scale image!
   Could not get size from &quot;dummy.png&quot;:
-  {DUMMY_PNG_NOT_FOUND}</p>
+  [Errno 2] No such file or directory: 'dummy.png'</p>
 </aside>
 <aside class="system-message">
 <p class="system-message-title">System Message: ERROR/3 \
@@ -611,7 +582,7 @@ f"""\
 .. image:: dummy.mp4
    :scale: 100%
 """,
-f"""\
+"""\
 <video src="dummy.mp4" title="dummy.mp4">
 <a href="dummy.mp4">dummy.mp4</a>
 </video>
@@ -619,8 +590,8 @@ f"""\
 <p class="system-message-title">System Message: WARNING/2 \
 (<span class="docutils literal">&lt;string&gt;</span>, line 1)</p>
 <p>Cannot scale image!
-  Could not get size from &quot;dummy.mp4&quot;:{REQUIRES_PIL}
-  PIL cannot read video images.</p>
+  Could not get size from &quot;dummy.mp4&quot;:
+  Cannot read the size of video images.</p>
 </aside>
 """,
 ],
@@ -629,14 +600,14 @@ f"""\
    :scale: 100%
    :loading: embed
 """,
-f"""\
+"""\
 <img alt="https://dummy.png" src="https://dummy.png" />
 <aside class="system-message">
 <p class="system-message-title">System Message: WARNING/2 \
 (<span class="docutils literal">&lt;string&gt;</span>, line 1)</p>
 <p>Cannot scale image!
   Could not get size from &quot;https://dummy.png&quot;:
-  {ONLY_LOCAL}</p>
+  Can only read local images.</p>
 </aside>
 <aside class="system-message">
 <p class="system-message-title">System Message: ERROR/3 \
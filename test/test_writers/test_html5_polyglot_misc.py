@@ -8,17 +8,20 @@
 Miscellaneous HTML writer tests.
 """
 
+from io import StringIO
 import os
 from pathlib import Path
 import sys
+import tempfile
 import unittest
+from unittest import mock
 
 if __name__ == '__main__':
     # prepend the "docutils root" to the Python library path
     # so we import the local `docutils` package.
     sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from docutils import core, frontend, nodes, utils
+from docutils import core, frontend, io, nodes, utils
 from docutils.writers import html5_polyglot, _html_base
 
 # TEST_ROOT is ./test/ from the docutils root
@@ -47,6 +50,81 @@ class EncodingTestCase(unittest.TestCase):
         self.assertIn(b'EUR = &#8364;', result)
 
 
+class StreamOutputTestCase(unittest.TestCase):
+
+    source = """\
+=====
+Title
+=====
+
+:Author: Me
+:date: today
+
+.. meta::
+   :keywords: streaming
+
+.. contents::
+
+Section 1
+=========
+
+Math :math:`a^2`.
+
+Section 2
+=========
+
+Text.
+"""
+    settings = {'_disable_config': True,
+                'math_output': 'MathJax /mathjax.js',
+                'stylesheet_path': ''}
+
+    def publish(self, **settings):
+        settings = {**self.settings, **settings}
+        expected = core.publish_string(self.source,
+                                       writer=html5_polyglot.Writer(),
+                                       settings_overrides=settings).decode()
+        parts = []
+        write_parts = io.FileOutput.write_parts
+
+        def record_parts(output, parts_):
+            parts.extend(parts_)
+            write_parts(output, parts)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            destination = Path(tmpdir) / 'stream.html'
+            with mock.patch.object(io.FileOutput, 'write_parts',
+                                   record_parts):
+                core.publish_file(source=StringIO(self.source),
+                                  source_path='<string>',
+                                  destination_path=destination,
+                                  writer=html5_polyglot.Writer(),
+                                  settings_overrides={**settings,
+                                                      'stream_output': True})
+            self.assertEqual(expected,
+                             destination.read_text(encoding='utf-8'))
+        return parts
+
+    def test_stream_output(self):
+        # The head is generated first (with metadata, math script,
+        # and the body class for the table of contents).
+        parts = self.publish()
+        self.assertIn('<body class="with-toc">', parts[0])
+        self.assertIn('src="/mathjax.js', parts[0])
+        self.assertIn('<meta content="streaming" name="keywords"', parts[0])
+        # one part per child of the document:
+        self.assertEqual(len(parts), 5)
+        self.assertIn('<nav class="contents"', parts[1])
+        self.assertIn('<section id="section-1">', parts[2])
+        self.assertIn('<section id="section-2">', parts[3])
+        self.assertEqual(parts[4], '\n</main>\n</body>\n</html>\n')
+
+    def test_stream_output_fragment(self):
+        # templates using the complete body: output at once
+        template = DATA_ROOT / 'full-template.txt'
+        self.assertEqual(len(self.publish(template=template)), 1)
+
+
 class MovingArgsTestCase(unittest.TestCase):
 
     mys = {'stylesheet_path': '',
@@ -273,6 +351,16 @@ class ImagesTestCase(unittest.TestCase):
         self.assertEqual(self.translator.image_size(image),
                          {'style': 'width: 2em;', 'height': '2'})
 
+    def test_read_size_with_PIL(self):
+        # deprecated alias of `read_image_size()`
+        image = nodes.image(uri='circle.svg')
+        with mock.patch.object(self.translator, 'read_image_size',
+                               return_value=(10, 10)) as read_image_size:
+            with self.assertWarnsRegex(DeprecationWarning, 'will be removed'):
+                self.assertEqual(self.translator.read_size_with_PIL(image),
+                                 (10, 10))
+        read_image_size.assert_called_once_with(image)
+
     def test_prepare_svg(self):
         # Internal method: the test is no guaranty for stability,
         # interface and behaviour may change without notice.
@@ -8,8 +8,10 @@
 Test for pseudo-XML writer.
 """
 
+from io import StringIO
 from pathlib import Path
 import sys
+import tempfile
 import unittest
 
 if __name__ == '__main__':
@@ -17,7 +19,7 @@ if __name__ == '__main__':
     # so we import the local `docutils` package.
     sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from docutils.core import publish_string
+from docutils.core import publish_file, publish_string
 from docutils.writers import pseudoxml
 
 
@@ -50,6 +52,28 @@ class WriterPublishTestCase(unittest.TestCase):
                         }).decode()
                     self.assertEqual(case_expected, output)
 
+    def test_stream_output(self):
+        source = ('Title\n=====\n\nText.\n\n'
+                  'Section\n-------\n\nMore text.\n\n'
+                  'Subsection\n``````````\n\n.. note:: Even more text.\n')
+        settings = {'_disable_config': True, 'stream_output': True}
+        expected = publish_string(source, writer=pseudoxml.Writer(),
+                                  settings_overrides=settings).decode()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            destination = Path(tmpdir) / 'stream.txt'
+            writer = pseudoxml.Writer()
+            output = publish_file(source=StringIO(source),
+                                  source_path='<string>',
+                                  destination_path=destination,
+                                  writer=writer, settings_overrides=settings)
+            self.assertEqual(expected, destination.read_text(encoding='utf-8'))
+        # no output string and parts:
+        self.assertIsNone(output)
+        self.assertIsNone(writer.output)
+        self.assertTrue(writer.streamed)
+        with self.assertRaisesRegex(RuntimeError, 'output was written in'):
+            writer.assemble_parts()
+
 
 totest = {}
 totest_detailed = {}
@@ -23,6 +23,9 @@ try:
 except Exception:
     pass
 
+import concurrent.futures
+import hashlib
+import json
 import os
 import os.path
 import sys
@@ -33,7 +36,7 @@ from typing import TYPE_CHECKING
 
 import docutils
 import docutils.io
-from docutils import core, frontend, ApplicationError
+from docutils import core, frontend, utils, ApplicationError
 from docutils.parsers import rst
 from docutils.utils import relative_path
 from docutils.readers import standalone, pep
@@ -42,6 +45,8 @@ from docutils.writers import html4css1, html5_polyglot, pep_html
 if TYPE_CHECKING:
     from typing import Literal
 
+    from concurrent.futures import Future
+
     from docutils.frontend import Values
 
 usage = '%prog [options] [<directory> ...]'
@@ -58,6 +63,7 @@ class SettingsSpec(docutils.SettingsSpec):
     prune_default = ['/*/.hg', '/*/.bzr', '/*/.git', '/*/.svn',
                      '/*/.venv', '/*/__pycache__']
     sources_default = ['*.rst', '*.txt']
+    build_state_default = '.buildhtml-state.json'
 
     # Can't be included in OptionParser below because we don't want to
     # override the base class.
@@ -110,9 +116,28 @@ class SettingsSpec(docutils.SettingsSpec):
           {'action': 'store_true', 'validator': frontend.validate_boolean}),
          ('Do not process files, show files that would be processed.',
           ['--dry-run'],
-          {'action': 'store_true', 'validator': frontend.validate_boolean}),))
-
-    relative_path_settings = ('prune',)
+          {'action': 'store_true', 'validator': frontend.validate_boolean}),
+         ('Number of worker processes for the conversion of source files. '
+          '0 stands for the number of processors.  '
+          'Default: 1 (no parallel processing).',
+          ['--jobs'],
+          {'metavar': '<N>', 'type': 'int', 'default': 1,
+           'validator': frontend.validate_nonnegative_int}),
+         ('Only process files whose source, settings, or dependencies '
+          'changed since the last build (cf. "--build-state").',
+          ['--incremental'],
+          {'action': 'store_true', 'validator': frontend.validate_boolean}),
+         ('Process all files (disable incremental build).  '
+          'This is the default.',
+          ['--no-incremental'],
+          {'dest': 'incremental', 'action': 'store_false'}),
+         ('Record of the last build used for incremental builds.  '
+          f'Default: "{build_state_default}" '
+          '(in the current working directory).',
+          ['--build-state'],
+          {'metavar': '<file>', 'default': build_state_default}),))
+
+    relative_path_settings = ('prune', 'build_state')
     config_section = 'buildhtml application'
     config_section_dependencies = ('applications',)
 
@@ -184,6 +209,10 @@ class Builder:
             self.settings_spec = frontend.Values()
             self.initial_settings = frontend.Values()
         self.directories = []
+        self.build_state: BuildState | None = None
+        self.executor: concurrent.futures.Executor | None = None
+        self.pending: list[tuple[str, Values, str, Future]] = []
+        """Files processed by `self.executor` (not yet finished)."""
 
         self.setup_publishers()
         # default html writer (may change to html5 some time):
@@ -256,8 +285,8 @@ class Builder:
             settings.update(local_config, publisher.option_parser)
         settings.update(self.settings_spec.__dict__, publisher.option_parser)
         # remove duplicate entries from "appending" settings:
-        settings.ignore = list(set(settings.ignore))
-        settings.prune = list(set(settings.prune))
+        settings.ignore = sorted(set(settings.ignore))
+        settings.prune = sorted(set(settings.prune))
         return settings
 
     def run(
@@ -272,16 +301,32 @@ class Builder:
             self.directories = self.settings_spec._directories
         else:
             self.directories = [os.getcwd()]
-        for directory in self.directories:
-            dir_abs = Path(directory).resolve()
-            for dirpath, dirnames, filenames in os.walk(dir_abs):
-                # `os.walk()` by default recurses down the tree,
-                # we modify `dirnames` in-place to control the behaviour.
-                if recurse:
-                    dirnames.sort()
-                else:
-                    del dirnames[:]
-                self.visit(Path(dirpath), dirnames, filenames)
+        if self.initial_settings.incremental:
+            self.build_state = BuildState(self.initial_settings.build_state)
+        if self.initial_settings.jobs != 1:
+            self.executor = concurrent.futures.ProcessPoolExecutor(
+                                max_workers=self.initial_settings.jobs or None)
+        try:
+            for directory in self.directories:
+                dir_abs = Path(directory).resolve()
+                for dirpath, dirnames, filenames in os.walk(dir_abs):
+                    # `os.walk()` by default recurses down the tree,
+                    # we modify `dirnames` in-place to control the behaviour.
+                    if recurse:
+                        dirnames.sort()
+                    else:
+                        del dirnames[:]
+                    self.visit(Path(dirpath), dirnames, filenames)
+            for name, settings, settings_hash, future in self.pending:
+                self.finish_rst_source_file(name, settings, settings_hash,
+                                            *future.result())
+        finally:
+            self.pending = []
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
+            if self.build_state is not None:
+                self.build_state.save()
 
     def visit(
         self,
@@ -317,19 +362,167 @@ class Builder:
         pub_struct = self.publishers[publisher]
         settings._source = str(directory / name)
         settings._destination = os.path.splitext(settings._source)[0] + '.html'
+        settings_hash = get_settings_hash(settings)
+        if (self.build_state is not None
+            and self.build_state.is_up_to_date(
+                settings._source, settings._destination, settings_hash)):
+            if not self.initial_settings.silent:
+                errout.write('    ::: Skipping (unchanged): %s\n' % name)
+                sys.stderr.flush()
+            return
         if not self.initial_settings.silent:
             errout.write('    ::: Processing: %s\n' % name)
             sys.stderr.flush()
-        if not settings.dry_run:
-            try:
-                core.publish_file(source_path=settings._source,
-                                  destination_path=settings._destination,
-                                  reader=pub_struct.reader,
-                                  parser='restructuredtext',
-                                  writer=pub_struct.writer,
-                                  settings=settings)
-            except ApplicationError as err:
-                errout.write(f'        {type(err).__name__}: {err}\n')
+        if settings.dry_run:
+            return
+        # Use a copy with a fresh dependency list for the conversion,
+        # `self.finish_rst_source_file()` merges the results.
+        worker_settings = settings.copy()
+        worker_settings.record_dependencies = utils.DependencyList()
+        args = (settings._source, settings._destination,
+                pub_struct.reader, pub_struct.writer, worker_settings)
+        if self.executor is None:
+            self.finish_rst_source_file(name, settings, settings_hash,
+                                        *convert_file(*args))
+        else:
+            self.pending.append((name, settings, settings_hash,
+                                 self.executor.submit(convert_file, *args)))
+
+    def finish_rst_source_file(self,
+                               name: str,
+                               settings: Values,
+                               settings_hash: str,
+                               dependencies: list[str],
+                               error: str | None,
+                               ) -> None:
+        """Report errors and record dependencies of a processed file."""
+        if error:
+            errout = docutils.io.ErrorOutput(encoding=settings.error_encoding)
+            if self.executor is not None:  # report which file failed
+                errout.write(f'    ::: Error processing: {name}\n')
+            errout.write(f'        {error}\n')
+        settings.record_dependencies.add(*dependencies)
+        if self.build_state is not None:
+            if error:
+                self.build_state.discard(settings._source)
+            else:
+                self.build_state.update(settings._source, settings_hash,
+                                        dependencies)
+
+
+class BuildState:
+
+    """
+    Record of source files, settings, and dependencies of the last build.
+
+    Used to skip unchanged files in incremental builds.
+    Stored as JSON data in the file `path`.
+
+    PROVISIONAL.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = path
+        try:
+            with open(path, encoding='utf-8') as f:
+                self.records = json.load(f)
+        except (OSError, ValueError):
+            self.records = {}
+
+    def is_up_to_date(self,
+                      source: str,
+                      destination: str,
+                      settings_hash: str,
+                      ) -> bool:
+        """Return True, if `source` need not be processed again.
+
+        This is the case if `destination` exists and the settings as well as
+        the source file and all its dependencies did not change since the
+        last build.
+        """
+        record = self.records.get(source)
+        if (record is None
+            or record['settings'] != settings_hash
+            or not os.path.exists(destination)):
+            return False
+        return all(file_signature(path) == signature
+                   for path, signature in record['files'].items())
+
+    def update(self,
+               source: str,
+               settings_hash: str,
+               dependencies: list[str],
+               ) -> None:
+        files = [source, *dependencies]
+        self.records[source] = {
+            'settings': settings_hash,
+            'files': {path: file_signature(path) for path in files}}
+
+    def discard(self, source: str) -> None:
+        self.records.pop(source, None)
+
+    def save(self) -> None:
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.records, f, indent=0, sort_keys=True)
+
+
+def convert_file(source_path: str,
+                 destination_path: str,
+                 reader: str,
+                 writer: str,
+                 settings: Values,
+                 ) -> tuple[list[str], str | None]:
+    """Convert one source file (possibly in a worker process).
+
+    Return the list of dependencies recorded in
+    ``settings.record_dependencies`` and an error message
+    (None, if the conversion succeeds).
+
+    PROVISIONAL.
+    """
+    try:
+        core.publish_file(source_path=source_path,
+                          destination_path=destination_path,
+                          reader=reader,
+                          parser='restructuredtext',
+                          writer=writer,
+                          settings=settings)
+    except ApplicationError as err:
+        error = f'{type(err).__name__}: {err}'
+    else:
+        error = None
+    return settings.record_dependencies.list, error
+
+
+# Settings that do not influence the output of a source file:
+_volatile_settings = {'_source', '_destination', '_directories',
+                      'record_dependencies', 'warning_stream',
+                      'silent', 'dry_run', 'jobs', 'incremental',
+                      'build_state'}
+
+
+def get_settings_hash(settings: Values) -> str:
+    """Return a hash of all settings that may influence the output.
+
+    PROVISIONAL.
+    """
+    data = sorted((key, repr(value))
+                  for key, value in settings.__dict__.items()
+                  if key not in _volatile_settings)
+    data.append(('docutils', docutils.__version__))
+    return hashlib.sha256(repr(data).encode('utf-8')).hexdigest()
+
+
+def file_signature(path: str | os.PathLike[str]) -> list[int] | None:
+    """Return modification time and size of the file `path`.
+
+    Return None, if `path` does not exist.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
 
 
 def match_patterns(name: str | os.PathLike[str], patterns: str) -> bool:
@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+
+# $Id$
+# Copyright: This module has been placed in the public domain.
+
+"""
+Benchmark the Docutils reStructuredText parser, transforms, and writers.
+
+The benchmark uses a fixed corpus of generated documents stressing
+different parts of Docutils (long prose, big tables, deep nesting,
+many references and footnotes, math, and code).  Every phase is timed
+separately:
+
+:parse:       reading the source and parsing (no transforms),
+:transforms:  the transforms of the "standalone" reader and the
+              "restructuredtext" parser,
+:writer:<name>:  the transforms of the writer, the translation, and
+                 encoding the output.
+
+Results are written as JSON and can be compared between checkouts::
+
+    PYTHONPATH=/path/to/old python3 tools/dev/benchmark.py -o old.json
+    PYTHONPATH=/path/to/new python3 tools/dev/benchmark.py -o new.json
+    python3 tools/dev/benchmark.py --compare old.json new.json
+
+Use ``--save-corpus`` and ``--corpus`` to run different versions of this
+script on the same documents.  ``--memory`` adds the size of the
+document tree after parsing and transforms (measured with `tracemalloc`).
+
+Only the Python standard library is required (the code in the corpus
+is not highlighted).
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import pickle
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+
+import docutils
+from docutils import frontend, io, readers, writers
+from docutils.readers import doctree
+
+CORPUS_VERSION = 2
+"""Version of the built-in corpus.  Increment when changing the corpus."""
+
+WRITERS = ('html4', 'html5', 'latex', 'manpage', 'odt', 'pseudoxml', 'xml')
+"""Default writers."""
+
+SETTINGS = {'_disable_config': True,
+            'report_level': 5,  # do not report system messages
+            'halt_level': 5,
+            'syntax_highlight': 'none',  # do not require Pygments
+            'output_encoding': 'utf-8',
+            # prevent FutureWarnings of the LaTeX writer
+            'use_latex_citations': False,
+            'legacy_column_widths': True,
+            }
+"""Settings used for all benchmarks."""
+
+
+# Corpus
+# ======
+#
+# The documents are generated deterministically (no random numbers).
+
+WORDS = ('lorem ipsum dolor sit amet consectetur adipiscing elit sed do '
+         'eiusmod tempor incididunt ut labore et dolore magna aliqua ut '
+         'enim ad minim veniam quis nostrud exercitation ullamco laboris '
+         'nisi aliquip ex ea commodo consequat').split()
+
+
+def words(n: int, start: int = 0) -> str:
+    return ' '.join(WORDS[(start + i) % len(WORDS)] for i in range(n))
+
+
+def section(title: str, char: str = '=') -> str:
+    return f'{title}\n{char * len(title)}\n\n'
+
+
+def prose(sections: int = 60, paragraphs: int = 12) -> str:
+    """Long running text with inline markup."""
+    parts = [section('Prose Benchmark', '#')]
+    for i in range(sections):
+        parts.append(section(f'Section {i}: {words(3, i)}'))
+        for j in range(paragraphs):
+            parts.append(
+                f'{words(20, i + j).capitalize()} *{words(2, j)}* and '
+                f'**{words(2, i)}**, ``literal {j}``, `interpreted`, '
+                f'a reference to `Python <https://www.python.org/>`__ and '
+                f'https://docutils.sourceforge.io/ -- "quoted" text... '
+                f'{words(30, j)}.\n\n')
+    return ''.join(parts)
+
+
+def plain_prose(sections: int = 60, paragraphs: int = 12) -> str:
+    """Long running text, mostly without inline markup."""
+    parts = [section('Plain Prose Benchmark', '#')]
+    for i in range(sections):
+        parts.append(section(f'Section {i} {words(3, i)}'))
+        for j in range(paragraphs):
+            parts.append(f'{words(40, i + j).capitalize()}.\n'
+                         f'{words(30, j).capitalize()}.\n\n')
+        parts.append(f'{words(2, i)}\n    {words(12, i).capitalize()}.\n\n'
+                     f'See *{words(2, i)}* and https://docutils.sf.io/.\n\n')
+    return ''.join(parts)
+
+
+def grid_table(rows: int = 300, cols: int = 6) -> str:
+    """A big grid table."""
+    width = 14
+    border = '+' + '+'.join('-' * width for _ in range(cols)) + '+\n'
+    header = border.replace('-', '=')
+    lines = [section('Grid Table Benchmark'), border]
+    for r in range(rows):
+        cells = (f' {words(2, r + c)[:width - 2]:<{width - 1}}'
+                 for c in range(cols))
+        lines.append('|' + '|'.join(cells) + '|\n')
+        lines.append(header if r == 0 else border)
+    return ''.join(lines) + '\n'
+
+
+def simple_table(rows: int = 1500, cols: int = 5) -> str:
+    """A big simple table."""
+    width = 14
+    border = ' '.join('=' * width for _ in range(cols)) + '\n'
+    lines = [section('Simple Table Benchmark'), border]
+    for r in range(rows):
+        lines.append(' '.join(f'{words(2, r + c)[:width]:<{width}}'
+                              for c in range(cols)).rstrip() + '\n')
+        if r == 0:
+            lines.append(border)
+    lines.append(border)
+    return ''.join(lines) + '\n'
+
+
+def csv_table(rows: int = 3000, cols: int = 6) -> str:
+    """A big "csv-table" directive."""
+    lines = [section('CSV Table Benchmark'),
+             '.. csv-table:: Benchmark\n   :header-rows: 1\n\n']
+    for r in range(rows):
+        lines.append('   ' + ', '.join(f'"{words(2, r + c)} {r}"'
+                                       for c in range(cols)) + '\n')
+    return ''.join(lines) + '\n'
+
+
+def nesting(repeat: int = 40, depth: int = 25) -> str:
+    """Deeply nested lists and block quotes."""
+    parts = [section('Nesting Benchmark')]
+    markers = ('*', '#.', '-', '1.')
+    for i in range(repeat):
+        indent = ''
+        for level in range(depth):
+            marker = markers[level % len(markers)]
+            parts.append(f'{indent}{marker} {words(8, i + level)}\n\n')
+            indent += ' ' * (len(marker) + 1)
+        parts.append('\n')
+        for level in range(depth):
+            parts.append('  ' * level + words(6, level) + '\n\n')
+        parts.append('..\n\n')  # end block quotes
+    return ''.join(parts)
+
+
+def references(targets: int = 1500, footnotes: int = 800,
+               citations: int = 200, substitutions: int = 200) -> str:
+    """Many hyperlink references, footnotes, citations, substitutions."""
+    parts = [section('References Benchmark')]
+    for i in range(targets):
+        parts.append(f'See target{i}_, `anonymous {i}`__, '
+                     f'footnote [#]_ and [#note{i % footnotes}]_, '
+                     f'[CIT{i % citations}]_, |sub{i % substitutions}|.\n\n'
+                     f'__ https://example.org/anonymous/{i}\n\n'
+                     f'.. [#] Auto-numbered footnote {i}.\n\n')
+    for i in range(targets):
+        parts.append(f'.. _target{i}: https://example.org/{i}\n')
+    parts.append('\n')
+    for i in range(footnotes):
+        parts.append(f'.. [#note{i}] Labeled footnote {i}.\n')
+    parts.append('\n')
+    for i in range(citations):
+        parts.append(f'.. [CIT{i}] Citation {i}.\n')
+    parts.append('\n')
+    for i in range(substitutions):
+        parts.append(f'.. |sub{i}| replace:: substitution *{i}*\n')
+    return ''.join(parts) + '\n'
+
+
+def math(blocks: int = 300) -> str:
+    """Math blocks and inline math."""
+    parts = [section('Math Benchmark')]
+    for i in range(blocks):
+        parts.append(
+            f'Inline :math:`\\alpha_{{{i}}} + \\sqrt{{x^{i}}}` math.\n\n'
+            f'.. math::\n\n'
+            f'   \\int_0^{{{i}}} f(x)\\,dx = \\sum_{{n=1}}^\\infty '
+            f'\\frac{{a_n}}{{n^2}} + \\left(\\begin{{matrix}} a & b \\\\ '
+            f'c & d \\end{{matrix}}\\right)\n\n')
+    return ''.join(parts)
+
+
+def code(blocks: int = 300) -> str:
+    """Literal blocks, "code" directives, and doctest blocks."""
+    parts = [section('Code Benchmark')]
+    snippet = ''.join(f'    value_{n} = compute({n}, "{words(2, n)}")\n'
+                      for n in range(12))
+    for i in range(blocks):
+        parts.append(f'Literal block {i}::\n\n  def function_{i}():\n'
+                     + snippet.replace('    ', '      ', 1)
+                     + f'\n.. code:: python\n   :number-lines:\n\n'
+                     f'   def function_{i}():\n'
+                     + snippet.replace('    ', '       ')
+                     + f'\n>>> function_{i}()\n{i}\n\n')
+    return ''.join(parts)
+
+
+CORPUS = {'prose': prose,
+          'plain_prose': plain_prose,
+          'grid_table': grid_table,
+          'simple_table': simple_table,
+          'csv_table': csv_table,
+          'nesting': nesting,
+          'references': references,
+          'math': math,
+          'code': code,
+          }
+"""Functions generating the built-in corpus documents."""
+
+
+def load_corpus(directory: str | None = None) -> dict[str, str]:
+    """Return the corpus (from `directory` or built-in) as {name: text}."""
+    if directory is None:
+        return {name: generate() for name, generate in CORPUS.items()}
+    return {path.stem: path.read_text(encoding='utf-8')
+            for path in sorted(Path(directory).glob('*.rst'))}
+
+
+def save_corpus(corpus: dict[str, str], directory: str) -> None:
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    for name, text in corpus.items():
+        (Path(directory) / f'{name}.rst').write_text(text, encoding='utf-8')
+
+
+# Benchmark
+# =========
+
+def timed(function, *args):
+    """Return the result of `function(*args)` and the time it took."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def parse(text, settings):
+    reader = readers.get_reader_class('standalone')('restructuredtext')
+    document = reader.read(io.StringInput(text), reader.parser, settings)
+    return document, reader
+
+
+def transform(document, reader):
+    document.transformer.populate_from_components((reader, reader.parser))
+    document.transformer.apply_transforms()
+    return document
+
+
+def write(document, writer, settings):
+    # cf. `docutils.core.publish_from_doctree()`
+    document = doctree.Reader().read(io.DocTreeInput(document),
+                                     None, settings)
+    destination = io.StringOutput(encoding=settings.output_encoding)
+    document.transformer.populate_from_components((writer, destination))
+    document.transformer.apply_transforms()
+    return writer.write(document, destination)
+
+
+def get_settings(*components):
+    return frontend.get_default_settings(*components).copy()
+
+
+def copy_doctree(document):
+    # cf. `docutils.core._copy_doctree()`
+    settings, document.settings = document.settings, None
+    try:
+        return pickle.dumps(document, protocol=pickle.HIGHEST_PROTOCOL)
+    finally:
+        document.settings = settings
+
+
+def summarize(times: list[float]) -> dict[str, float]:
+    return {'min': min(times),
+            'median': statistics.median(times),
+            'mean': statistics.fmean(times),
+            }
+
+
+def benchmark_document(text: str,
+                       writer_names: list[str],
+                       repeat: int,
+                       ) -> dict[str, dict[str, float]]:
+    reader_class = readers.get_reader_class('standalone')
+    parser_reader = reader_class('restructuredtext')
+    base_settings = get_settings(parser_reader, parser_reader.parser)
+    for name, value in SETTINGS.items():
+        setattr(base_settings, name, value)
+    times = {'parse': [], 'transforms': []}
+    for _i in range(repeat):
+        settings = base_settings.copy()
+        (document, reader), elapsed = timed(parse, text, settings)
+        times['parse'].append(elapsed)
+        document, elapsed = timed(transform, document, reader)
+        times['transforms'].append(elapsed)
+    pickled = copy_doctree(document)
+    for writer_name in writer_names:
+        writer = writers.get_writer_class(writer_name)()
+        settings = get_settings(parser_reader.parser, doctree.Reader(),
+                                writer)
+        for name, value in SETTINGS.items():
+            setattr(settings, name, value)
+        key = f'writer:{writer_name}'
+        times[key] = []
+        for _i in range(repeat):
+            copy = pickle.loads(pickled)
+            _output, elapsed = timed(write, copy, writer, settings.copy())
+            times[key].append(elapsed)
+    return {phase: summarize(values) for phase, values in times.items()}
+
+
+def measure_memory(text: str) -> dict[str, int]:
+    """Return the memory used by parsing and transforming `text`.
+
+    :doctree: size of the memory blocks allocated while parsing and
+              transforming that are still in use (i.e. the document tree),
+    :peak:    peak size of traced memory blocks,
+
+    in bytes, measured with `tracemalloc`.
+    """
+    reader = readers.get_reader_class('standalone')('restructuredtext')
+    settings = get_settings(reader, reader.parser)
+    for name, value in SETTINGS.items():
+        setattr(settings, name, value)
+    tracemalloc.start()
+    try:
+        document, reader = parse(text, settings)
+        transform(document, reader)
+        doctree_size, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'doctree': doctree_size, 'peak': peak}
+
+
+def run(corpus: dict[str, str],
+        writer_names: list[str],
+        repeat: int,
+        memory: bool = False,
+        verbose: bool = True,
+        ) -> dict:
+    results = {}
+    for name, text in corpus.items():
+        if verbose:
+            print(f'{name} ({len(text)} characters) ...',
+                  end=' ', flush=True, file=sys.stderr)
+        start = time.perf_counter()
+        timings = benchmark_document(text, writer_names, repeat)
+        results[name] = {
+            'characters': len(text),
+            'sha256': hashlib.sha256(text.encode('utf-8')).hexdigest(),
+            'timings': timings,
+            }
+        if memory:
+            results[name]['memory'] = measure_memory(text)
+        if verbose:
+            print(f'{time.perf_counter() - start:.1f} s', file=sys.stderr)
+    return {'docutils_version': docutils.__version__,
+            'docutils_version_details': str(docutils.__version_details__),
+            'docutils_path': str(Path(docutils.__file__).parent),
+            'python_version': platform.python_version(),
+            'platform': platform.platform(),
+            'corpus_version': CORPUS_VERSION,
+            'repeat': repeat,
+            'results': results,
+            }
+
+
+# Reports
+# =======
+
+def report(data: dict, statistic: str = 'min') -> str:
+    """Return a table with the `statistic` of all timings in `data`."""
+    lines = [f'Docutils {data["docutils_version"]} '
+             f'({data["docutils_path"]}), '
+             f'Python {data["python_version"]}, '
+             f'{statistic} of {data["repeat"]} runs [s]:', '']
+    lines.append(f'{"document":<14} {"phase":<16} {"time":>9}')
+    for doc_name, result in data['results'].items():
+        for phase, summary in result['timings'].items():
+            lines.append(f'{doc_name:<14} {phase:<16} '
+                         f'{summary[statistic]:9.4f}')
+    if any('memory' in result for result in data['results'].values()):
+        lines += ['', 'memory [KiB]:', '',
+                  f'{"document":<14} {"doctree":>9} {"peak":>9}']
+        for doc_name, result in data['results'].items():
+            if 'memory' in result:
+                lines.append(f'{doc_name:<14} '
+                             f'{result["memory"]["doctree"]/1024:9.0f} '
+                             f'{result["memory"]["peak"]/1024:9.0f}')
+    return '\n'.join(lines)
+
+
+def compare(old: dict, new: dict, statistic: str = 'min') -> str:
+    """Return a table comparing the timings in `old` and `new`."""
+    lines = [f'old: Docutils {old["docutils_version"]} '
+             f'({old["docutils_path"]})',
+             f'new: Docutils {new["docutils_version"]} '
+             f'({new["docutils_path"]})',
+             f'{statistic} of runs [s], ratio = new/old', '',
+             f'{"document":<14} {"phase":<16} '
+             f'{"old":>9} {"new":>9} {"ratio":>7}']
+    for doc_name, old_result in old['results'].items():
+        new_result = new['results'].get(doc_name)
+        if new_result is None:
+            continue
+        if old_result['sha256'] != new_result['sha256']:
+            lines.append(f'{doc_name:<14} (different source, skipped)')
+            continue
+        for phase, old_summary in old_result['timings'].items():
+            if phase not in new_result['timings']:
+                continue
+            old_time = old_summary[statistic]
+            new_time = new_result['timings'][phase][statistic]
+            ratio = new_time / old_time if old_time else float('nan')
+            lines.append(f'{doc_name:<14} {phase:<16} '
+                         f'{old_time:9.4f} {new_time:9.4f} {ratio:7.2f}')
+        if 'memory' in old_result and 'memory' in new_result:
+            for key, old_size in old_result['memory'].items():
+                new_size = new_result['memory'][key]
+                lines.append(f'{doc_name:<14} {"memory:" + key:<16} '
+                             f'{old_size/1024:9.0f} {new_size/1024:9.0f} '
+                             f'{new_size/old_size:7.2f}')
+    return '\n'.join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    argparser = argparse.ArgumentParser(
+        description='Benchmark Docutils (parser, transforms, writers).')
+    argparser.add_argument('-o', '--output', metavar='<file>',
+                           help='Write results as JSON to <file>.')
+    argparser.add_argument('-r', '--repeat', type=int, default=3,
+                           metavar='<n>',
+                           help='Number of runs per phase (default: 3).')
+    argparser.add_argument('-d', '--document', action='append',
+                           metavar='<name>', dest='documents',
+                           help='Benchmark only this corpus document '
+                           '(may be repeated). '
+                           f'Choices: {", ".join(CORPUS)}.')
+    argparser.add_argument('-w', '--writer', action='append',
+                           metavar='<name>', dest='writers',
+                           help='Benchmark this writer (may be repeated). '
+                           f'Default: {", ".join(WRITERS)}.')
+    argparser.add_argument('--memory', action='store_true',
+                           help='Also measure the memory used by the '
+                           'document tree (with tracemalloc, in KiB).')
+    argparser.add_argument('--corpus', metavar='<directory>',
+                           help='Use the *.rst files in <directory> '
+                           'instead of the built-in corpus.')
+    argparser.add_argument('--save-corpus', metavar='<directory>',
+                           help='Write the built-in corpus to <directory> '
+                           'and exit.')
+    argparser.add_argument('--statistic', default='min',
+                           choices=('min', 'median', 'mean'),
+                           help='Statistic used in reports (default: min).')
+    argparser.add_argument('--compare', nargs=2, metavar='<file>',
+                           help='Compare two JSON result files and exit.')
+    args = argparser.parse_args(argv)
+
+    if args.compare:
+        old, new = (json.loads(Path(path).read_text(encoding='utf-8'))
+                    for path in args.compare)
+        print(compare(old, new, args.statistic))
+        return
+    corpus = load_corpus(args.corpus)
+    if args.save_corpus:
+        save_corpus(corpus, args.save_corpus)
+        return
+    if args.documents:
+        unknown = set(args.documents).difference(corpus)
+        if unknown:
+            argparser.error(f'unknown document(s): {", ".join(unknown)}')
+        corpus = {name: corpus[name] for name in args.documents}
+    warnings.simplefilter('ignore', category=FutureWarning)
+    data = run(corpus, args.writers or list(WRITERS), args.repeat,
+               memory=args.memory)
+    if args.output:
+        Path(args.output).write_text(json.dumps(data, indent=2) + '\n',
+                                     encoding='utf-8')
+    print(report(data, args.statistic))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+
+# $Id$
+# Copyright: This module has been placed in the public domain.
+
+"""
+Generate reStructuredText test documents of configurable size.
+
+The size of every construct is set separately, e.g. ::
+
+    generate_rst.py --sections 100 --grid-table 50x8 --footnotes 1000 \\
+                    --output big.rst
+
+Included files are written next to the output file.
+The output is deterministic (no random numbers).
+
+See also ``scaling.py`` (empirical complexity of parsing) and
+``benchmark.py`` (fixed benchmark corpus).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+WORDS = ('lorem ipsum dolor sit amet consectetur adipiscing elit sed do '
+         'eiusmod tempor incididunt ut labore et dolore magna aliqua ut '
+         'enim ad minim veniam quis nostrud exercitation ullamco laboris '
+         'nisi aliquip ex ea commodo consequat').split()
+
+
+def words(n: int, start: int = 0) -> str:
+    return ' '.join(WORDS[(start + i) % len(WORDS)] for i in range(n))
+
+
+def paragraph(i: int, length: int = 40) -> str:
+    return f'{words(length, i).capitalize()} *{words(2, i)}* ``{i}``.\n\n'
+
+
+def sections(n: int, depth: int = 3) -> str:
+    """`n` sections (nested up to `depth` levels) with a paragraph each."""
+    chars = '=-~^"+'[:max(depth, 1)]
+    parts = []
+    for i in range(n):
+        title = f'Section {i}'
+        parts.append(f'{title}\n{chars[i % len(chars)] * len(title)}\n\n'
+                     + paragraph(i))
+    return ''.join(parts)
+
+
+def bullet_list(n: int, depth: int = 1) -> str:
+    """A bullet list with `n` items, nested `depth` levels deep."""
+    return _list(n, depth, lambda level, i: '*-+'[level % 3])
+
+
+def enumerated_list(n: int, depth: int = 1) -> str:
+    """An enumerated list with `n` items, nested `depth` levels deep."""
+    return _list(n, depth, lambda level, i: '#.')
+
+
+def _list(n: int, depth: int, marker) -> str:
+    parts = []
+    for i in range(n):
+        indent = ''
+        for level in range(depth):
+            m = marker(level, i)
+            parts.append(f'{indent}{m} {words(8, i + level)}\n\n')
+            indent += ' ' * (len(m) + 1)
+    return ''.join(parts) + '..\n\n'
+
+
+def grid_table(rows: int, cols: int, width: int = 12) -> str:
+    """A grid table with `rows` × `cols` cells."""
+    border = '+' + '+'.join('-' * width for _ in range(cols)) + '+\n'
+    lines = [border]
+    for r in range(rows):
+        cells = (f' {words(2, r + c)[:width - 2]:<{width - 1}}'
+                 for c in range(cols))
+        lines.append('|' + '|'.join(cells) + '|\n')
+        lines.append(border.replace('-', '=') if r == 0 else border)
+    return ''.join(lines) + '\n'
+
+
+def targets(n: int) -> str:
+    """`n` hyperlink references and their (external) targets."""
+    refs = ''.join(f'Reference to target{i}_.\n' for i in range(n))
+    defs = ''.join(f'.. _target{i}: https://example.org/{i}\n'
+                   for i in range(n))
+    return refs + '\n' + defs + '\n'
+
+
+def footnotes(n: int) -> str:
+    """`n` auto-numbered and `n` labeled footnotes with references."""
+    parts = []
+    for i in range(n):
+        parts.append(f'Footnotes [#]_ and [#note{i}]_.\n\n'
+                     f'.. [#] Auto-numbered footnote {i}.\n'
+                     f'.. [#note{i}] Labeled footnote {i}.\n\n')
+    return ''.join(parts)
+
+
+def substitutions(n: int) -> str:
+    """`n` substitution definitions and references."""
+    refs = ''.join(f'Substitution |sub{i}|.\n' for i in range(n))
+    defs = ''.join(f'.. |sub{i}| replace:: text *{i}*\n' for i in range(n))
+    return refs + '\n' + defs + '\n'
+
+
+def includes(n: int, directory: Path) -> str:
+    """`n` "include" directives (the included files are written)."""
+    directory.mkdir(parents=True, exist_ok=True)
+    parts = []
+    for i in range(n):
+        name = f'include{i}.rst'
+        (directory / name).write_text(paragraph(i), encoding='utf-8')
+        parts.append(f'.. include:: {name}\n\n')
+    return ''.join(parts)
+
+
+def generate(n_sections: int = 0,
+             n_bullet_items: int = 0,
+             n_enumerated_items: int = 0,
+             list_depth: int = 1,
+             table_size: tuple[int, int] = (0, 0),
+             n_targets: int = 0,
+             n_footnotes: int = 0,
+             n_substitutions: int = 0,
+             n_includes: int = 0,
+             include_dir: Path | None = None,
+             ) -> str:
+    """Return a document combining the given constructs."""
+    parts = ['Generated Document\n##################\n\n', paragraph(0)]
+    if n_bullet_items:
+        parts.append(bullet_list(n_bullet_items, list_depth))
+    if n_enumerated_items:
+        parts.append(enumerated_list(n_enumerated_items, list_depth))
+    if all(table_size):
+        parts.append(grid_table(*table_size))
+    if n_targets:
+        parts.append(targets(n_targets))
+    if n_footnotes:
+        parts.append(footnotes(n_footnotes))
+    if n_substitutions:
+        parts.append(substitutions(n_substitutions))
+    if n_includes:
+        parts.append(includes(n_includes, include_dir or Path.cwd()))
+    if n_sections:
+        parts.append(sections(n_sections))
+    return ''.join(parts)
+
+
+def table_size(value: str) -> tuple[int, int]:
+    rows, _, cols = value.partition('x')
+    try:
+        return int(rows), int(cols)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f'expected <rows>x<columns>, not "{value}"')
+
+
+def main(argv: list[str] | None = None) -> None:
+    argparser = argparse.ArgumentParser(
+        description='Generate a reStructuredText test document.')
+    add = argparser.add_argument
+    add('--sections', type=int, default=0, metavar='<n>',
+        help='Number of sections.')
+    add('--bullet-list', type=int, default=0, metavar='<n>',
+        help='Number of bullet list items.')
+    add('--enumerated-list', type=int, default=0, metavar='<n>',
+        help='Number of enumerated list items.')
+    add('--list-depth', type=int, default=1, metavar='<n>',
+        help='Nesting depth of list items (default: 1).')
+    add('--grid-table', type=table_size, default=(0, 0),
+        metavar='<rows>x<columns>', help='Size of a grid table.')
+    add('--targets', type=int, default=0, metavar='<n>',
+        help='Number of hyperlink targets and references.')
+    add('--footnotes', type=int, default=0, metavar='<n>',
+        help='Number of footnotes (auto-numbered and labeled each).')
+    add('--substitutions', type=int, default=0, metavar='<n>',
+        help='Number of substitution definitions and references.')
+    add('--includes', type=int, default=0, metavar='<n>',
+        help='Number of "include" directives.')
+    add('-o', '--output', metavar='<file>',
+        help='Output file (default: stdout).')
+    args = argparser.parse_args(argv)
+
+    if args.output:
+        include_dir = Path(args.output).parent
+    else:
+        include_dir = Path.cwd()
+    text = generate(n_sections=args.sections,
+                    n_bullet_items=args.bullet_list,
+                    n_enumerated_items=args.enumerated_list,
+                    list_depth=args.list_depth,
+                    table_size=args.grid_table,
+                    n_targets=args.targets,
+                    n_footnotes=args.footnotes,
+                    n_substitutions=args.substitutions,
+                    n_includes=args.includes,
+                    include_dir=include_dir)
+    if args.output:
+        Path(args.output).write_text(text, encoding='utf-8')
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,31 +4,44 @@
 # Author: Lea Wiemann <LeWiemann@gmail.com>
 # Copyright: This script has been placed in the public domain.
 
+"""
+Profile the conversion of a document (default: HISTORY.rst) to HTML.
+
+Usage: profile_docutils.py [<source> [<writer>]]
+
+Use ``benchmark.py`` to compare the performance of Docutils versions.
+"""
+
+import cProfile
 import os.path
+import pstats
+import sys
+
 import docutils.core
-import hotshot.stats
 
-print('Profiler started.')
+source_path = os.path.abspath(sys.argv[1]) if len(sys.argv) > 1 else None
+writer = sys.argv[2] if len(sys.argv) > 2 else 'html'
 
 os.chdir(os.path.join(os.path.dirname(docutils.__file__), '..'))
 
 print('Profiling...')
 
-prof = hotshot.Profile('docutils.prof')
-prof.runcall(docutils.core.publish_file, source_path='HISTORY.rst',
-             destination_path='prof.HISTORY.html', writer='html')
-prof.close()
+profile = cProfile.Profile()
+profile.runcall(docutils.core.publish_file,
+                source_path=source_path or 'HISTORY.rst',
+                destination_path=os.devnull, writer=writer)
+profile.dump_stats('docutils.prof')
 
 print('Loading statistics...')
 
 print("""
-stats = hotshot.stats.load('docutils.prof')
+stats = pstats.Stats('docutils.prof')
 stats.strip_dirs()
 stats.sort_stats('time')  # 'cumulative'; 'calls'
 stats.print_stats(40)
 """)
 
-stats = hotshot.stats.load('docutils.prof')
+stats = pstats.Stats('docutils.prof')
 stats.strip_dirs()
 stats.sort_stats('time')
 stats.print_stats(40)
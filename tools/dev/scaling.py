@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+
+# $Id$
+# Copyright: This module has been placed in the public domain.
+
+"""
+Measure how parsing time scales with the size of reStructuredText constructs.
+
+For every construct, documents of increasing size are generated
+(cf. ``generate_rst.py``) and processed with `docutils.core.publish_doctree()`
+(parsing and the reader/parser transforms).  The report lists the times
+and the empirical complexity exponent *k* (time ~ size**k, least-squares
+fit in log-log space): *k* ≈ 1 is linear, *k* ≈ 2 quadratic.
+
+Example::
+
+    scaling.py --steps 6 --construct footnotes --construct grid_table_rows
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+import docutils
+from docutils import core
+
+import generate_rst
+
+SETTINGS = {'_disable_config': True,
+            'report_level': 5,  # do not report system messages
+            'halt_level': 5,
+            }
+"""Settings used for all runs."""
+
+CONSTRUCTS = {
+    # name: (start size, function returning the document for a size)
+    'sections': (50, lambda n, d: generate_rst.generate(n_sections=n)),
+    'bullet_list': (100,
+                    lambda n, d: generate_rst.generate(n_bullet_items=n)),
+    'enumerated_list': (100, lambda n, d: generate_rst.generate(
+                                              n_enumerated_items=n)),
+    'list_depth': (2, lambda n, d: generate_rst.generate(
+                                       n_bullet_items=10, list_depth=n)),
+    'grid_table_rows': (25, lambda n, d: generate_rst.generate(
+                                             table_size=(n, 4))),
+    'grid_table_columns': (4, lambda n, d: generate_rst.generate(
+                                               table_size=(10, n))),
+    'targets': (100, lambda n, d: generate_rst.generate(n_targets=n)),
+    'footnotes': (50, lambda n, d: generate_rst.generate(n_footnotes=n)),
+    'substitutions': (100,
+                      lambda n, d: generate_rst.generate(n_substitutions=n)),
+    'includes': (20, lambda n, d: generate_rst.generate(n_includes=n,
+                                                        include_dir=d)),
+    }
+"""Constructs, start sizes, and document generators."""
+
+
+def time_parsing(text: str, source_path: Path, repeat: int) -> float:
+    """Return the minimal time of `repeat` runs of `publish_doctree()`."""
+    times = []
+    for _i in range(repeat):
+        start = time.perf_counter()
+        core.publish_doctree(text, source_path=str(source_path),
+                             settings_overrides=SETTINGS)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def exponent(sizes: list[int], times: list[float]) -> float:
+    """Return the slope of a least-squares fit of log(time) to log(size)."""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(t) for t in times]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    covariance = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+    variance = sum((x - x_mean) ** 2 for x in xs)
+    return covariance / variance
+
+
+def sweep(name: str, steps: int, factor: int, repeat: int,
+          verbose: bool = True) -> dict:
+    """Process documents of increasing size for construct `name`."""
+    start_size, generate = CONSTRUCTS[name]
+    sizes, characters, times = [], [], []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_path = Path(tmpdir) / 'document.rst'
+        # warm-up (imports, caches)
+        time_parsing(generate(start_size, Path(tmpdir)), source_path, 1)
+        for step in range(steps):
+            size = start_size * factor**step
+            text = generate(size, Path(tmpdir))
+            sizes.append(size)
+            characters.append(len(text))
+            times.append(time_parsing(text, source_path, repeat))
+            if verbose:
+                print(f'{name} {size}: {times[-1]:.4f} s',
+                      file=sys.stderr)
+    return {'sizes': sizes,
+            'characters': characters,
+            'times': times,
+            'exponent': exponent(sizes, times),
+            }
+
+
+def report(results: dict) -> str:
+    lines = [f'{"construct":<20} {"k":>5}  size: time [s]']
+    for name, result in results.items():
+        points = ', '.join(f'{size}: {t:.4f}' for size, t
+                           in zip(result['sizes'], result['times']))
+        lines.append(f'{name:<20} {result["exponent"]:5.2f}  {points}')
+    return '\n'.join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    argparser = argparse.ArgumentParser(
+        description='Measure the scaling of parsing time with the size '
+        'of reStructuredText constructs.')
+    argparser.add_argument('-c', '--construct', action='append',
+                           choices=CONSTRUCTS, dest='constructs',
+                           help='Construct to measure (may be repeated). '
+                           'Default: all.')
+    argparser.add_argument('-s', '--steps', type=int, default=5,
+                           metavar='<n>',
+                           help='Number of sizes per construct (default: 5).')
+    argparser.add_argument('-f', '--factor', type=int, default=2,
+                           metavar='<n>',
+                           help='Size factor between steps (default: 2).')
+    argparser.add_argument('-r', '--repeat', type=int, default=3,
+                           metavar='<n>',
+                           help='Number of runs per size (default: 3).')
+    argparser.add_argument('-o', '--output', metavar='<file>',
+                           help='Write results as JSON to <file>.')
+    args = argparser.parse_args(argv)
+    if args.steps < 2:
+        argparser.error('at least 2 steps are required')
+
+    warnings.simplefilter('ignore', category=FutureWarning)
+    results = {name: sweep(name, args.steps, args.factor, args.repeat)
+               for name in args.constructs or CONSTRUCTS}
+    if args.output:
+        data = {'docutils_version': docutils.__version__,
+                'docutils_path': str(Path(docutils.__file__).parent),
+                'repeat': args.repeat,
+                'results': results}
+        Path(args.output).write_text(json.dumps(data, indent=2) + '\n',
+                                     encoding='utf-8')
+    print(report(results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+# $Id$
+# Copyright: This module has been placed in the public domain.
+
+"""
+Measure how the time of the grid table parser scales with the table size.
+
+Grid tables of increasing size (cf. ``generate_rst.grid_table()``) are
+parsed with `docutils.parsers.rst.tableparser.GridTableParser` (without
+the parsing of the cell contents).  The number of rows or columns
+(``--columns``) is doubled in every step.  The report lists the time
+per cell and the empirical complexity exponent *k* (time ~ cells**k,
+cf. ``scaling.py``): *k* ≈ 1 is linear.
+
+Example::
+
+    table_scaling.py --steps 5 --rows 25 --columns 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from docutils.parsers.rst import tableparser
+from docutils.statemachine import StringList
+
+import generate_rst
+from scaling import exponent
+
+
+def table_block(rows: int, cols: int) -> StringList:
+    """The lines of a grid table as passed to the table parser."""
+    lines = generate_rst.grid_table(rows, cols).splitlines()[:-1]
+    block = StringList(lines, 'table')
+    block.pad_double_width(tableparser.TableParser.double_width_pad_char)
+    return block
+
+
+def time_table(block: StringList, repeat: int) -> float:
+    """Return the minimal time of `repeat` runs of the grid table parser."""
+    times = []
+    for _i in range(repeat):
+        start = time.perf_counter()
+        tableparser.GridTableParser().parse(block)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(argv: list[str] | None = None) -> None:
+    argparser = argparse.ArgumentParser(
+        description='Measure the scaling of the grid table parser '
+        'with the table size.')
+    argparser.add_argument('--rows', type=int, default=25, metavar='<n>',
+                           help='Number of rows in the first step '
+                           '(default: 25).')
+    argparser.add_argument('--columns', type=int, default=10, metavar='<n>',
+                           help='Number of columns in the first step '
+                           '(default: 10).')
+    argparser.add_argument('--double', choices=('rows', 'columns'),
+                           default='rows',
+                           help='Dimension doubled in every step '
+                           '(default: rows).')
+    argparser.add_argument('-s', '--steps', type=int, default=5,
+                           metavar='<n>',
+                           help='Number of table sizes (default: 5).')
+    argparser.add_argument('-r', '--repeat', type=int, default=3,
+                           metavar='<n>',
+                           help='Number of runs per size (default: 3).')
+    args = argparser.parse_args(argv)
+    if args.steps < 2:
+        argparser.error('at least 2 steps are required')
+
+    time_table(table_block(2, 2), 1)  # warm-up
+    print(f'{"rows":>6} {"columns":>7} {"cells":>7} {"time [s]":>9}'
+          '  [µs/cell]')
+    cells, times = [], []
+    for step in range(args.steps):
+        rows, cols = args.rows, args.columns
+        if args.double == 'rows':
+            rows *= 2**step
+        else:
+            cols *= 2**step
+        cells.append(rows * cols)
+        times.append(time_table(table_block(rows, cols), args.repeat))
+        print(f'{rows:>6} {cols:>7} {cells[-1]:>7} {times[-1]:9.4f}'
+              f'  {times[-1] / cells[-1] * 1e6:9.2f}')
+    print(f'k = {exponent(cells, times):.2f}')
+
+
+if __name__ == '__main__':
+    main()
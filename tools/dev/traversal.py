@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+# $Id$
+# Copyright: This module has been placed in the public domain.
+
+"""
+Measure the cost of document tree traversals as a function of tree depth.
+
+Documents with deeply nested block quotes and bullet lists are parsed
+and the time per node of `Node.findall()`, `Node.walk()`,
+`Node.walkabout()`, `Element.astext()`, `Element.pformat()`,
+`Element.deepcopy()`, and the `Node.document` lookup is reported
+for every depth.  With ``--synthetic``,
+the trees are built directly (nested `nodes.block_quote` elements)
+to go beyond the nesting depth supported by the parser.
+
+The time per node should not depend on the depth.
+
+Example::
+
+    traversal.py --depth 10 --depth 100 --synthetic --depth 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from docutils import core, nodes, utils
+
+SETTINGS = {'_disable_config': True,
+            'report_level': 5,  # do not report system messages
+            'halt_level': 5,
+            }
+"""Settings used for parsing."""
+
+
+class Visitor(nodes.SparseNodeVisitor):
+    """Visitor doing nothing (measures the traversal overhead)."""
+
+    def unknown_visit(self, node) -> None:
+        pass
+
+    def unknown_departure(self, node) -> None:
+        pass
+
+
+OPERATIONS = {
+    'findall': lambda doc: sum(1 for _ in doc.findall()),
+    'findall(cls)': lambda doc: sum(1 for _ in doc.findall(nodes.paragraph)),
+    'walk': lambda doc: doc.walk(Visitor(doc)),
+    'walkabout': lambda doc: doc.walkabout(Visitor(doc)),
+    'astext': lambda doc: doc.astext(),
+    'pformat': lambda doc: doc.pformat(),
+    'deepcopy': lambda doc: doc.deepcopy(),
+    'document': lambda doc: [node.document for node in doc.findall()],
+    }
+"""Traversals to measure."""
+
+
+def nested_rst(depth: int, repeat: int) -> str:
+    """Nested block quotes and bullet lists, `depth` levels deep."""
+    parts = []
+    for i in range(repeat):
+        for level in range(depth):
+            parts.append('  ' * level + f'Block quote {i} level {level}.\n\n')
+        parts.append('..\n\n')
+        for level in range(depth):
+            parts.append('  ' * level + f'* List {i} level {level}.\n\n')
+        parts.append('..\n\n')
+    return ''.join(parts)
+
+
+def nested_tree(depth: int, repeat: int) -> nodes.document:
+    """A document with nested block quotes, built without parsing.
+
+    Like the parser does for many constructs, the nested elements
+    are built before they are attached to the document.
+    """
+    document = utils.new_document('synthetic')
+    for i in range(repeat):
+        quote = None
+        for level in reversed(range(depth)):
+            children = [nodes.paragraph('', f'Block quote {i} level {level}.')]
+            if quote is not None:
+                children.append(quote)
+            quote = nodes.block_quote('', *children)
+        document += quote
+    return document
+
+
+def measure(document: nodes.document, repeat: int) -> dict[str, float]:
+    """Return the minimal time per node (in µs) for every operation."""
+    count = sum(1 for _ in document.findall())
+    result = {}
+    for name, operation in OPERATIONS.items():
+        times = []
+        for _i in range(repeat):
+            start = time.perf_counter()
+            operation(document)
+            times.append(time.perf_counter() - start)
+        result[name] = min(times) / count * 1e6
+    return result
+
+
+def main(argv: list[str] | None = None) -> None:
+    argparser = argparse.ArgumentParser(
+        description='Measure the time per node of document tree '
+        'traversals for deeply nested documents.')
+    argparser.add_argument('-d', '--depth', type=int, action='append',
+                           dest='depths', metavar='<n>',
+                           help='Nesting depth (may be repeated). '
+                           'Default: 5, 20, 80.')
+    argparser.add_argument('-n', '--nodes', type=int, default=20000,
+                           metavar='<n>',
+                           help='Approximate number of nodes per document '
+                           '(default: 20000).')
+    argparser.add_argument('-r', '--repeat', type=int, default=3,
+                           metavar='<n>',
+                           help='Number of runs per operation (default: 3).')
+    argparser.add_argument('--synthetic', action='store_true',
+                           help='Build the trees directly instead of '
+                           'parsing reStructuredText.')
+    args = argparser.parse_args(argv)
+
+    print(f'{"depth":>6} {"nodes":>7}  '
+          + ' '.join(f'{name:>12}' for name in OPERATIONS)
+          + '  [µs/node]')
+    for depth in args.depths or (5, 20, 80):
+        if args.synthetic:
+            # 3 nodes per level: block_quote, paragraph, text
+            document = nested_tree(depth, max(args.nodes // (3*depth), 1))
+        else:
+            # about 3 nodes per level and construct
+            text = nested_rst(depth, max(args.nodes // (6*depth), 1))
+            try:
+                document = core.publish_doctree(text,
+                                                settings_overrides=SETTINGS)
+            except RecursionError:
+                print(f'{depth:>6} parser: maximum recursion depth exceeded '
+                      '(try --synthetic)', file=sys.stderr)
+                continue
+        count = sum(1 for _ in document.findall())
+        try:
+            result = measure(document, args.repeat)
+        except RecursionError:
+            print(f'{depth:>6} {count:>7}  maximum recursion depth exceeded')
+            continue
+        print(f'{depth:>6} {count:>7}  '
+              + ' '.join(f'{result[name]:12.3f}' for name in OPERATIONS))
+
+
+if __name__ == '__main__':
+    main()
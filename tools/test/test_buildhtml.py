@@ -93,6 +93,27 @@ class BuildHtmlTests(unittest.TestCase):
         self.assertEqual(len(dirs), 1)
         self.assertEqual(files, [])
 
+    def test_incremental(self) -> None:
+        state = self.root / 'build-state.json'
+        opts = ["--incremental", f"--build-state={state}", "--jobs=2",
+                "--report=5", str(self.root)]
+        cmd = [sys.executable, BUILDHTML_PATH] + opts
+        output = subprocess.run(cmd, stderr=subprocess.PIPE, text=True,
+                                encoding='utf-8').stderr
+        self.assertEqual(output.count('::: Processing:'), len(self.tree))
+        self.assertTrue(state.exists())
+        # no-op rebuild
+        output = subprocess.run(cmd, stderr=subprocess.PIPE, text=True,
+                                encoding='utf-8').stderr
+        self.assertEqual(output.count('::: Processing:'), 0)
+        self.assertEqual(output.count('::: Skipping (unchanged):'),
+                         len(self.tree))
+        # changed source
+        (self.root / self.tree[-1]).write_text('changed', encoding='utf-8')
+        output = subprocess.run(cmd, stderr=subprocess.PIPE, text=True,
+                                encoding='utf-8').stderr
+        self.assertEqual(output.count('::: Processing:'), 1)
+
 
 if __name__ == '__main__':
     unittest.main()